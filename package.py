@@ -6,7 +6,6 @@ req(
     "wish",
     "python",
     "pyside2",
-    "requests",
 )
 
 req(
@@ -22,6 +21,8 @@ env("LAUNCHER_PKGROOT_NAME").setenv("WISH_PACKAGE_ROOT")
 env("LAUNCHER_OFFLINE_NAME").setenv("WISH_OFFLINE_MODE")
 env("LAUNCHER_DEVELOP_NAME").setenv("WISH_DEVELOP_MODE")
 env("LAUNCHER_API_URL_NAME").setenv("WISH_RESTAPI_URL")
+# The "Test" environment talks to <LAUNCHER_API_URL_NAME>_TEST and falls back to the default API when it is unset.
+#env("WISH_RESTAPI_URL_TEST").setenv("http://wish-test:8000/graphql")
 env("LAUNCHER_SYS_SHELL_NAME").setenv("SHELL")
 #env("LAUNCHER_LDAP_SERVER").setenv("ldap://192.168.1.227")
 #env("LAUNCHER_LDAP_DOMAIN").setenv("DY3DANIMATION")
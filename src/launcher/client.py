@@ -1,275 +1,876 @@
-import os
-import requests
-import urllib.parse
-from requests.adapters import HTTPAdapter
-from .ldap import ldap_login
-
-
-class APIClient:
-    def __init__(self):
-        wish_graphs_url = os.environ.get("WISH_RESTAPI_URL")
-        parse = urllib.parse.urlparse(wish_graphs_url)
-        wish_net_url = "{}://{}".format(parse.scheme, parse.netloc)
-        self.base_url = wish_net_url.rstrip("/")
-        self.session = requests.Session()
-        adapter = HTTPAdapter(pool_connections=3, pool_maxsize=300, max_retries=3)
-        self.session.mount("http://", adapter)
-        self.session.mount("https://", adapter)
-
-    def _handle_token(self, value):
-        if value:
-            self.session.headers.update({"Authorization": f"Bearer {value}"})
-        else:
-            self.session.headers.pop("Authorization", None)
-
-    def _handle_status(self, response, raw=False):
-        if response.status_code == 401:
-            raise Exception("Authentication failed")
-        elif response.status_code == 403:
-            raise Exception("Permission denied")
-        elif response.status_code >= 400:
-            if not raw:
-                data = response.json()
-                raise Exception(data.get("error", "Unknown error"))
-            raise Exception("Failed to get resource")
-
-        return response.content if raw else response.json()
-
-    def _sorted_launchers(self, launchers):
-        if not isinstance(launchers, dict):
-            return launchers
-
-        def launcher_id_key(info: dict):
-            lid = info.get("id", None)
-            try:
-                return (0, int(lid))
-            except Exception:
-                return (1, str(lid) if lid is not None else "")
-
-        sorted_items = sorted(launchers.items(), key=lambda item: launcher_id_key(item[1] or {}))
-        launchers = {k: v for k, v in sorted_items}
-        return launchers
-
-    def _sorted_projects(self, projects):
-        def safe_int_id(p):
-            try:
-                pid = p.get("id") if isinstance(p, dict) else p
-                if pid is None:
-                    return float("inf")
-                return int(pid)
-            except Exception:
-                return float("inf")
-
-        if isinstance(projects, list):
-            return sorted(projects, key=lambda p: safe_int_id(p))
-        if isinstance(projects, dict):
-            try:
-                pid = projects.get("id")
-                return int(pid) if pid is not None else float("inf")
-            except Exception:
-                return float("inf")
-        return projects
-
-    def _sorted_tasks(self, tasks):
-        def safe_int(v):
-            try:
-                return int(v)
-            except Exception:
-                return float("inf")
-
-        def sort_list(lst):
-            lst.sort(key=lambda t: safe_int(t.get("id")))
-            for t in lst:
-                children = t.get("children") or []
-                if isinstance(children, list) and children:
-                    sort_list(children)
-
-        if isinstance(tasks, list):
-            sort_list(tasks)
-        return tasks
-
-    def login(self, username, password):
-        ldap_authenticator = ldap_login(username, password)
-        if ldap_authenticator:
-            self.create_or_update_ldap_user(username, password, ldap_authenticator)
-        url = f"{self.base_url}/auth/login"
-        payload = {"username": username, "password": password}
-        response = self.session.post(url=url, json=payload, timeout=3)
-        response = self._handle_status(response)
-        if "token" in response:
-            self._handle_token(response["token"])
-        return response
-
-    def create_or_update_ldap_user(self, username, password, ldap_authenticator):
-        url = f"{self.base_url}/users/sync"
-        payload = {
-            "username": username,
-            "fullName": ldap_authenticator.fullName,
-            "email": ldap_authenticator.mail,
-            "password": password,
-        }
-        response = self.session.post(url=url, json=payload, timeout=3)
-        response = self._handle_status(response)
-        return response
-
-    def get_users(self):
-        response = self.session.get(f"{self.base_url}/users")
-        return self._handle_status(response)
-
-    def get_launchers(self, path):
-        params = {"path": path}
-        response = self.session.get(f"{self.base_url}/launchers", params=params)
-        launchers = self._handle_status(response)
-        launchers = self._sorted_launchers(launchers)
-        return launchers
-
-    def get_projects(self):
-        response = self.session.get(f"{self.base_url}/projects")
-        projects = self._handle_status(response)
-        projects = self._sorted_projects(projects)
-        return projects
-
-    def get_tasks(self, project_id):
-        response = self.session.get(f"{self.base_url}/projects/{project_id}/tasks")
-        tasks = self._handle_status(response)
-        task_dict = {}
-        for task in tasks:
-            task_dict[task["id"]] = {
-                "id": task["id"],
-                "title": task["title"],
-                "parent_id": task.get("parent_id"),
-                "children": [],
-            }
-
-        tasks = list()
-        for _, task in task_dict.items():
-            if not task["parent_id"]:
-                tasks.append(task)
-            else:
-                parent = task_dict.get(task["parent_id"])
-                if parent:
-                    parent["children"].append(task)
-        tasks = self._sorted_tasks(tasks)
-        return tasks
-
-    def get_members(self, project_id, task_id):
-        if task_id is None:
-            response = self.session.get(f"{self.base_url}/projects/{project_id}/members")
-        else:
-            response = self.session.get(f"{self.base_url}/projects/{project_id}/tasks/{task_id}/members")
-        return self._handle_status(response)
-
-    def get_resource(self, resource_id):
-        response = self.session.get(f"{self.base_url}/resources/{resource_id}")
-        if response.status_code == 200:
-            return {
-                "data": response.content,
-                "format": response.headers.get("X-Resource-Format", "PNG"),
-            }
-        return None
-
-    def create_project(self, name):
-        response = self.session.post(f"{self.base_url}/projects", json={"name": name})
-        return self._handle_status(response)
-
-    def update_project(self, project_id, project_name):
-        payload = {"name": project_name}
-        response = self.session.put(f"{self.base_url}/projects/{project_id}", json=payload)
-        return self._handle_status(response)
-
-    def delete_project(self, project_id):
-        response = self.session.delete(f"{self.base_url}/projects/{project_id}")
-        return self._handle_status(response)
-
-    def create_task(self, title, project_id, parent_id):
-        payload = {
-            "title": title,
-            "description": "",
-            "priority": 1,
-            "parent_id": parent_id,
-        }
-        response = self.session.post(f"{self.base_url}/projects/{project_id}/tasks", json=payload)
-        return self._handle_status(response)
-
-    def update_task(self, project_id, task_id, task_name):
-        payload = {"title": task_name}
-        response = self.session.put(f"{self.base_url}/projects/{project_id}/tasks/{task_id}", json=payload)
-        return self._handle_status(response)
-
-    def delete_task(self, project_id, task_id):
-        response = self.session.delete(f"{self.base_url}/projects/{project_id}/tasks/{task_id}")
-        return self._handle_status(response)
-
-    def update_project_members(self, project_id, user_ids):
-        payload = {"user_ids": user_ids}
-        response = self.session.put(f"{self.base_url}/projects/{project_id}/members/batch", json=payload)
-        return self._handle_status(response)
-
-    def update_task_members(self, project_id, task_id, user_ids):
-        payload = {"user_ids": user_ids}
-        response = self.session.put(
-            f"{self.base_url}/projects/{project_id}/tasks/{task_id}/members/batch",
-            json=payload,
-        )
-        return self._handle_status(response)
-
-    def create_user(self, username, password, email, role):
-        response = self.session.post(
-            f"{self.base_url}/users",
-            json={
-                "username": username,
-                "password": password,
-                "email": email,
-                "role": role,
-            },
-        )
-        return self._handle_status(response)
-
-    def update_user(self, user_id, username, password, email, role):
-        data = {"username": username, "password": password, "email": email, "role": role}
-        data = {k: v for k, v in data.items() if v is not None}
-        response = self.session.put(f"{self.base_url}/users/{user_id}", json=data)
-        return self._handle_status(response)
-
-    def delete_user(self, user_id):
-        response = self.session.delete(f"{self.base_url}/users/{user_id}")
-        return self._handle_status(response)
-
-    def upload_resource(self, file_path, resource_type):
-        with open(file_path, "rb") as f:
-            files = {"file": f}
-            data = {"type": resource_type}
-            response = self.session.post(f"{self.base_url}/resources/upload", files=files, data=data)
-            return self._handle_status(response)
-
-    def create_launcher(self, name, path, vdata):
-        processed_vdata = {}
-        for version, data in vdata.items():
-            version_data = data.copy()
-            processed_vdata[version] = version_data
-        payload = {"name": name, "path": path, "vdata": processed_vdata}
-        response = self.session.post(f"{self.base_url}/launchers", json=payload)
-        return self._handle_status(response)
-
-    def update_launcher(self, launcher_id, name, path, vdata):
-        processed_vdata = {}
-        for version, data in vdata.items():
-            version_data = data.copy()
-            processed_vdata[version] = version_data
-
-        payload = {"name": name, "path": path, "vdata": processed_vdata}
-        response = self.session.put(f"{self.base_url}/launchers/{launcher_id}", json=payload)
-        result = self._handle_status(response)
-        if result:
-            result["vdata"] = result.pop("versions", {})
-        return result
-
-    def delete_launcher(self, launcher_id, path):
-        params = {"path": path}
-        response = self.session.delete(f"{self.base_url}/launchers/{launcher_id}", params=params)
-        return self._handle_status(response)
-
-    def toggle_launcher(self, launcher_id, path, action):
-        params = {"path": path, "action": action}
-        response = self.session.post(f"{self.base_url}/launchers/{launcher_id}/toggle", params=params)
-        return self._handle_status(response)
+import os
+import json
+import time
+import base64
+import hashlib
+import random
+import weakref
+import requests
+import threading
+import contextlib
+import collections
+import email.utils
+import urllib.parse
+from urllib3.util import Retry
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from .ldap import ldap_login
+from .codec import (
+    MSGPACK_TYPE,
+    msgpack,
+    is_msgpack,
+    iter_array,
+    iter_events,
+    iter_object,
+    msgpack_loads,
+    iter_multipart,
+    multipart_boundary,
+)
+from .records import Page, Context, TaskTree, ChangeSet, Membership, decode_users, decode_projects, decode_launchers
+
+
+CHUNK_SIZE = 64 * 1024
+
+
+@contextlib.contextmanager
+def network_errors():
+    try:
+        yield
+    except requests.exceptions.Timeout as e:
+        raise TimeoutError(str(e)) from e
+    except (requests.exceptions.ConnectionError, requests.exceptions.ChunkedEncodingError) as e:
+        raise ConnectionError(str(e)) from e
+
+
+def iter_chunks(response, chunk_size=CHUNK_SIZE):
+    with network_errors():
+        yield from response.iter_content(chunk_size)
+
+
+class SessionHeaders(CaseInsensitiveDict):
+    def __init__(self, data=None, **kwargs):
+        self._lock = threading.RLock()
+        super().__init__(data, **kwargs)
+
+    def __setitem__(self, key, value):
+        with self._lock:
+            super().__setitem__(key, value)
+
+    def __delitem__(self, key):
+        with self._lock:
+            super().__delitem__(key)
+
+    def copy(self):
+        with self._lock:
+            return CaseInsensitiveDict(self._store.values())
+
+
+class ThreadSession(object):
+    def __init__(self, pool_maxsize=4, max_retries=3):
+        self.headers = SessionHeaders(requests.utils.default_headers())
+        self.pool_maxsize = pool_maxsize
+        self.max_retries = max_retries
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._sessions = weakref.WeakSet()
+
+    @property
+    def session(self):
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            retries = Retry(total=self.max_retries, read=False, redirect=False, respect_retry_after_header=False)
+            adapter = HTTPAdapter(pool_connections=3, pool_maxsize=self.pool_maxsize, max_retries=retries)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            self._local.session = session
+            with self._lock:
+                self._sessions.add(session)
+        return session
+
+    def get(self, url, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def request(self, method, url, **kwargs):
+        session = self.session
+        session.headers = self.headers.copy()
+        with network_errors():
+            return session.request(method, url, **kwargs)
+
+    def close(self):
+        with self._lock:
+            sessions = list(self._sessions)
+        for session in sessions:
+            session.close()
+
+
+class CircuitBreaker(object):
+    FAILURE_THRESHOLD = 3
+    RECOVERY_THRESHOLD = 2
+    MIN_BACKOFF = 3
+    MAX_BACKOFF = 60
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.online = True
+        self._failures = 0
+        self._successes = 0
+        self._backoff = 0
+        self._next_probe = 0.0
+
+    @property
+    def probe_due(self):
+        return not self.online and time.monotonic() >= self._next_probe
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            if self.online:
+                return
+            self._successes += 1
+            if self._successes >= self.RECOVERY_THRESHOLD:
+                self.online = True
+                self._successes = 0
+                self._backoff = 0
+            else:
+                self._next_probe = time.monotonic()
+
+    def record_failure(self):
+        with self._lock:
+            self._successes = 0
+            if self.online:
+                self._failures += 1
+                if self._failures < self.FAILURE_THRESHOLD:
+                    return
+                self.online = False
+                self._failures = 0
+            self._backoff = min(max(self._backoff * 2, self.MIN_BACKOFF), self.MAX_BACKOFF)
+            self._next_probe = time.monotonic() + self._backoff * random.uniform(0.8, 1.2)
+
+
+class RateLimited(ConnectionError):
+    def __init__(self, retry_after):
+        super().__init__(f"Rate limited, retry in {retry_after:.2f}s")
+        self.retry_after = retry_after
+
+
+class TokenBucket(object):
+    def __init__(self, rate, capacity):
+        self._lock = threading.Lock()
+        self.rate = float(rate)
+        self.capacity = float(capacity)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._hold_until = 0.0
+
+    def defer(self, seconds):
+        with self._lock:
+            self._hold_until = max(self._hold_until, time.monotonic() + seconds)
+
+    def acquire(self, deadline=None):
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            wait = max(0.0, (1 - self._tokens) / self.rate, self._hold_until - now)
+            if wait <= 0:
+                self._tokens -= 1
+                return
+        if deadline is not None and now + wait > deadline:
+            raise TimeoutError("Rate limit exceeds deadline")
+        raise RateLimited(wait)
+
+    def refund(self):
+        with self._lock:
+            self._tokens = min(self.capacity, self._tokens + 1)
+
+
+def parse_retry_after(value):
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, email.utils.parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+CONTEXT_QUERY = """
+query Context($projectId: ID!, $taskId: ID, $path: String, $withTasks: Boolean!) {
+  tasks(projectId: $projectId) @include(if: $withTasks) { id title parent_id }
+  context(projectId: $projectId, taskId: $taskId, path: $path) {
+    path
+    launchers { id name vdata relations }
+    resources { id format data }
+  }
+}
+"""
+
+
+class EventStream(object):
+    def __init__(self, response):
+        self.response = response
+
+    def __iter__(self):
+        for event in iter_events(iter_chunks(self.response, None)):
+            try:
+                event["data"] = json.loads(event["data"])
+            except ValueError:
+                pass
+            yield event
+
+    def close(self):
+        self.response.close()
+
+
+class APIClient:
+    CONNECT_TIMEOUT = 3
+    READ_TIMEOUT = 30
+    UPLOAD_CHUNK_SIZE = 1024 * 1024
+    UPLOAD_RETRIES = 3
+    EVENT_TIMEOUT = 90
+    PAGE_SIZE = 200
+    RATE_LIMIT = 10
+    RATE_BURST = 20
+    MAX_RETRY_AFTER = 10
+    MAX_VALIDATORS = 256
+    ADVICE_TTL = 300
+    LIMITED_METHODS = ("GET", "HEAD")
+
+    def __init__(self, url=None):
+        wish_graphs_url = url or os.environ.get("WISH_RESTAPI_URL")
+        parse = urllib.parse.urlparse(wish_graphs_url)
+        wish_net_url = "{}://{}".format(parse.scheme, parse.netloc)
+        self.base_url = wish_net_url.rstrip("/")
+        self.graphs_url = wish_graphs_url
+        self._graphs_supported = bool(parse.path.strip("/"))
+        self.session = ThreadSession(pool_maxsize=4, max_retries=3)
+        wire_format = os.environ.get("LAUNCHER_WIRE_FORMAT") or ("msgpack" if msgpack is not None else "json")
+        if wire_format == "msgpack":
+            self.session.headers["Accept"] = f"{MSGPACK_TYPE}, application/json;q=0.9, */*;q=0.1"
+        self._validators = collections.OrderedDict()
+        self._validators_lock = threading.Lock()
+        self.cache_model = None
+        self._uploads = dict()
+        self._local = threading.local()
+        self.breaker = CircuitBreaker()
+        self.limiter = TokenBucket(self.RATE_LIMIT, self.RATE_BURST)
+        self._poll_advice = (None, 0.0)
+
+    @property
+    def poll_interval(self):
+        interval, expires_at = self._poll_advice
+        return interval if time.monotonic() < expires_at else None
+
+    @property
+    def deadline(self):
+        return getattr(self._local, "deadline", None)
+
+    @deadline.setter
+    def deadline(self, value):
+        self._local.deadline = value
+
+    def _timeout(self, limit=None):
+        connect, read = self.CONNECT_TIMEOUT, limit or self.READ_TIMEOUT
+        if self.deadline is not None:
+            remaining = self.deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError("Deadline exceeded")
+            connect, read = min(connect, remaining), min(read, remaining)
+        return connect, read
+
+    def _request(self, method, url, timeout=None, **kwargs):
+        if not self.breaker.online:
+            raise ConnectionError("Client is offline")
+        limited = method in self.LIMITED_METHODS
+        if limited:
+            self.limiter.acquire(self.deadline)
+        try:
+            request_timeout = self._timeout(timeout)
+        except TimeoutError:
+            if limited:
+                self.limiter.refund()
+            raise
+        try:
+            response = self.session.request(method, url, timeout=request_timeout, **kwargs)
+        except ConnectionError:
+            self.breaker.record_failure()
+            raise
+        except TimeoutError:
+            if self.deadline is None or time.monotonic() < self.deadline:
+                self.breaker.record_failure()
+            raise
+        retry_after = self._read_advice(response)
+        if response.status_code in (502, 503, 504):
+            self.breaker.record_failure()
+        elif response.status_code != 429:
+            self.breaker.record_success()
+        if (
+            retry_after is not None
+            and retry_after <= self.MAX_RETRY_AFTER
+            and method in ("GET", "HEAD")
+            and response.status_code in (429, 503)
+        ):
+            response.close()
+            raise RateLimited(retry_after)
+        return response
+
+    def _read_advice(self, response):
+        advice = response.headers.get("X-Poll-Interval")
+        if advice is not None:
+            try:
+                self._poll_advice = (max(0.0, float(advice)), time.monotonic() + self.ADVICE_TTL)
+            except ValueError:
+                pass
+        if response.status_code not in (429, 503):
+            return None
+        retry_after = parse_retry_after(response.headers.get("Retry-After"))
+        if retry_after is not None:
+            self.limiter.defer(retry_after)
+        return retry_after
+
+    def probe(self):
+        if self.breaker.probe_due:
+            timeout = (self.CONNECT_TIMEOUT, self.CONNECT_TIMEOUT)
+            try:
+                response = self.session.get(f"{self.base_url}/ping", timeout=timeout)
+                if response.status_code in (200, 204):
+                    self.breaker.record_success()
+                else:
+                    self.breaker.record_failure()
+            except Exception:
+                self.breaker.record_failure()
+        return self.breaker.online
+
+    def _handle_token(self, value):
+        if value:
+            self.session.headers.update({"Authorization": f"Bearer {value}"})
+        else:
+            self.session.headers.pop("Authorization", None)
+
+    def _check_status(self, response, raw=False):
+        if response.status_code == 401:
+            raise Exception("Authentication failed")
+        elif response.status_code == 403:
+            raise Exception("Permission denied")
+        elif response.status_code == 429:
+            raise Exception("Too many requests")
+        elif response.status_code >= 400:
+            if not raw:
+                data = self._decode_body(response)
+                raise Exception(data.get("error", "Unknown error"))
+            raise Exception("Failed to get resource")
+
+    def _decode_body(self, response):
+        if is_msgpack(response.headers.get("Content-Type")):
+            return msgpack_loads(response.content)
+        return response.json()
+
+    def _handle_status(self, response, raw=False):
+        self._check_status(response, raw)
+        return response.content if raw else self._decode_body(response)
+
+    def _load_validator(self, key):
+        if self.cache_model is None:
+            return None
+        cache_key = repr(key)
+        with self._validators_lock:
+            if cache_key in self._validators:
+                self._validators.move_to_end(cache_key)
+                return self._validators[cache_key]
+        validator = self.cache_model.load("validator", key)
+        self._remember_validator(cache_key, tuple(validator) if validator else None)
+        return validator
+
+    def _remember_validator(self, cache_key, validator):
+        with self._validators_lock:
+            self._validators[cache_key] = validator
+            self._validators.move_to_end(cache_key)
+            while len(self._validators) > self.MAX_VALIDATORS:
+                self._validators.popitem(last=False)
+
+    def _dump_validator(self, key, etag, modified, result):
+        if self.cache_model is None:
+            return
+        if etag or modified:
+            self.cache_model.dump("validated", result, key)
+            self.cache_model.dump("validator", [etag, modified], key)
+            self._remember_validator(repr(key), (etag, modified))
+        elif self._load_validator(key):
+            self.cache_model.dump("validator", None, key)
+            self._remember_validator(repr(key), None)
+
+    def _conditional_get(self, url, params=None, raw=False, decode=None, iterate=None):
+        key = [url, sorted((params or {}).items())]
+        headers = dict()
+        validator = self._load_validator(key)
+        if validator:
+            etag, modified = validator
+            if etag:
+                headers["If-None-Match"] = etag
+            if modified:
+                headers["If-Modified-Since"] = modified
+        response = self._request("GET", url, params=params, headers=headers, stream=iterate is not None)
+        if response.status_code == 304 and validator:
+            response.close()
+            result = self.cache_model.load("validated", key)
+            if result is not None:
+                return result
+            self._dump_validator(key, None, None, None)
+            return self._conditional_get(url, params, raw, decode, iterate)
+        if raw and response.status_code != 200:
+            response.close()
+            return None
+        if raw:
+            result = response
+        elif iterate is not None:
+            self._check_status(response)
+            if is_msgpack(response.headers.get("Content-Type")):
+                result = msgpack_loads(b"".join(iter_chunks(response)))
+                result = result.items() if isinstance(result, dict) else result
+            else:
+                result = iterate(iter_chunks(response))
+        else:
+            result = self._handle_status(response)
+        if decode:
+            result = decode(result)
+        self._dump_validator(key, response.headers.get("ETag"), response.headers.get("Last-Modified"), result)
+        return result
+
+    def login(self, username, password):
+        ldap_authenticator = ldap_login(username, password)
+        if ldap_authenticator:
+            self.create_or_update_ldap_user(username, password, ldap_authenticator)
+        url = f"{self.base_url}/auth/login"
+        payload = {"username": username, "password": password}
+        response = self._request("POST", url, json=payload, timeout=3)
+        response = self._handle_status(response)
+        if "token" in response:
+            self._handle_token(response["token"])
+        return response
+
+    def refresh_token(self):
+        response = self._request("POST", f"{self.base_url}/auth/refresh", timeout=3)
+        if response.status_code in (404, 405, 501):
+            return None
+        response = self._handle_status(response)
+        if "token" in response:
+            self._handle_token(response["token"])
+        return response
+
+    def create_or_update_ldap_user(self, username, password, ldap_authenticator):
+        url = f"{self.base_url}/users/sync"
+        payload = {
+            "username": username,
+            "fullName": ldap_authenticator.fullName,
+            "email": ldap_authenticator.mail,
+            "password": password,
+        }
+        response = self._request("POST", url, json=payload, timeout=3)
+        response = self._handle_status(response)
+        return response
+
+    def get_users(self):
+        url = f"{self.base_url}/users"
+        return self._conditional_get(url, iterate=iter_array, decode=decode_users)
+
+    def _get_page(self, url, params, cursor, limit, decode):
+        params = dict(params or {}, limit=limit or self.PAGE_SIZE, cursor=cursor)
+        data = self._handle_status(self._request("GET", url, params=params))
+        if isinstance(data, dict) and "items" in data:
+            return Page(decode(data["items"]), data.get("next"))
+        return Page(decode(data), None)
+
+    def _iter_pages(self, get_page, *args):
+        cursor = None
+        while True:
+            page = get_page(*args, cursor=cursor)
+            yield from page
+            cursor = page.next_cursor
+            if not cursor:
+                return
+
+    def get_users_page(self, cursor=None, limit=None):
+        return self._get_page(f"{self.base_url}/users", None, cursor, limit, decode_users)
+
+    def iter_users(self):
+        return self._iter_pages(self.get_users_page)
+
+    def get_projects_page(self, cursor=None, limit=None):
+        return self._get_page(f"{self.base_url}/projects", None, cursor, limit, decode_projects)
+
+    def iter_projects(self):
+        return self._iter_pages(self.get_projects_page)
+
+    def get_launchers_page(self, path, cursor=None, limit=None):
+        def decode(data):
+            pairs = data.items() if isinstance(data, dict) else ((item.get("name"), item) for item in data)
+            return decode_launchers(pairs).values()
+
+        return self._get_page(f"{self.base_url}/launchers", {"path": path}, cursor, limit, decode)
+
+    def iter_launchers(self, path):
+        return self._iter_pages(self.get_launchers_page, path)
+
+    def get_launchers(self, path):
+        params = {"path": path}
+        url = f"{self.base_url}/launchers"
+        return self._conditional_get(
+            url,
+            params=params,
+            iterate=iter_object,
+            decode=decode_launchers,
+        )
+
+    def get_projects(self):
+        url = f"{self.base_url}/projects"
+        return self._conditional_get(url, iterate=iter_array, decode=decode_projects)
+
+    def get_tasks(self, project_id):
+        url = f"{self.base_url}/projects/{project_id}/tasks"
+        return self._conditional_get(url, iterate=iter_array, decode=lambda tasks: TaskTree(project_id, tasks))
+
+    def get_members(self, project_id, task_id):
+        if task_id is None:
+            url = f"{self.base_url}/projects/{project_id}/members"
+        else:
+            url = f"{self.base_url}/projects/{project_id}/tasks/{task_id}/members"
+        return self._conditional_get(url, iterate=iter_array, decode=decode_users)
+
+    def get_membership(self, project_id):
+        response = self._request("GET", f"{self.base_url}/projects/{project_id}/members/matrix")
+        if response.status_code in (404, 405, 501):
+            return None
+        return Membership.from_dict(project_id, self._handle_status(response))
+
+    def get_context(self, project_id, task_id=None, path=None, with_tasks=True):
+        if self._graphs_supported:
+            context = self._query_context(project_id, task_id, path, with_tasks)
+            if context is not None:
+                return context
+            self._graphs_supported = False
+        tasks = self.get_tasks(project_id) if with_tasks or not path else None
+        path = path or tasks.path(task_id)
+        context = Context(project_id, path, tasks if with_tasks else None, self.get_launchers(path))
+        context.resources = self.get_resources(context.resource_ids)
+        return context
+
+    def _query_context(self, project_id, task_id, path, with_tasks):
+        variables = {"projectId": project_id, "taskId": task_id, "path": path, "withTasks": with_tasks}
+        response = self._request("POST", self.graphs_url, json={"query": CONTEXT_QUERY, "variables": variables})
+        if response.status_code in (400, 404, 405, 501):
+            response.close()
+            return None
+        result = self._handle_status(response)
+        if not isinstance(result, dict) or (result.get("errors") and not result.get("data")):
+            return None
+        return self._build_context(project_id, result)
+
+    def _build_context(self, project_id, result):
+        data = result.get("data") or {}
+        context = data.get("context") or {}
+        tasks = None
+        if data.get("tasks") is not None:
+            tasks = TaskTree(project_id, data["tasks"])
+        launchers = decode_launchers((item.get("name"), item) for item in context.get("launchers") or ())
+        resources = dict()
+        for item in context.get("resources") or ():
+            resources[int(item["id"])] = {
+                "data": base64.b64decode(item.get("data") or ""),
+                "format": item.get("format", "PNG"),
+            }
+        return Context(project_id, context.get("path") or str(project_id), tasks, launchers, resources)
+
+    def get_changes(self, scope, since=None):
+        params = {"scope": scope, "since": since}
+        response = self._request("GET", f"{self.base_url}/changes", params=params)
+        if response.status_code in (404, 405, 501):
+            return None
+        return ChangeSet.from_dict(self._handle_status(response))
+
+    def subscribe(self, path, since=None):
+        headers = {"Accept": "text/event-stream"}
+        if since:
+            headers["Last-Event-ID"] = since
+        url = f"{self.base_url}/events"
+        response = self._request(
+            "GET",
+            url,
+            params={"path": path},
+            headers=headers,
+            stream=True,
+            timeout=self.EVENT_TIMEOUT,
+        )
+        if response.status_code in (404, 405, 501):
+            response.close()
+            return None
+        self._check_status(response, raw=True)
+        return EventStream(response)
+
+    def get_resource(self, resource_id):
+        url = f"{self.base_url}/resources/{resource_id}"
+        return self._conditional_get(url, raw=True, decode=self._build_resource)
+
+    def get_resources(self, resource_ids):
+        resource_ids = sorted(set(resource_ids))
+        if not resource_ids:
+            return dict()
+        url = f"{self.base_url}/resources/batch"
+        params = {"ids": ",".join(str(resource_id) for resource_id in resource_ids)}
+        headers = {"Accept": "multipart/mixed"}
+        response = self._request("GET", url, params=params, headers=headers, stream=True)
+        boundary = multipart_boundary(response.headers.get("Content-Type"))
+        if response.status_code in (404, 405, 501) or (response.status_code == 200 and not boundary):
+            response.close()
+            return {resource_id: self.get_resource(resource_id) for resource_id in resource_ids}
+        self._check_status(response, raw=True)
+        resources = dict()
+        chunks = iter_chunks(response)
+        try:
+            for headers, data in iter_multipart(chunks, boundary):
+                resource_id = headers.get("x-resource-id") or headers.get("content-id", "").strip("<>")
+                if not resource_id.isdigit():
+                    continue
+                resources[int(resource_id)] = {
+                    "data": data,
+                    "format": headers.get("x-resource-format", "PNG"),
+                }
+        finally:
+            chunks.close()
+            response.close()
+        return resources
+
+    def _build_resource(self, response):
+        return {
+            "data": response.content,
+            "format": response.headers.get("X-Resource-Format", "PNG"),
+        }
+
+    def create_project(self, name):
+        response = self._request("POST", f"{self.base_url}/projects", json={"name": name})
+        return self._handle_status(response)
+
+    def update_project(self, project_id, project_name):
+        payload = {"name": project_name}
+        response = self._request("PUT", f"{self.base_url}/projects/{project_id}", json=payload)
+        return self._handle_status(response)
+
+    def delete_project(self, project_id):
+        response = self._request("DELETE", f"{self.base_url}/projects/{project_id}")
+        return self._handle_status(response)
+
+    def create_task(self, title, project_id, parent_id):
+        payload = {
+            "title": title,
+            "description": "",
+            "priority": 1,
+            "parent_id": parent_id,
+        }
+        response = self._request("POST", f"{self.base_url}/projects/{project_id}/tasks", json=payload)
+        return self._handle_status(response)
+
+    def update_task(self, project_id, task_id, task_name):
+        payload = {"title": task_name}
+        response = self._request("PUT", f"{self.base_url}/projects/{project_id}/tasks/{task_id}", json=payload)
+        return self._handle_status(response)
+
+    def delete_task(self, project_id, task_id):
+        response = self._request("DELETE", f"{self.base_url}/projects/{project_id}/tasks/{task_id}")
+        return self._handle_status(response)
+
+    def update_project_members(self, project_id, user_ids):
+        payload = {"user_ids": user_ids}
+        response = self._request("PUT", f"{self.base_url}/projects/{project_id}/members/batch", json=payload)
+        return self._handle_status(response)
+
+    def patch_project_members(self, project_id, add_ids, remove_ids):
+        payload = {"add": list(add_ids), "remove": list(remove_ids)}
+        response = self._request("PATCH", f"{self.base_url}/projects/{project_id}/members", json=payload)
+        if response.status_code in (405, 501):
+            return None
+        return self._handle_status(response)
+
+    def patch_task_members(self, project_id, task_id, add_ids, remove_ids):
+        payload = {"add": list(add_ids), "remove": list(remove_ids)}
+        response = self._request(
+            "PATCH",
+            f"{self.base_url}/projects/{project_id}/tasks/{task_id}/members",
+            json=payload,
+        )
+        if response.status_code in (405, 501):
+            return None
+        return self._handle_status(response)
+
+    def update_task_members(self, project_id, task_id, user_ids):
+        payload = {"user_ids": user_ids}
+        response = self._request(
+            "PUT",
+            f"{self.base_url}/projects/{project_id}/tasks/{task_id}/members/batch",
+            json=payload,
+        )
+        return self._handle_status(response)
+
+    def create_user(self, username, password, email, role):
+        response = self._request(
+            "POST",
+            f"{self.base_url}/users",
+            json={
+                "username": username,
+                "password": password,
+                "email": email,
+                "role": role,
+            },
+        )
+        return self._handle_status(response)
+
+    def update_user(self, user_id, username, password, email, role):
+        data = {"username": username, "password": password, "email": email, "role": role}
+        data = {k: v for k, v in data.items() if v is not None}
+        response = self._request("PUT", f"{self.base_url}/users/{user_id}", json=data)
+        return self._handle_status(response)
+
+    def delete_user(self, user_id):
+        response = self._request("DELETE", f"{self.base_url}/users/{user_id}")
+        return self._handle_status(response)
+
+    def upload_resource(self, file_path, resource_type):
+        digest = self._hash_file(file_path)
+        response = self._request("GET", f"{self.base_url}/resources/hash/{digest}")
+        if response.status_code not in (404, 405, 501):
+            result = self._handle_status(response)
+            if result and result.get("url"):
+                return result
+            result = self._upload_chunks(file_path, digest, resource_type)
+            if result is not None:
+                return result
+        return self._upload_file(file_path, resource_type)
+
+    def _hash_file(self, file_path):
+        digest = hashlib.sha256()
+        with open(file_path, "rb") as f:
+            for chunk in iter(lambda: f.read(self.UPLOAD_CHUNK_SIZE), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def _upload_file(self, file_path, resource_type):
+        with open(file_path, "rb") as f:
+            files = {"file": f}
+            data = {"type": resource_type}
+            response = self._request("POST", f"{self.base_url}/resources/upload", files=files, data=data)
+            return self._handle_status(response)
+
+    def _load_upload(self, digest):
+        upload = self._uploads.get(digest)
+        if upload is None and self.cache_model is not None:
+            upload = self.cache_model.load("upload", (digest,))
+        return upload
+
+    def _save_upload(self, digest, upload_id, offset=0):
+        upload = None if upload_id is None else {"id": upload_id, "offset": offset}
+        if upload is None:
+            self._uploads.pop(digest, None)
+        else:
+            self._uploads[digest] = upload
+        if self.cache_model is not None:
+            self.cache_model.dump("upload", upload, (digest,))
+
+    def _upload_offset(self, upload):
+        response = self._request("GET", f"{self.base_url}/resources/uploads/{upload['id']}")
+        if response.status_code == 404:
+            return None
+        if response.status_code in (405, 501):
+            return upload["offset"]
+        return self._handle_status(response).get("offset", 0)
+
+    def _start_upload(self, file_path, digest, resource_type):
+        upload = self._load_upload(digest)
+        if upload is not None:
+            offset = self._upload_offset(upload)
+            if offset is not None:
+                return upload["id"], offset
+        payload = {
+            "sha256": digest,
+            "size": os.path.getsize(file_path),
+            "type": resource_type,
+            "filename": os.path.basename(file_path),
+        }
+        response = self._request("POST", f"{self.base_url}/resources/uploads", json=payload)
+        if response.status_code in (404, 405, 501):
+            return None, None
+        result = self._handle_status(response)
+        self._save_upload(digest, result["id"], result.get("offset", 0))
+        return result["id"], result.get("offset", 0)
+
+    def _upload_chunks(self, file_path, digest, resource_type):
+        size = os.path.getsize(file_path)
+        if not size:
+            return None
+        upload_id, offset = self._start_upload(file_path, digest, resource_type)
+        if upload_id is None:
+            return None
+        retries = self.UPLOAD_RETRIES
+        with open(file_path, "rb") as f:
+            while True:
+                f.seek(offset)
+                chunk = f.read(self.UPLOAD_CHUNK_SIZE)
+                headers = {
+                    "Content-Type": "application/octet-stream",
+                    "Content-Range": f"bytes {offset}-{offset + len(chunk) - 1}/{size}",
+                }
+                try:
+                    url = f"{self.base_url}/resources/uploads/{upload_id}"
+                    response = self._request("PUT", url, data=chunk, headers=headers)
+                    result = self._handle_status(response)
+                except RateLimited:
+                    raise
+                except (ConnectionError, TimeoutError):
+                    retries -= 1
+                    if retries < 0 or not self.breaker.online:
+                        raise
+                    upload_id, offset = self._start_upload(file_path, digest, resource_type)
+                    if upload_id is None:
+                        return None
+                    continue
+                if result.get("url"):
+                    self._save_upload(digest, None)
+                    return result
+                offset = result.get("offset", offset + len(chunk))
+                self._save_upload(digest, upload_id, offset)
+
+    def create_launcher(self, name, path, vdata):
+        payload = {"name": name, "path": path, "vdata": vdata}
+        response = self._request("POST", f"{self.base_url}/launchers", json=payload)
+        return self._handle_status(response)
+
+    def update_launcher(self, launcher_id, name, path, vdata):
+        payload = {"name": name, "path": path, "vdata": vdata}
+        response = self._request("PUT", f"{self.base_url}/launchers/{launcher_id}", json=payload)
+        result = self._handle_status(response)
+        if result:
+            result["vdata"] = result.pop("versions", {})
+        return result
+
+    def patch_launcher(self, launcher_id, path, operations, name=None):
+        payload = {"path": path, "operations": operations}
+        if name is not None:
+            payload["name"] = name
+        response = self._request("PATCH", f"{self.base_url}/launchers/{launcher_id}", json=payload)
+        if response.status_code in (405, 501):
+            return None
+        result = self._handle_status(response)
+        if result:
+            result["vdata"] = result.pop("versions", {})
+        return result
+
+    def delete_launcher(self, launcher_id, path):
+        params = {"path": path}
+        response = self._request("DELETE", f"{self.base_url}/launchers/{launcher_id}", params=params)
+        return self._handle_status(response)
+
+    def toggle_launcher(self, launcher_id, path, action):
+        params = {"path": path, "action": action}
+        response = self._request("POST", f"{self.base_url}/launchers/{launcher_id}/toggle", params=params)
+        return self._handle_status(response)
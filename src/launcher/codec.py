@@ -0,0 +1,360 @@
+import json
+import codecs
+import struct
+import collections
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+MSGPACK_TYPE = "application/msgpack"
+MSGPACK_TYPES = (MSGPACK_TYPE, "application/x-msgpack", "application/vnd.msgpack")
+
+if msgpack is not None:
+    ExtType = msgpack.ExtType
+else:
+    ExtType = collections.namedtuple("ExtType", ("code", "data"))
+
+
+class JSONStream(object):
+    WHITESPACE = " \t\n\r"
+    NUMBER = "0123456789+-.eE"
+
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._json = json.JSONDecoder()
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self):
+        if self.eof:
+            raise ValueError("Unexpected end of JSON stream")
+        chunk = next(self._chunks, None)
+        if chunk is None:
+            self.eof = True
+            text = self._decoder.decode(b"", final=True)
+        else:
+            text = self._decoder.decode(chunk)
+        self.buffer = self.buffer[self.pos :] + text
+        self.pos = 0
+
+    def peek(self):
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in self.WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if self.eof:
+                return ""
+            self._fill()
+
+    def take(self):
+        char = self.peek()
+        self.pos += 1
+        return char
+
+    def expect(self, char):
+        found = self.take()
+        if found != char:
+            raise ValueError(f"Expected {char!r} in JSON stream, found {found!r}")
+
+    def _number_open(self, end):
+        return all(char in self.NUMBER for char in self.buffer[end:])
+
+    def value(self):
+        self.peek()
+        while True:
+            try:
+                value, end = self._json.raw_decode(self.buffer, self.pos)
+            except ValueError:
+                self._fill()
+                continue
+            if not self.eof and isinstance(value, (int, float)) and self._number_open(end):
+                self._fill()
+                continue
+            self.pos = end
+            return value
+
+
+def iter_array(chunks):
+    stream = JSONStream(chunks)
+    stream.expect("[")
+    if stream.peek() == "]":
+        return
+    while True:
+        yield stream.value()
+        char = stream.take()
+        if char == "]":
+            return
+        if char != ",":
+            raise ValueError(f"Expected ',' or ']' in JSON array, found {char!r}")
+
+
+def iter_object(chunks):
+    stream = JSONStream(chunks)
+    if stream.peek() == "[":
+        stream.take()
+        stream.expect("]")
+        return
+    stream.expect("{")
+    if stream.peek() == "}":
+        return
+    while True:
+        key = stream.value()
+        stream.expect(":")
+        yield key, stream.value()
+        char = stream.take()
+        if char == "}":
+            return
+        if char != ",":
+            raise ValueError(f"Expected ',' or '}}' in JSON object, found {char!r}")
+
+
+def multipart_boundary(content_type):
+    for param in (content_type or "").split(";")[1:]:
+        name, _, value = param.strip().partition("=")
+        if name.lower() == "boundary":
+            return value.strip('"')
+    return None
+
+
+def _multipart_part(raw):
+    if raw.startswith(b"\r\n"):
+        return dict(), raw[2:]
+    head, _, body = raw.partition(b"\r\n\r\n")
+    headers = dict()
+    for line in head.decode("latin-1").split("\r\n"):
+        name, _, value = line.partition(":")
+        if name:
+            headers[name.strip().lower()] = value.strip()
+    return headers, body
+
+
+def iter_multipart(chunks, boundary):
+    chunks = iter(chunks)
+    delimiter = b"\r\n--" + boundary.encode("latin-1")
+    buffer = b"\r\n"
+    scan = 0
+    in_part = False
+    while True:
+        index = buffer.find(delimiter, scan)
+        if index < 0:
+            chunk = next(chunks, None)
+            if chunk is None:
+                raise ValueError("Unexpected end of multipart stream")
+            scan = max(0, len(buffer) - len(delimiter))
+            buffer += chunk
+            continue
+        if in_part:
+            yield _multipart_part(buffer[:index])
+        buffer = buffer[index + len(delimiter) :]
+        while not buffer.startswith(b"--") and b"\r\n" not in buffer:
+            chunk = next(chunks, None)
+            if chunk is None:
+                raise ValueError("Unexpected end of multipart stream")
+            buffer += chunk
+        if buffer.startswith(b"--"):
+            return
+        buffer = buffer[buffer.index(b"\r\n") + 2 :]
+        scan = 0
+        in_part = True
+
+
+def iter_events(chunks):
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    buffer = ""
+    name, data, event_id = "message", list(), None
+    for chunk in chunks:
+        buffer += decoder.decode(chunk)
+        *lines, buffer = buffer.split("\n")
+        for line in lines:
+            line = line.rstrip("\r")
+            if not line:
+                if data:
+                    yield {"id": event_id, "event": name, "data": "\n".join(data)}
+                name, data = "message", list()
+                continue
+            if line.startswith(":"):
+                continue
+            field, _, value = line.partition(":")
+            if value.startswith(" "):
+                value = value[1:]
+            if field == "event":
+                name = value
+            elif field == "data":
+                data.append(value)
+            elif field == "id":
+                event_id = value
+
+
+def is_msgpack(content_type):
+    return (content_type or "").split(";")[0].strip().lower() in MSGPACK_TYPES
+
+
+UINT_FORMATS = ((0xCC, "B", 1 << 8), (0xCD, "H", 1 << 16), (0xCE, "I", 1 << 32), (0xCF, "Q", 1 << 64))
+INT_FORMATS = ((0xD0, "b", 1 << 7), (0xD1, "h", 1 << 15), (0xD2, "i", 1 << 31), (0xD3, "q", 1 << 63))
+
+
+def _pack_header(out, size, fix, fix_limit, formats):
+    if size < fix_limit:
+        out.append(fix | size)
+        return
+    for code, fmt, limit in formats:
+        if size < limit:
+            out += struct.pack(f">B{fmt}", code, size)
+            return
+    raise ValueError("Value too large for MessagePack")
+
+
+def _pack(value, out, default):
+    kind = type(value)
+    if value is None:
+        out.append(0xC0)
+    elif kind is bool:
+        out.append(0xC3 if value else 0xC2)
+    elif kind is int:
+        if 0 <= value < 0x80 or -0x20 <= value < 0:
+            out.append(value & 0xFF)
+        elif value >= 0:
+            for code, fmt, limit in UINT_FORMATS:
+                if value < limit:
+                    out += struct.pack(f">B{fmt}", code, value)
+                    break
+            else:
+                raise OverflowError("Integer too large for MessagePack")
+        else:
+            for code, fmt, limit in INT_FORMATS:
+                if value >= -limit:
+                    out += struct.pack(f">B{fmt}", code, value)
+                    break
+            else:
+                raise OverflowError("Integer too large for MessagePack")
+    elif kind is float:
+        out += struct.pack(">Bd", 0xCB, value)
+    elif kind is str:
+        data = value.encode("utf-8")
+        _pack_header(out, len(data), 0xA0, 32, ((0xD9, "B", 1 << 8), (0xDA, "H", 1 << 16), (0xDB, "I", 1 << 32)))
+        out += data
+    elif kind in (bytes, bytearray, memoryview):
+        data = bytes(value)
+        _pack_header(out, len(data), 0, 0, ((0xC4, "B", 1 << 8), (0xC5, "H", 1 << 16), (0xC6, "I", 1 << 32)))
+        out += data
+    elif kind is list or (kind is tuple and default is None):
+        _pack_header(out, len(value), 0x90, 16, ((0xDC, "H", 1 << 16), (0xDD, "I", 1 << 32)))
+        for item in value:
+            _pack(item, out, default)
+    elif kind is dict:
+        _pack_header(out, len(value), 0x80, 16, ((0xDE, "H", 1 << 16), (0xDF, "I", 1 << 32)))
+        for key, item in value.items():
+            _pack(key, out, default)
+            _pack(item, out, default)
+    elif isinstance(value, ExtType):
+        fixed = {1: 0xD4, 2: 0xD5, 4: 0xD6, 8: 0xD7, 16: 0xD8}.get(len(value.data))
+        if fixed:
+            out += struct.pack(">Bb", fixed, value.code)
+        else:
+            _pack_header(out, len(value.data), 0, 0, ((0xC7, "B", 1 << 8), (0xC8, "H", 1 << 16), (0xC9, "I", 1 << 32)))
+            out += struct.pack(">b", value.code)
+        out += value.data
+    elif default is not None:
+        _pack(default(value), out, default)
+    else:
+        raise TypeError(f"Cannot serialize {kind.__name__} to MessagePack")
+
+
+class Unpacker(object):
+    FIXED = {
+        0xCA: ">f",
+        0xCB: ">d",
+        0xCC: ">B",
+        0xCD: ">H",
+        0xCE: ">I",
+        0xCF: ">Q",
+        0xD0: ">b",
+        0xD1: ">h",
+        0xD2: ">i",
+        0xD3: ">q",
+    }
+
+    def __init__(self, data, ext_hook=None):
+        self.data = memoryview(data)
+        self.pos = 0
+        self.ext_hook = ext_hook or ExtType
+
+    def _read(self, size):
+        end = self.pos + size
+        if end > len(self.data):
+            raise ValueError("Unexpected end of MessagePack data")
+        chunk, self.pos = self.data[self.pos : end], end
+        return chunk
+
+    def _unpack(self, fmt):
+        return struct.unpack(fmt, self._read(struct.calcsize(fmt)))[0]
+
+    def _array(self, size):
+        return [self.unpack() for _ in range(size)]
+
+    def _map(self, size):
+        result = dict()
+        for _ in range(size):
+            key = self.unpack()
+            result[key] = self.unpack()
+        return result
+
+    def _ext(self, size):
+        code = self._unpack(">b")
+        return self.ext_hook(code, bytes(self._read(size)))
+
+    def unpack(self):
+        byte = self._read(1)[0]
+        if byte < 0x80:
+            return byte
+        if byte >= 0xE0:
+            return byte - 0x100
+        if byte < 0x90:
+            return self._map(byte & 0x0F)
+        if byte < 0xA0:
+            return self._array(byte & 0x0F)
+        if byte < 0xC0:
+            return str(self._read(byte & 0x1F), "utf-8")
+        if byte == 0xC0:
+            return None
+        if byte in (0xC2, 0xC3):
+            return byte == 0xC3
+        if byte in self.FIXED:
+            return self._unpack(self.FIXED[byte])
+        if byte in (0xC4, 0xC5, 0xC6):
+            return bytes(self._read(self._unpack((">B", ">H", ">I")[byte - 0xC4])))
+        if byte in (0xC7, 0xC8, 0xC9):
+            return self._ext(self._unpack((">B", ">H", ">I")[byte - 0xC7]))
+        if 0xD4 <= byte <= 0xD8:
+            return self._ext(1 << (byte - 0xD4))
+        if byte in (0xD9, 0xDA, 0xDB):
+            return str(self._read(self._unpack((">B", ">H", ">I")[byte - 0xD9])), "utf-8")
+        if byte in (0xDC, 0xDD):
+            return self._array(self._unpack(">H" if byte == 0xDC else ">I"))
+        if byte in (0xDE, 0xDF):
+            return self._map(self._unpack(">H" if byte == 0xDE else ">I"))
+        raise ValueError(f"Invalid MessagePack type byte 0x{byte:02x}")
+
+
+def msgpack_dumps(value, default=None):
+    if msgpack is not None:
+        return msgpack.packb(value, use_bin_type=True, default=default, strict_types=default is not None)
+    out = bytearray()
+    _pack(value, out, default)
+    return bytes(out)
+
+
+def msgpack_loads(data, ext_hook=None):
+    if msgpack is not None:
+        kwargs = {"ext_hook": ext_hook} if ext_hook else {}
+        return msgpack.unpackb(data, raw=False, strict_map_key=False, **kwargs)
+    unpacker = Unpacker(data, ext_hook)
+    value = unpacker.unpack()
+    if unpacker.pos != len(unpacker.data):
+        raise ValueError("Extra data after MessagePack value")
+    return value
@@ -10,6 +10,7 @@ from .manager import (
     TaskManager,
     TimerManager,
     ProjectManager,
+    SubscriptionManager,
     LauncherManager,
 )
 
@@ -71,6 +72,7 @@ class MainCons(object):
     def initAttributes(self):
         self.translator = QtCore.QTranslator()
         self.timer_manager = TimerManager(self)
+        self.subscription_manager = SubscriptionManager(self)
         self.project_manager = ProjectManager(self)
         self.launcher_manager = LauncherManager(self)
         self.user_manager = UserManager(self)
@@ -168,12 +170,12 @@ class MainCons(object):
         if self.view.project_lw.isVisible():
             self.project_manager.refresh_projects()
 
-    def refresh_status(self, status):
+    def refresh_status(self, status, force=False):
         self.view.online = status
         self.view.translateTitle()
         if os.environ[self.launcher_offline_name] == "1":
             status = False
-        if status == self.model.online:
+        if status == self.model.online and not force:
             return
         self.model.online = status
         self.refresh_view()
@@ -188,7 +190,21 @@ class MainCons(object):
         os.environ[self.launcher_offline_name] = str(index)
         os.environ[self.launcher_develop_name] = str(index)
         status = getattr(self.view, "online", False)
-        self.refresh_status(status)
+        if not self.model.switch_environment(index):
+            self.refresh_status(status)
+            return
+        self.subscription_manager.reconnect()
+        self.view.launcher_lw.setProperty("launchers", None)
+        self.view.project_lw.setProperty("projects", None)
+        self.view.task_lw.setProperty("tasks", None)
+        self.view.launcher_lw.clear()
+        self.view.project_lw.clear()
+        self.view.task_lw.clear()
+        self.user_manager.run_api_task(
+            self.model.resume_session,
+            success_callback=lambda _: self.refresh_status(status, force=True),
+            error_callback=lambda e: self.refresh_status(status, force=True),
+        )
 
     def switch_user(self, index, init=None):
         if init:
@@ -471,6 +487,7 @@ class MainCons(object):
     def tryIconQuit(self):
         self.view.trayIcon.setVisible(False)
         self.timer_manager.stop()
+        self.subscription_manager.stop()
         self.update_preset()
         self.app.quit()
         os._exit(0)
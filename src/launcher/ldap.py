@@ -1,49 +1,132 @@
-import os
-from ldap3 import Server, Connection, ALL, NTLM
-
-
-class LDAPAuthenticator:
-    def __init__(self, ldap_server, domain=None):
-        self.ldap_server = ldap_server
-        self.domain = domain
-        self.mail = None
-        self.fullName = None
-
-    def authenticate(self, username, password):
-        try:
-            server = Server(self.ldap_server, get_info=ALL)
-            user_dn = f"{self.domain}\\{username}"
-            connection = Connection(server, user=user_dn, password=password, authentication=NTLM)
-            if connection.bind():
-                entry = None
-                try:
-                    connection.search(
-                        search_base="DC=dy3danimation,DC=com",
-                        search_filter=f"(sAMAccountName={username})",
-                        attributes=["displayName", "userPrincipalName"],
-                    )
-                    entry = connection.entries[0]
-                    self.fullName = entry.displayName.value
-                    self.mail = entry.userPrincipalName.value
-                except Exception as e:
-                    print(f"LDAP search error: {str(e)}", flush=True)
-                connection.unbind()
-                return True
-            else:
-                connection.unbind()
-                return False
-        except Exception as e:
-            print(f"LDAP authentication error: {str(e)}", flush=True)
-            return False
-
-
-def ldap_login(username, password):
-    print("Attempting LDAP authentication...", flush=True)
-    ldap_server = os.environ.get("LAUNCHER_LDAP_SERVER")
-    domain = os.environ.get("LAUNCHER_LDAP_DOMAIN")
-    if not ldap_server or not domain:
-        print("LDAP server or domain not configured.", flush=True)
-        return
-    ldap_authenticator = LDAPAuthenticator(ldap_server=ldap_server, domain=domain)
-    if ldap_authenticator.authenticate(username, password):
-        return ldap_authenticator
+import os
+import time
+import threading
+from ldap3 import Server, Connection, NONE, NTLM
+from ldap3.core.exceptions import LDAPBindError
+
+SEARCH_BASE = "DC=dy3danimation,DC=com"
+CONNECT_TIMEOUT = 3
+RECEIVE_TIMEOUT = 10
+
+
+class LDAPPool(object):
+    POOL_SIZE = 4
+    PROFILE_TTL = 300
+    _pools = dict()
+    _pools_lock = threading.Lock()
+
+    def __init__(self, ldap_server):
+        self.server = Server(ldap_server, get_info=NONE, connect_timeout=CONNECT_TIMEOUT)
+        self._lock = threading.Lock()
+        self._idle = list()
+        self._profiles = dict()
+
+    @classmethod
+    def instance(cls, ldap_server):
+        with cls._pools_lock:
+            pool = cls._pools.get(ldap_server)
+            if pool is None:
+                pool = cls._pools[ldap_server] = cls(ldap_server)
+            return pool
+
+    def bind(self, user, password):
+        with self._lock:
+            connection = self._idle.pop() if self._idle else None
+        if connection is not None:
+            if not connection.closed:
+                try:
+                    return self._bind(connection, user, password)
+                except Exception as e:
+                    print(f"LDAP pooled connection failed, reconnecting: {str(e)}", flush=True)
+            else:
+                self.discard(connection)
+        return self._bind(None, user, password)
+
+    def _bind(self, connection, user, password):
+        try:
+            if connection is not None:
+                bound = connection.rebind(user=user, password=password, authentication=NTLM, read_server_info=False)
+            else:
+                connection = Connection(
+                    self.server,
+                    user=user,
+                    password=password,
+                    authentication=NTLM,
+                    receive_timeout=RECEIVE_TIMEOUT,
+                )
+                bound = connection.bind(read_server_info=False)
+        except LDAPBindError:
+            bound = False
+        except Exception:
+            self.discard(connection)
+            raise
+        if not bound:
+            self.discard(connection)
+            return None
+        return connection
+
+    def release(self, connection):
+        with self._lock:
+            if len(self._idle) < self.POOL_SIZE and not connection.closed:
+                self._idle.append(connection)
+                return
+        self.discard(connection)
+
+    def discard(self, connection):
+        if connection is None:
+            return
+        try:
+            connection.unbind()
+        except Exception:
+            pass
+
+    def profile(self, connection, username):
+        cached = self._profiles.get(username)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+        connection.search(
+            search_base=SEARCH_BASE,
+            search_filter=f"(sAMAccountName={username})",
+            attributes=["displayName", "userPrincipalName"],
+        )
+        entry = connection.entries[0]
+        profile = (entry.displayName.value, entry.userPrincipalName.value)
+        self._profiles[username] = (time.monotonic() + self.PROFILE_TTL, profile)
+        return profile
+
+
+class LDAPAuthenticator:
+    def __init__(self, ldap_server, domain=None):
+        self.ldap_server = ldap_server
+        self.domain = domain
+        self.mail = None
+        self.fullName = None
+
+    def authenticate(self, username, password):
+        try:
+            pool = LDAPPool.instance(self.ldap_server)
+            user_dn = f"{self.domain}\\{username}"
+            connection = pool.bind(user_dn, password)
+            if connection is None:
+                return False
+            try:
+                self.fullName, self.mail = pool.profile(connection, username)
+            except Exception as e:
+                print(f"LDAP search error: {str(e)}", flush=True)
+            pool.release(connection)
+            return True
+        except Exception as e:
+            print(f"LDAP authentication error: {str(e)}", flush=True)
+            return False
+
+
+def ldap_login(username, password):
+    print("Attempting LDAP authentication...", flush=True)
+    ldap_server = os.environ.get("LAUNCHER_LDAP_SERVER")
+    domain = os.environ.get("LAUNCHER_LDAP_DOMAIN")
+    if not ldap_server or not domain:
+        print("LDAP server or domain not configured.", flush=True)
+        return
+    ldap_authenticator = LDAPAuthenticator(ldap_server=ldap_server, domain=domain)
+    if ldap_authenticator.authenticate(username, password):
+        return ldap_authenticator
@@ -1,4 +1,6 @@
 import os
+import random
+import threading
 from typing import List
 from PySide2 import QtWidgets, QtCore, QtGui
 
@@ -8,6 +10,7 @@ import wish
 class ApiWorkerSignals(QtCore.QObject):
     finished = QtCore.Signal(object)
     error = QtCore.Signal(Exception)
+    deferred = QtCore.Signal(float, Exception)
 
 
 class ApiWorker(QtCore.QRunnable):
@@ -23,10 +26,17 @@ class ApiWorker(QtCore.QRunnable):
             result = self.fn(*self.args, **self.kwargs)
             self.signals.finished.emit(result)
         except Exception as e:
-            self.signals.error.emit(e)
+            retry_after = getattr(e, "retry_after", None)
+            if retry_after is not None:
+                self.signals.deferred.emit(float(retry_after), e)
+            else:
+                self.signals.error.emit(e)
 
 
 class BaseManager(object):
+    READ_BUDGET = 10.0
+    MAX_DEFERS = 5
+
     def __init__(self, cons):
         self.cons = cons
         self.view = cons.view
@@ -63,10 +73,13 @@ class BaseManager(object):
         success_callback=None,
         error_callback=None,
         show_loading=True,
+        budget=None,
         **kwargs,
     ):
         if show_loading:
             self._show_loading()
+        if budget is not None:
+            kwargs["budget"] = budget
 
         def wrapped_success(result):
             if show_loading:
@@ -82,10 +95,21 @@ class BaseManager(object):
             else:
                 print(f"API error: {error}")
 
-        worker = ApiWorker(api_func, *args, **kwargs)
-        worker.signals.finished.connect(wrapped_success)
-        worker.signals.error.connect(wrapped_error)
-        self.thread_pool.start(worker)
+        def wrapped_deferred(attempt, delay, error):
+            if attempt >= self.MAX_DEFERS:
+                wrapped_error(error)
+                return
+            delay = int(delay * 1000 * random.uniform(1.0, 1.2))
+            QtCore.QTimer.singleShot(delay, lambda: start(attempt + 1))
+
+        def start(attempt):
+            worker = ApiWorker(api_func, *args, **kwargs)
+            worker.signals.finished.connect(wrapped_success)
+            worker.signals.error.connect(wrapped_error)
+            worker.signals.deferred.connect(lambda delay, error: wrapped_deferred(attempt, delay, error))
+            self.thread_pool.start(worker)
+
+        start(0)
 
     def format_users(self, all_users, current_members):
         processed_users = set()
@@ -93,18 +117,31 @@ class BaseManager(object):
 
         if all_users is None:
             return formatted_users
+        member_ids = {member.id for member in current_members or ()}
         for member in all_users:
-            if member["id"] not in processed_users:
+            if member.id not in processed_users:
                 formatted_users.append(
                     {
-                        "id": member["id"],
-                        "text": f"{member['username']} ({member['role']})",
-                        "is_member": any(m["id"] == member["id"] for m in current_members),
+                        "id": member.id,
+                        "text": f"{member.username} ({member.role})",
+                        "is_member": member.id in member_ids,
                     }
                 )
-                processed_users.add(member["id"])
+                processed_users.add(member.id)
         return formatted_users
 
+    def member_changes(self, member_list, member_ids):
+        listed_ids = set()
+        selected_ids = set()
+        for row in range(member_list.count()):
+            item = member_list.item(row)
+            listed_ids.add(item.data(QtCore.Qt.UserRole))
+            if item.isSelected():
+                selected_ids.add(item.data(QtCore.Qt.UserRole))
+        add_ids = sorted(selected_ids - member_ids)
+        remove_ids = sorted((member_ids & listed_ids) - selected_ids)
+        return add_ids, remove_ids
+
     def get_project_task_path(self):
         project_id = None
         task_ids_list = list()
@@ -115,6 +152,10 @@ class BaseManager(object):
         else:
             project_id = self.view.project_gbox.property("project_id")
         if current_task:
+            task_id = current_task.data(0, QtCore.Qt.UserRole)
+            tree = self.cons.task_manager.task_tree
+            if tree is not None and str(tree.project_id) == str(project_id) and task_id in tree.paths:
+                return tree.paths[task_id]
             item = current_task
             while item:
                 item_id = item.data(0, QtCore.Qt.UserRole)
@@ -125,6 +166,10 @@ class BaseManager(object):
         id_path = "/".join(task_ids_list)
         return id_path
 
+    def get_project_task_lineage(self):
+        parts = self.get_project_task_path().split("/")
+        return ["/".join(parts[: index + 1]) for index in range(len(parts))]
+
     def get_current_id(self, current_item, config_key):
         current_id = None
         if current_item:
@@ -140,6 +185,32 @@ class BaseManager(object):
             current_id = None
         return current_id
 
+    def get_cursor(self, widget, name):
+        if widget.property(name) is None:
+            return None
+        return widget.property(f"{name}_cursor")
+
+    def set_collection(self, widget, name, changes):
+        widget.setProperty(name, changes.items if changes else None)
+        widget.setProperty(f"{name}_cursor", changes.cursor if changes else None)
+
+    def apply_list_changes(self, list_widget, changes, records, insert_item):
+        items = dict()
+        for row in range(list_widget.count()):
+            item = list_widget.item(row)
+            items[item.data(QtCore.Qt.UserRole)] = item
+        positions = {record.id: row for row, record in enumerate(records)}
+        upserted = [record for record in changes.upserted if record.id in positions]
+        upserted.sort(key=lambda record: positions[record.id])
+        list_widget.blockSignals(True)
+        for record_id in list(changes.deleted) + [record.id for record in upserted]:
+            item = items.pop(record_id, None)
+            if item is not None:
+                list_widget.takeItem(list_widget.row(item))
+        for record in upserted:
+            insert_item(record, positions[record.id])
+        list_widget.blockSignals(False)
+
     def resetCurrentItem(self, parent_lw, selected_item):
         current_item = parent_lw.currentItem()
         if current_item == selected_item:
@@ -150,7 +221,8 @@ class BaseManager(object):
 
 class ProjectManager(BaseManager):
     def refresh_projects(self):
-        def on_success(projects):
+        def on_success(changes):
+            projects = changes.items
             if not projects:
                 self.view.task_lw.clear()
                 self.view.project_lw.clear()
@@ -161,31 +233,41 @@ class ProjectManager(BaseManager):
                 return
             current_item = self.view.project_lw.currentItem()
             current_id = self.get_current_id(current_item, "project_id")
-            if projects == self.view.project_lw.property("projects"):
+            if not changes.reset:
+                if changes.changed:
+                    self.apply_list_changes(self.view.project_lw, changes, projects, self.insert_project)
+                    current_item = self.view.project_lw.currentItem()
+                self.set_collection(self.view.project_lw, "projects", changes)
                 self.resetCurrentItem(self.view.project_lw, current_item)
                 return
             self.view.project_lw.blockSignals(True)
             self.view.project_lw.clear()
             self.view.project_lw.blockSignals(False)
-            for project in projects:
-                item = QtWidgets.QListWidgetItem()
-                item.setText(project["name"])
-                item.setData(QtCore.Qt.UserRole, project["id"])
-                self.view.project_lw.addItem(item)
-                if project["id"] == current_id:
+            for row, project in enumerate(projects):
+                item = self.insert_project(project, row)
+                if project.id == current_id:
                     self.resetCurrentItem(self.view.project_lw, item)
-            self.view.project_lw.setProperty("projects", projects)
+            self.set_collection(self.view.project_lw, "projects", changes)
             init_task_id = self.cons.configParser.get("MainUI", "task_id", fallback="")
             if init_task_id:
                 self.view.task_lw.setProperty("init_task_id", init_task_id)
                 self.cons.switch_task()
 
         self.run_api_task(
-            self.model.get_all_projects,
+            self.model.sync_projects,
+            self.get_cursor(self.view.project_lw, "projects"),
+            budget=self.READ_BUDGET,
             success_callback=on_success,
             error_callback=lambda e: print(f"Failed to get project list: {e}"),
         )
 
+    def insert_project(self, project, row):
+        item = QtWidgets.QListWidgetItem()
+        item.setText(project.name)
+        item.setData(QtCore.Qt.UserRole, project.id)
+        self.view.project_lw.insertItem(row, item)
+        return item
+
     def add_project(self, name):
         def on_success(result):
             if result:
@@ -227,15 +309,22 @@ class ProjectManager(BaseManager):
             error_callback=lambda e: print(f"Failed to delete project: {e}"),
         )
 
-    def assign_members(self, project_id: int, project_name: str, selected_user_ids: List[int]):
+    def assign_members(self, project_id: int, project_name: str, add_ids: List[int], remove_ids: List[int]):
+        if not add_ids and not remove_ids:
+            return
+
         def on_success(result):
             if result:
+                task_manager = self.cons.task_manager
+                if task_manager.membership and task_manager.membership.project_id == project_id:
+                    task_manager.load_membership(project_id)
                 print(f"{project_name} assigned members successfully")
 
         self.run_api_task(
-            self.model.assign_project,
+            self.model.assign_project_delta,
             project_id,
-            selected_user_ids,
+            add_ids,
+            remove_ids,
             success_callback=on_success,
             error_callback=lambda e: print(f"Failed to assign members: {e}"),
         )
@@ -249,6 +338,7 @@ class ProjectManager(BaseManager):
         self.view.task_lw.setProperty("task_id", None)
         self.view.task_lw.setCurrentItem(None)
         self.view.launcher_lw.setCurrentItem(None)
+        self.cons.subscription_manager.watch(None)
         self.refresh_projects()
 
     def show_add_project_dialog(self):
@@ -285,10 +375,13 @@ class ProjectManager(BaseManager):
         dialog.setupAssignUI([])
         dialog.show()
 
+        member_state = {"member_ids": None}
+
         def update_member_list(all_users, project_users):
             formatted_users = self.format_users(all_users, project_users)
             dialog.member_list.clear()
-            project_member_ids = {member["id"] for member in project_users}
+            project_member_ids = {member.id for member in project_users or ()}
+            member_state["member_ids"] = project_member_ids
             for user in formatted_users:
                 item = QtWidgets.QListWidgetItem(user["text"])
                 item.setData(QtCore.Qt.UserRole, user["id"])
@@ -297,16 +390,20 @@ class ProjectManager(BaseManager):
                     item.setSelected(True)
 
         def on_dialog_accepted():
-            selected_user_ids = [item.data(QtCore.Qt.UserRole) for item in dialog.member_list.selectedItems()]
-            self.assign_members(project_id, project_name, selected_user_ids)
+            if member_state["member_ids"] is None:
+                return
+            add_ids, remove_ids = self.member_changes(dialog.member_list, member_state["member_ids"])
+            self.assign_members(project_id, project_name, add_ids, remove_ids)
 
         dialog.accepted.connect(on_dialog_accepted)
 
         self.run_api_task(
             self.model.get_all_users,
+            budget=self.READ_BUDGET,
             success_callback=lambda all_users: self.run_api_task(
                 self.model.get_project_members,
                 project_id,
+                budget=self.READ_BUDGET,
                 success_callback=lambda project_users: update_member_list(all_users, project_users),
                 error_callback=lambda e: print(f"Failed to get project members: {e}"),
             ),
@@ -319,6 +416,9 @@ class TaskManager(BaseManager):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.task_parents = dict()
+        self.task_items = dict()
+        self.task_tree = None
+        self.membership = None
 
     def refresh_tasks(self, project_id):
         if not project_id:
@@ -326,33 +426,38 @@ class TaskManager(BaseManager):
             self.view.task_lw.setProperty("tasks", None)
             return
 
-        def on_success(tasks):
-            if not tasks:
+        def on_success(changes):
+            tree = changes.items
+            if not tree:
+                self.task_tree = None
+                self.task_parents = dict()
                 self.view.task_lw.clear()
                 self.view.task_lw.setProperty("tasks", None)
                 return
-            self.task_parents.clear()
-            self.build_task_relations(tasks)
+            self.task_tree = tree
+            self.task_parents = tree.parents
             current_item = self.view.task_lw.currentItem()
             current_id = self.get_current_id(current_item, "task_id")
-            if tasks == self.view.task_lw.property("tasks"):
+            if not changes.reset:
+                if changes.changed:
+                    self.apply_task_changes(tree, changes)
+                    current_item = self.view.task_lw.currentItem()
+                self.set_collection(self.view.task_lw, "tasks", changes)
                 if current_item:
                     self.resetCurrentItem(self.view.task_lw, current_item)
                 else:
                     current_id = self.view.task_lw.property("pre_task_id")
                     if current_id:
-                        root = self.view.task_lw.invisibleRootItem()
-                        self.find_and_select_item(root, current_id)
+                        self.select_task(current_id)
                 return
             self.view.task_lw.blockSignals(True)
             self.view.task_lw.clear()
             self.view.task_lw.blockSignals(False)
-            self.build_task_tree(tasks)
+            self.build_task_tree(tree)
             self.view.task_lw.expandAll()
-            self.view.task_lw.setProperty("tasks", tasks)
+            self.set_collection(self.view.task_lw, "tasks", changes)
             if current_id:
-                root = self.view.task_lw.invisibleRootItem()
-                self.find_and_select_item(root, current_id)
+                self.select_task(current_id)
             else:
                 self.view.task_lw.setCurrentItem(None)
 
@@ -363,31 +468,25 @@ class TaskManager(BaseManager):
             self.cons.project_manager.show_switch_project_dialog()
 
         self.run_api_task(
-            self.model.get_all_task,
+            self.model.sync_tasks,
             project_id,
+            self.get_cursor(self.view.task_lw, "tasks"),
+            budget=self.READ_BUDGET,
             success_callback=on_success,
             error_callback=on_error,
         )
 
-    def build_task_relations(self, tasks, parent_id=None):
-        for task in tasks:
-            task_id = task["id"]
-            self.task_parents[task_id] = parent_id
-            if task.get("children"):
-                self.build_task_relations(task["children"], task_id)
-
-    def find_and_select_item(self, item, current_id):
-        for i in range(item.childCount()):
-            child = item.child(i)
-            if child.data(0, QtCore.Qt.UserRole) == current_id:
-                self.resetCurrentItem(self.view.task_lw, child)
-                return True
-            if self.find_and_select_item(child, current_id):
-                return True
-        return False
-
-    def build_task_tree(self, tasks, parent_item=None):
-        for task in tasks:
+    def select_task(self, task_id):
+        item = self.task_items.get(task_id)
+        if item is None:
+            return False
+        self.resetCurrentItem(self.view.task_lw, item)
+        return True
+
+    def build_task_tree(self, tree):
+        self.task_items = dict()
+        for task in tree:
+            parent_item = self.task_items.get(tree.parents[task.id])
             if parent_item is None:
                 item = QtWidgets.QTreeWidgetItem(self.view.task_lw)
                 self.view.task_lw.addTopLevelItem(item)
@@ -395,11 +494,76 @@ class TaskManager(BaseManager):
                 item = QtWidgets.QTreeWidgetItem(parent_item)
                 parent_item.addChild(item)
 
-            item.setText(0, task["title"])
-            item.setData(0, QtCore.Qt.UserRole, task["id"])
+            item.setText(0, task.title)
+            item.setData(0, QtCore.Qt.UserRole, task.id)
+            self.task_items[task.id] = item
+        self.post_membership()
 
-            if task.get("children"):
-                self.build_task_tree(task["children"], item)
+    def load_membership(self, project_id):
+        def on_success(membership):
+            if project_id != self.view.project_gbox.property("project_id"):
+                return
+            self.membership = membership
+            self.post_membership()
+
+        self.run_api_task(
+            self.model.get_membership,
+            project_id,
+            budget=self.READ_BUDGET,
+            success_callback=on_success,
+            error_callback=lambda e: print(f"Failed to get project membership: {e}"),
+        )
+
+    def post_membership(self, task_ids=None):
+        membership = self.membership
+        if membership is None or not self.task_tree or membership.project_id != self.task_tree.project_id:
+            return
+        for task_id in self.task_items if task_ids is None else task_ids:
+            item = self.task_items.get(task_id)
+            if item is None:
+                continue
+            names = [user.full_name or user.username for user in membership.members(task_id)]
+            item.setToolTip(0, f"{self.view.tr('Members')}: {', '.join(names)}" if names else "")
+
+    def detach_task_item(self, item):
+        parent_item = item.parent()
+        if parent_item is not None:
+            parent_item.removeChild(item)
+            return
+        index = self.view.task_lw.indexOfTopLevelItem(item)
+        if index >= 0:
+            self.view.task_lw.takeTopLevelItem(index)
+
+    def apply_task_changes(self, tree, changes):
+        upserted = {task.id for task in changes.upserted}
+        removed = [task_id for task_id in self.task_items if task_id not in tree.index]
+        self.view.task_lw.blockSignals(True)
+        for task_id in removed:
+            self.detach_task_item(self.task_items.pop(task_id))
+        for task_id in upserted:
+            if task_id in self.task_items:
+                self.detach_task_item(self.task_items[task_id])
+        rows = dict()
+        for task in tree:
+            if task.id not in upserted:
+                continue
+            parent_id = tree.parents[task.id]
+            if parent_id not in rows:
+                rows[parent_id] = {child.id: row for row, child in enumerate(tree.children[parent_id])}
+            row = rows[parent_id][task.id]
+            item = self.task_items.get(task.id)
+            if item is None:
+                item = self.task_items[task.id] = QtWidgets.QTreeWidgetItem()
+                item.setData(0, QtCore.Qt.UserRole, task.id)
+            item.setText(0, task.title)
+            parent_item = self.task_items.get(parent_id)
+            if parent_item is None:
+                self.view.task_lw.insertTopLevelItem(row, item)
+            else:
+                parent_item.insertChild(row, item)
+        self.post_membership(upserted)
+        self.view.task_lw.expandAll()
+        self.view.task_lw.blockSignals(False)
 
     def add_task(self, title, project_id, parent_id=None):
         def on_success(result):
@@ -452,17 +616,25 @@ class TaskManager(BaseManager):
         project_id,
         task_id,
         task_name,
-        selected_user_ids,
+        add_ids,
+        remove_ids,
     ):
+        if not add_ids and not remove_ids:
+            return
+
         def on_success(result):
             if result:
+                if self.membership and self.membership.project_id == project_id:
+                    self.membership = self.membership.with_task_members(task_id, add_ids, remove_ids)
+                    self.post_membership([task_id])
                 print(f"{task_name} assigned members successfully")
 
         self.run_api_task(
-            self.model.assign_task,
+            self.model.assign_task_delta,
             project_id,
             task_id,
-            selected_user_ids,
+            add_ids,
+            remove_ids,
             success_callback=on_success,
             error_callback=lambda e: print(f"Failed to assign task members: {e}"),
         )
@@ -476,7 +648,34 @@ class TaskManager(BaseManager):
             self.view.project_lw.hide()
             self.view.project_gbox.setTitle(project_name)
             self.view.project_gbox.setProperty("project_id", project_id)
+            self.open_project(project_id)
+
+    def open_project(self, project_id):
+        project_id = int(project_id)
+        task_id = None
+        cursor = self.get_cursor(self.view.task_lw, "tasks") or ""
+        if cursor.startswith(f"tasks:{project_id}@"):
+            task_id = self.get_current_id(self.view.task_lw.currentItem(), "task_id")
+
+        def on_success(context):
+            if context:
+                self.cons.launcher_manager.apply_context(context)
+            self.refresh_tasks(project_id)
+            self.load_membership(project_id)
+
+        def on_error(error):
+            print(f"Failed to get project context: {error}")
             self.refresh_tasks(project_id)
+            self.load_membership(project_id)
+
+        self.run_api_task(
+            self.model.open_context,
+            project_id,
+            task_id,
+            budget=self.READ_BUDGET,
+            success_callback=on_success,
+            error_callback=on_error,
+        )
 
     def show_add_task_dialog(self):
         project_id = self.view.project_gbox.property("project_id")
@@ -533,12 +732,15 @@ class TaskManager(BaseManager):
         dialog.setupAssignUI([])
         dialog.show()
 
+        member_state = {"member_ids": None}
+
         def update_member_list(all_users, task_users):
             formatted_users = self.format_users(all_users, task_users)
             task_member_ids = set()
             if task_users:
                 for member in task_users:
-                    task_member_ids.add(member["id"])
+                    task_member_ids.add(member.id)
+            member_state["member_ids"] = task_member_ids
             dialog.member_list.clear()
 
             for user in formatted_users:
@@ -549,18 +751,28 @@ class TaskManager(BaseManager):
                     item.setSelected(True)
 
         def on_dialog_accepted():
-            selected_user_ids = [item.data(QtCore.Qt.UserRole) for item in dialog.member_list.selectedItems()]
-            self.assign_members(project_id, task_id, task_name, selected_user_ids)
+            if member_state["member_ids"] is None:
+                return
+            add_ids, remove_ids = self.member_changes(dialog.member_list, member_state["member_ids"])
+            self.assign_members(project_id, task_id, task_name, add_ids, remove_ids)
 
         dialog.accepted.connect(on_dialog_accepted)
 
+        membership = self.membership
+        if membership is not None and membership.project_id == project_id:
+            update_member_list(membership.members(), membership.members(task_id))
+            dialog.exec_()
+            return
+
         self.run_api_task(
             self.model.get_project_members,
             project_id,
+            budget=self.READ_BUDGET,
             success_callback=lambda all_users: self.run_api_task(
                 self.model.get_task_members,
                 project_id,
                 task_id,
+                budget=self.READ_BUDGET,
                 success_callback=lambda task_users: update_member_list(all_users, task_users),
                 error_callback=lambda e: print(f"Failed to get task members: {e}"),
             ),
@@ -573,49 +785,92 @@ class LauncherManager(BaseManager):
     def __init__(self, cons):
         super().__init__(cons)
         self.pasteboard = None
+        self.context_path = None
         self.icon_manager = IconManager(cons)
 
+    def apply_context(self, context):
+        self.context_path = context.path
+        self.icon_manager.prime(context.resources)
+
+    def switch_context(self, id_path):
+        cursor = self.get_cursor(self.view.launcher_lw, "launchers") or ""
+        if not id_path or id_path == self.context_path or cursor.startswith(f"launchers:{id_path}@"):
+            self.refresh_launchers(id_path)
+            return
+
+        def on_success(context):
+            if context:
+                self.apply_context(context)
+            self.refresh_launchers(id_path)
+
+        def on_error(error):
+            print(f"Failed to get launcher context: {error}")
+            self.refresh_launchers(id_path)
+
+        self.run_api_task(
+            self.model.open_context,
+            int(id_path.split("/")[0]),
+            path=id_path,
+            with_tasks=False,
+            budget=self.READ_BUDGET,
+            success_callback=on_success,
+            error_callback=on_error,
+        )
+
     def refresh_launchers(self, id_path):
         if not id_path:
             self.view.launcher_lw.clear()
             self.view.launcher_lw.setProperty("launchers", None)
             return
+        self.cons.subscription_manager.watch(id_path)
 
-        def on_success(launchers_data):
+        def on_success(changes):
+            launchers_data = changes.items
             if not launchers_data:
                 self.view.launcher_lw.clear()
                 self.view.launcher_lw.setProperty("launchers", None)
                 return
             current_item = self.view.launcher_lw.currentItem()
             current_id = self.get_current_id(current_item, "launcher_id")
-            if launchers_data == self.view.launcher_lw.property("launchers"):
+            if not changes.reset:
+                if changes.changed:
+                    launchers = list(launchers_data.values())
+                    self.apply_list_changes(self.view.launcher_lw, changes, launchers, self.insert_launcher)
+                self.set_collection(self.view.launcher_lw, "launchers", changes)
                 self.post_launchers(current_id)
                 return
 
             self.view.launcher_lw.clear()
-            for name, launcher_info in launchers_data.items():
-                launcher_item = self.view.createUI("LauncherWindow", parent=self.view)
-                app_item = QtWidgets.QListWidgetItem(self.view.launcher_lw)
-                app_item.setSizeHint(launcher_item.minimumSizeHint())
-                self.init_launcher(launcher_item, name, launcher_info, app_item)
-                self.view.launcher_lw.setItemWidget(app_item, launcher_item)
-                self.view.launcher_lw.addItem(app_item)
-            self.view.launcher_lw.setProperty("launchers", launchers_data)
+            for row, launcher_info in enumerate(launchers_data.values()):
+                self.insert_launcher(launcher_info, row)
+            self.set_collection(self.view.launcher_lw, "launchers", changes)
             self.post_launchers(current_id)
 
         self.run_api_task(
-            self.model.get_launchers,
+            self.model.sync_launchers,
             id_path,
+            self.get_cursor(self.view.launcher_lw, "launchers"),
+            budget=self.READ_BUDGET,
             success_callback=on_success,
             error_callback=lambda e: print(f"Failed to get launcher configuration: {e}"),
         )
 
+    def insert_launcher(self, launcher_info, row):
+        launcher_item = self.view.createUI("LauncherWindow", parent=self.view)
+        app_item = QtWidgets.QListWidgetItem()
+        app_item.setSizeHint(launcher_item.minimumSizeHint())
+        self.view.launcher_lw.insertItem(row, app_item)
+        self.init_launcher(launcher_item, launcher_info.name, launcher_info, app_item)
+        self.view.launcher_lw.setItemWidget(app_item, launcher_item)
+        return app_item
+
     def post_launchers(self, current_id):
         selected_item = None
+        lineage = self.get_project_task_lineage()
         for i in range(self.view.launcher_lw.count()):
             lw_item = self.view.launcher_lw.item(i)
             launcher_item = self.view.launcher_lw.itemWidget(lw_item)
-            mask_item = self.mask_launcher(launcher_item)
+            mask_item = self.mask_launcher(launcher_item, lineage)
             if mask_item and self.model.user_role == self.model.UserRole.MEMBER:
                 lw_item.setHidden(True)
             else:
@@ -635,9 +890,9 @@ class LauncherManager(BaseManager):
         launcher_item.cmd = str()
         launcher_item.name = name
         launcher_item.name_label.setText(name)
-        launcher_item.launcher_id = launcher_info.get("id")
+        launcher_item.launcher_id = launcher_info.id
         launcher_item.launcher_info = launcher_info
-        vdata = launcher_info.get("vdata", {})
+        vdata = launcher_info.vdata
         launcher_item.version_comb.clear()
         launcher_item.version_comb.data = vdata
         for version in reversed(vdata.keys()):
@@ -654,25 +909,24 @@ class LauncherManager(BaseManager):
         if not version_data:
             return
         launcher_item.version = version
-        launcher_item.cmd = version_data.get("cmd", "")
-        icon_path = version_data.get("icon")
+        launcher_item.cmd = version_data.cmd
+        icon_path = version_data.icon
         if icon_path:
             self.icon_manager.load_icon(icon_path, launcher_item.icon_label)
         self.view.launcher_lw.setCurrentItem(app_item)
         app_item.setSelected(True)
         self.cons.launch_info()
 
-    def mask_launcher(self, launcher_item):
-        relations = launcher_item.launcher_info.get("relations", {})
-        disabled_paths = relations.get("disabled", [])
-        enabled_paths = relations.get("enabled", [])
-        current_path = self.get_project_task_path()
+    def mask_launcher(self, launcher_item, lineage):
+        disabled_paths = launcher_item.launcher_info.disabled
+        enabled_paths = launcher_item.launcher_info.enabled
         final_status = True
-        matched_path_length = 0
-        for path in disabled_paths + enabled_paths:
-            if current_path.startswith(path) and len(path) > matched_path_length:
-                matched_path_length = len(path)
-                final_status = path in enabled_paths
+        for path in reversed(lineage):
+            if path in enabled_paths:
+                break
+            if path in disabled_paths:
+                final_status = False
+                break
 
         if not final_status:
             gray_effect = QtWidgets.QGraphicsColorizeEffect(launcher_item.icon_label)
@@ -695,36 +949,44 @@ class LauncherManager(BaseManager):
             return
         self.create_launcher(software_name, dialog.version_data)
 
-    def create_launcher(self, name, vdata):
-        id_path = self.get_project_task_path()
-        upload_queue = []
+    def upload_icons(self, vdata, on_complete):
+        upload_queue = dict()
         for version_key, version_data in vdata.items():
             icon_path = version_data.get("icon", "")
             if icon_path and not icon_path.startswith("/resources/"):
-                upload_queue.append((version_key, icon_path))
+                upload_queue.setdefault(icon_path, []).append(version_key)
 
         def process_uploads():
             if not upload_queue:
-                self.run_api_task(
-                    self.model.create_launcher,
-                    name,
-                    id_path,
-                    vdata,
-                    success_callback=lambda _: self.refresh_launchers(id_path),
-                    error_callback=lambda e: print(f"Failed to create launcher: {e}"),
-                )
+                on_complete()
                 return
 
-            version_key, icon_path = upload_queue.pop(0)
+            icon_path, version_keys = upload_queue.popitem()
 
             def on_icon_uploaded(resource_path):
-                vdata[version_key]["icon"] = resource_path
+                for version_key in version_keys:
+                    vdata[version_key]["icon"] = resource_path
                 process_uploads()
 
             self.icon_manager.upload_icon(icon_path, on_icon_uploaded)
 
         process_uploads()
 
+    def create_launcher(self, name, vdata):
+        id_path = self.get_project_task_path()
+
+        def on_uploaded():
+            self.run_api_task(
+                self.model.create_launcher,
+                name,
+                id_path,
+                vdata,
+                success_callback=lambda _: self.refresh_launchers(id_path),
+                error_callback=lambda e: print(f"Failed to create launcher: {e}"),
+            )
+
+        self.upload_icons(vdata, on_uploaded)
+
     def delete_launcher(self, launcher_id: int):
         id_path = self.get_project_task_path()
 
@@ -743,7 +1005,7 @@ class LauncherManager(BaseManager):
             error_callback=lambda e: print(f"Failed to delete launcher: {e}"),
         )
 
-    def edit_launcher(self, launcher_id: int, dialog):
+    def edit_launcher(self, launcher_id: int, dialog, launcher_info=None):
         software_name = dialog.software_edit.text().strip()
         if not software_name:
             print("Launcher name cannot be empty")
@@ -752,15 +1014,10 @@ class LauncherManager(BaseManager):
             print("At least one version is required")
             return
 
-        upload_queue = []
         id_path = self.get_project_task_path()
-        for version_key, version_data in dialog.version_data.items():
-            icon_path = version_data.get("icon", "")
-            if icon_path and not icon_path.startswith("/resources/"):
-                upload_queue.append((version_key, icon_path))
 
-        def process_uploads():
-            if not upload_queue:
+        def on_uploaded():
+            if launcher_info is None:
                 self.run_api_task(
                     self.model.update_launcher,
                     launcher_id,
@@ -771,16 +1028,21 @@ class LauncherManager(BaseManager):
                     error_callback=lambda e: print(f"Failed to update launcher: {e}"),
                 )
                 return
+            operations = launcher_info.version_operations(dialog.version_data)
+            if not operations and software_name == launcher_info.name:
+                return
+            self.run_api_task(
+                self.model.patch_launcher,
+                launcher_id,
+                software_name,
+                id_path,
+                operations,
+                dialog.version_data,
+                success_callback=lambda _: self.refresh_launchers(id_path),
+                error_callback=lambda e: print(f"Failed to update launcher: {e}"),
+            )
 
-            version_key, icon_path = upload_queue.pop(0)
-
-            def on_icon_uploaded(resource_path):
-                dialog.version_data[version_key]["icon"] = resource_path
-                process_uploads()
-
-            self.icon_manager.upload_icon(icon_path, on_icon_uploaded)
-
-        process_uploads()
+        self.upload_icons(dialog.version_data, on_uploaded)
 
     def toggle_launcher(self, launcher_id: int, action: str):
         id_path = self.get_project_task_path()
@@ -808,7 +1070,7 @@ class LauncherManager(BaseManager):
             task_id = current_task.data(0, QtCore.Qt.UserRole)
             self.view.task_lw.setProperty("pre_task_id", task_id)
         id_path = self.get_project_task_path()
-        self.refresh_launchers(id_path)
+        self.switch_context(id_path)
 
     def show_add_launcher_dialog(self):
         dialog = self.view.createUI("BaseDialog", parent=self.view)
@@ -822,34 +1084,30 @@ class LauncherManager(BaseManager):
         launcher_data = {
             launcher_item.name: {
                 "id": launcher_item.launcher_id,
-                "vdata": launcher_item.version_comb.data,
+                "vdata": launcher_item.launcher_info.to_vdata(),
             }
         }
         dialog = self.view.createUI("BaseDialog", parent=self.view)
         dialog.setupLauncherUI(self.cons, launcher_data)
-        dialog.accepted.connect(lambda: self.edit_launcher(launcher_item.launcher_id, dialog))
+        launcher_info = launcher_item.launcher_info
+        dialog.accepted.connect(lambda: self.edit_launcher(launcher_item.launcher_id, dialog, launcher_info))
         dialog.show()
 
     def show_copy_launcher_dialog(self):
         current_item = self.view.launcher_lw.currentItem()
         launcher_item = self.view.launcher_lw.itemWidget(current_item)
-        self.pasteboard = {
-            launcher_item.name: {
-                "id": launcher_item.launcher_id,
-                "vdata": launcher_item.version_comb.data,
-            }
-        }
+        self.pasteboard = {launcher_item.name: launcher_item.launcher_info}
 
     def show_paste_launcher_dialog(self):
         if not self.pasteboard:
             print("No copied launcher found on the clipboard!!!")
             return
-        for name, data in self.pasteboard.items():
+        for name, launcher_info in self.pasteboard.items():
             launchers_datas = self.view.launcher_lw.property("launchers")
             if launchers_datas:
                 while name in launchers_datas:
                     name += " - Copy"
-            self.create_launcher(name, data.get("vdata"))
+            self.create_launcher(name, launcher_info.to_vdata())
 
     def show_toggle_launcher_dialog(self):
         current_item = self.view.launcher_lw.currentItem()
@@ -869,32 +1127,65 @@ class LauncherManager(BaseManager):
 
 
 class UserManager(BaseManager):
+    SCROLL_THRESHOLD = 20
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._users_generation = 0
+
     def refresh_users(self, dialog):
         dialog.user_list.setEnabled(False)
+        dialog.user_list.clear()
+        dialog.setProperty("users_cursor", None)
+        if not dialog.property("users_paged"):
+            dialog.setProperty("users_paged", True)
+            scroll_bar = dialog.user_list.verticalScrollBar()
+            scroll_bar.valueChanged.connect(lambda _: self.load_more_users(dialog))
         QtWidgets.QApplication.processEvents()
+        self._users_generation += 1
+        self.load_users_page(dialog, None)
+
+    def load_users_page(self, dialog, cursor):
+        generation = self._users_generation
+        dialog.setProperty("users_loading", True)
 
         def on_complete():
+            dialog.setProperty("users_loading", False)
             dialog.user_list.setEnabled(True)
 
-        def on_success(users):
-            dialog.user_list.clear()
-            for user in users:
+        def on_success(page):
+            if generation != self._users_generation:
+                return
+            for user in page:
                 item = QtWidgets.QListWidgetItem()
-                item.setText(f"{user['username']} ({user['role']})")
+                item.setText(f"{user.username} ({user.role})")
                 item.setData(QtCore.Qt.UserRole, user)
                 dialog.user_list.addItem(item)
+            dialog.setProperty("users_cursor", page.next_cursor)
             on_complete()
+            QtCore.QTimer.singleShot(0, lambda: self.load_more_users(dialog))
 
         def on_error(error):
             print(f"Failed to get user list: {error}")
             on_complete()
 
         self.run_api_task(
-            self.model.get_all_users,
+            self.model.get_users_page,
+            cursor,
+            budget=self.READ_BUDGET,
             success_callback=on_success,
             error_callback=on_error,
         )
 
+    def load_more_users(self, dialog):
+        cursor = dialog.property("users_cursor")
+        if not cursor or dialog.property("users_loading"):
+            return
+        scroll_bar = dialog.user_list.verticalScrollBar()
+        if scroll_bar.maximum() - scroll_bar.value() > self.SCROLL_THRESHOLD:
+            return
+        self.load_users_page(dialog, cursor)
+
     def add_user(self, dialog, parent_dialog):
         username = dialog.username_edit.text().strip()
         password = dialog.password_edit.text().strip()
@@ -917,7 +1208,7 @@ class UserManager(BaseManager):
             if result:
 
                 def on_get_user_success(users):
-                    user = next((u for u in users if u["username"] == username), None)
+                    user = next((u for u in users if u.username == username), None)
                     if user:
                         item = QtWidgets.QListWidgetItem()
                         item.setText(f"{username} ({role})")
@@ -932,6 +1223,7 @@ class UserManager(BaseManager):
 
                 self.run_api_task(
                     self.model.get_all_users,
+                    budget=self.READ_BUDGET,
                     success_callback=on_get_user_success,
                     error_callback=on_get_user_error,
                 )
@@ -953,8 +1245,8 @@ class UserManager(BaseManager):
 
     def delete_user(self, current_item, parent_dialog):
         user_info = current_item.data(QtCore.Qt.UserRole)
-        user_id = user_info["id"]
-        username = user_info["username"]
+        user_id = user_info.id
+        username = user_info.username
 
         def on_error(error):
             print(f"Failed to delete user {username}: {error}")
@@ -982,21 +1274,21 @@ class UserManager(BaseManager):
 
         def on_success(result):
             if result:
-                user_info.update({"username": new_username, "email": new_email, "role": new_role})
+                updated = user_info.replace(username=new_username, email=new_email, role=new_role)
                 current_item.setText(f"{new_username} ({new_role})")
-                current_item.setData(QtCore.Qt.UserRole, user_info)
-                print(f"User {user_info['username']} updated successfully")
+                current_item.setData(QtCore.Qt.UserRole, updated)
+                print(f"User {updated.username} updated successfully")
                 parent_dialog.user_list.update()
             else:
-                print(f"Failed to update user {user_info['username']}")
+                print(f"Failed to update user {user_info.username}")
 
         def on_error(error):
             print(f"Failed to update user: {error}")
 
         self.run_api_task(
             self.model.update_user,
-            user_info["id"],
-            (new_username if new_username != user_info["username"] else None),
+            user_info.id,
+            (new_username if new_username != user_info.username else None),
             new_password,
             new_email,
             new_role,
@@ -1035,7 +1327,7 @@ class UserManager(BaseManager):
                     on_error(result)
 
         self.run_api_task(
-            self.model.login,
+            self.model.resume_login if init else self.model.login,
             username,
             password,
             success_callback=on_success,
@@ -1061,7 +1353,7 @@ class UserManager(BaseManager):
     def show_delete_user_dialog(self, parent_dialog, item=None):
         if not item:
             item = parent_dialog.user_list.currentItem()
-            name = item.data(QtCore.Qt.UserRole).get("username")
+            name = item.data(QtCore.Qt.UserRole).username
             dialog = self.view.createUI("BaseMessageBox", parent=self.view)
             dialog.deleteUserMessage(name)
             if dialog.exec_() == QtWidgets.QMessageBox.Yes:
@@ -1087,10 +1379,14 @@ class UserManager(BaseManager):
 
 
 class IconManager(BaseManager):
+    BATCH_SIZE = 100
+
     def __init__(self, cons):
         super().__init__(cons)
         self.icon_cache = {}
-        self.pending_loads = {}
+        self.icon_uploads = {}
+        self.icon_labels = {}
+        self.pending_loads = []
         self.loading_icons = set()
 
     def _safe_set_pixmap(self, label, pixmap):
@@ -1104,63 +1400,82 @@ class IconManager(BaseManager):
         except Exception:
             return False
 
-    def _handle_resource_data(self, icon_path: str, icon_label: QtWidgets.QLabel, resource_data: dict):
+    def _handle_resource_data(self, icon_path: str, resource_data: dict):
         try:
             if resource_data and resource_data.get("data"):
                 pixmap = QtGui.QPixmap()
                 if pixmap.loadFromData(resource_data["data"]):
                     self.icon_cache[icon_path] = pixmap
-                    self._safe_set_pixmap(icon_label, pixmap)
+                    for icon_label in self.icon_labels.get(icon_path, ()):
+                        self._safe_set_pixmap(icon_label, pixmap)
         finally:
-            self.loading_icons.discard(icon_path)
-            self._process_next_load()
-
-    def _process_next_load(self):
-        if not self.pending_loads:
+            self._discard_load(icon_path)
+
+    def _discard_load(self, icon_path: str):
+        self.loading_icons.discard(icon_path)
+        self.icon_labels.pop(icon_path, None)
+
+    def _process_pending_loads(self):
+        pending_loads, self.pending_loads = self.pending_loads, []
+        for index in range(0, len(pending_loads), self.BATCH_SIZE):
+            self._load_resource_icons(pending_loads[index : index + self.BATCH_SIZE])
+
+    def prime(self, resources):
+        for resource_id, resource_data in (resources or {}).items():
+            icon_path = f"/resources/{resource_id}"
+            if icon_path in self.icon_cache or not resource_data or not resource_data.get("data"):
+                continue
+            pixmap = QtGui.QPixmap()
+            if pixmap.loadFromData(resource_data["data"]):
+                self.icon_cache[icon_path] = pixmap
+
+    def _load_resource_icons(self, icon_paths):
+        resource_paths = dict()
+        for icon_path in icon_paths:
+            try:
+                resource_paths[int(icon_path.split("/")[-1])] = icon_path
+            except ValueError:
+                self._discard_load(icon_path)
+        if not resource_paths:
             return
 
-        icon_path, icon_label = self.pending_loads.popitem()
-        if icon_path.startswith("/resources/"):
-            self._load_resource_icon(icon_path, icon_label)
-        else:
-            self.loading_icons.discard(icon_path)
-            self._process_next_load()
+        def on_success(resources):
+            resources = resources or {}
+            for resource_id, icon_path in resource_paths.items():
+                self._handle_resource_data(icon_path, resources.get(resource_id))
 
-    def _load_resource_icon(self, icon_path: str, icon_label: QtWidgets.QLabel):
-        def on_success(resource_data):
-            self._handle_resource_data(icon_path, icon_label, resource_data)
+        def on_error(_):
+            for icon_path in resource_paths.values():
+                self._discard_load(icon_path)
 
-        try:
-            resource_id = int(icon_path.split("/")[-1])
-            self.run_api_task(
-                self.model.get_resource,
-                resource_id,
-                success_callback=on_success,
-                error_callback=lambda _: self.loading_icons.discard(icon_path),
-                show_loading=False,
-            )
-        except:
-            self.loading_icons.discard(icon_path)
+        self.run_api_task(
+            self.model.get_resources,
+            tuple(resource_paths),
+            budget=self.READ_BUDGET,
+            success_callback=on_success,
+            error_callback=on_error,
+            show_loading=False,
+        )
 
     def load_icon(self, icon_path: str, icon_label: QtWidgets.QLabel):
         if not icon_path:
             return
 
         if icon_path in self.icon_cache:
-            if not self._safe_set_pixmap(icon_label, self.icon_cache[icon_path]):
-                self.pending_loads[icon_path] = icon_label
+            self._safe_set_pixmap(icon_label, self.icon_cache[icon_path])
+            return
+
+        if not icon_path.startswith("/resources/"):
             return
 
+        self.icon_labels.setdefault(icon_path, []).append(icon_label)
         if icon_path in self.loading_icons:
-            self.pending_loads[icon_path] = icon_label
             return
 
         self.loading_icons.add(icon_path)
-        if icon_path.startswith("/resources/"):
-            self._load_resource_icon(icon_path, icon_label)
-        else:
-            self.loading_icons.discard(icon_path)
-            self._process_next_load()
+        self.pending_loads.append(icon_path)
+        if len(self.pending_loads) == 1:
+            QtCore.QTimer.singleShot(0, self._process_pending_loads)
 
     def upload_icon(self, icon_path: str, on_complete):
         if icon_path.startswith("/resources/"):
@@ -1171,9 +1486,16 @@ class IconManager(BaseManager):
             on_complete(icon_path)
             return
 
+        stat = os.stat(icon_path)
+        upload_key = (icon_path, stat.st_size, stat.st_mtime)
+        if upload_key in self.icon_uploads:
+            on_complete(self.icon_uploads[upload_key])
+            return
+
         def on_success(resource_data):
             if resource_data and resource_data.get("url"):
                 resource_path = resource_data["url"]
+                self.icon_uploads[upload_key] = resource_path
                 on_complete(resource_path)
             else:
                 on_complete(icon_path)
@@ -1218,24 +1540,14 @@ class UpdateCheckWorker(QtCore.QRunnable):
 
 
 class StatusCheckWorker(QtCore.QRunnable):
-    def __init__(self, signals):
+    def __init__(self, signals, probe):
         super().__init__()
         self.signals = signals
+        self.probe = probe
 
     def run(self):
-        import requests
-        import urllib.parse
-
-        api_env_name = os.environ.get("LAUNCHER_API_URL_NAME")
-        wish_graphs_url = os.environ.get(api_env_name)
-        parse = urllib.parse.urlparse(wish_graphs_url)
-        wish_net_url = "{}://{}".format(parse.scheme, parse.netloc)
         try:
-            resp = requests.get(f"{wish_net_url}/ping", timeout=3)
-            if resp.status_code in (200, 204):
-                self.signals.status_signal.emit(True)
-            else:
-                self.signals.status_signal.emit(False)
+            self.signals.status_signal.emit(bool(self.probe()))
         except Exception:
             self.signals.status_signal.emit(False)
 
@@ -1258,56 +1570,180 @@ class CleanCachesWorker(QtCore.QRunnable):
             print(f"Failed to Clean for Caches: {e}")
 
 
+class SubscriptionWorkerSignals(QtCore.QObject):
+    event_signal = QtCore.Signal(object)
+    state_signal = QtCore.Signal(bool)
+
+
+class SubscriptionWorker(object):
+    MIN_BACKOFF = 1
+    MAX_BACKOFF = 60
+
+    def __init__(self, subscribe):
+        self.subscribe = subscribe
+        self.signals = SubscriptionWorkerSignals()
+        self._path = None
+        self._stream = None
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._is_running = True
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self.run, name="SubscriptionWorker", daemon=True)
+        self._thread.start()
+
+    def watch(self, path):
+        with self._lock:
+            if path == self._path:
+                return
+            self._path = path
+            stream = self._stream
+        self._wakeup.set()
+        if stream:
+            stream.close()
+
+    def _listen(self, path, since):
+        try:
+            stream = self.subscribe(path, since)
+        except Exception:
+            return since, False
+        if stream is None:
+            return since, False
+        with self._lock:
+            self._stream = stream
+            if path != self._path or not self._is_running:
+                stream.close()
+        self.signals.state_signal.emit(True)
+        try:
+            for event in stream:
+                since = event.get("id") or since
+                if event.get("event") != "ping":
+                    self.signals.event_signal.emit(event)
+        except Exception:
+            pass
+        finally:
+            with self._lock:
+                self._stream = None
+            stream.close()
+        return since, True
+
+    def run(self):
+        backoff = 0
+        since = None
+        while self._is_running:
+            self._wakeup.clear()
+            path = self._path
+            if path is None:
+                self._wakeup.wait()
+                continue
+            since, connected = self._listen(path, since)
+            if not self._is_running:
+                break
+            if path != self._path:
+                since = None
+                continue
+            self.signals.state_signal.emit(False)
+            backoff = self.MIN_BACKOFF if connected else min(max(backoff * 2, self.MIN_BACKOFF), self.MAX_BACKOFF)
+            self._wakeup.wait(backoff * random.uniform(0.8, 1.2))
+
+    def reconnect(self):
+        with self._lock:
+            stream = self._stream
+        self._wakeup.set()
+        if stream:
+            stream.close()
+
+    def stop(self):
+        self._is_running = False
+        self.reconnect()
+
+
 class TimerWorker(QtCore.QRunnable):
-    def __init__(self):
+    CLEAN_INTERVAL = 3600000
+    CHECK_INTERVAL = 600000
+    STATUS_INTERVAL = 3000
+    REFRESH_INTERVAL = 30000
+    PUSH_REFRESH_INTERVAL = 300000
+    STARTUP_SPREAD = 60000
+    JITTER = 0.1
+
+    def __init__(self, probe, poll_interval=None):
         super().__init__()
+        self.probe = probe
+        self.poll_interval = poll_interval
         self.signals = TimerWorkerSignals()
         self._is_running = True
+        self._push_active = False
         self._init_timers()
 
     def _init_timers(self):
         self.clean_timer = QtCore.QTimer()
+        self.clean_timer.setSingleShot(True)
         self.clean_timer.timeout.connect(self._clean_caches)
-        QtCore.QTimer.singleShot(0, self._clean_caches)
-        self.clean_timer.start(3600000)
+        self.clean_timer.start(random.randint(0, self.STARTUP_SPREAD))
 
         self.check_timer = QtCore.QTimer()
+        self.check_timer.setSingleShot(True)
         self.check_timer.timeout.connect(self._check_updates)
-        QtCore.QTimer.singleShot(0, self._check_updates)
-        self.check_timer.start(600000)
+        self.check_timer.start(random.randint(0, self.STARTUP_SPREAD))
 
         self.refresh_timer = QtCore.QTimer()
+        self.refresh_timer.setSingleShot(True)
         self.refresh_timer.timeout.connect(self._refresh_ui)
-        self.refresh_timer.start(30000)
+        self._schedule(self.refresh_timer, self.refresh_interval)
 
         self.status_timer = QtCore.QTimer()
+        self.status_timer.setSingleShot(True)
         self.status_timer.timeout.connect(self._check_status)
         QtCore.QTimer.singleShot(0, self._check_status)
-        self.status_timer.start(3000)
 
         self.signals.stop_signal.connect(self.stop)
 
+    @property
+    def refresh_interval(self):
+        interval = self.PUSH_REFRESH_INTERVAL if self._push_active else self.REFRESH_INTERVAL
+        advised = self.poll_interval() if self.poll_interval else None
+        if advised:
+            interval = max(interval, int(advised * 1000))
+        return interval
+
+    def _schedule(self, timer, interval):
+        if self._is_running:
+            timer.start(int(interval * random.uniform(1 - self.JITTER, 1 + self.JITTER)))
+
     def _clean_caches(self):
         if not self._is_running:
             return
+        self._schedule(self.clean_timer, self.CLEAN_INTERVAL)
         worker = CleanCachesWorker()
         QtCore.QThreadPool.globalInstance().start(worker)
 
     def _check_updates(self):
         if not self._is_running:
             return
+        self._schedule(self.check_timer, self.CHECK_INTERVAL)
         worker = UpdateCheckWorker(self.signals)
         QtCore.QThreadPool.globalInstance().start(worker)
 
     def _check_status(self):
         if not self._is_running:
             return
-        worker = StatusCheckWorker(self.signals)
+        self._schedule(self.status_timer, self.STATUS_INTERVAL)
+        worker = StatusCheckWorker(self.signals, self.probe)
         QtCore.QThreadPool.globalInstance().start(worker)
 
     def _refresh_ui(self):
-        if self._is_running:
-            self.signals.refresh_signal.emit()
+        if not self._is_running:
+            return
+        self._schedule(self.refresh_timer, self.refresh_interval)
+        self.signals.refresh_signal.emit()
+
+    def set_push_active(self, active):
+        if self._push_active == active:
+            return
+        self._push_active = active
+        self._schedule(self.refresh_timer, self.refresh_interval)
 
     def run(self):
         pass
@@ -1323,12 +1759,47 @@ class TimerWorker(QtCore.QRunnable):
 class TimerManager(BaseManager):
     def __init__(self, cons):
         super().__init__(cons)
-        self.timer_worker = TimerWorker()
+        self.timer_worker = TimerWorker(self.model.check_status, self.model.poll_interval)
         self.timer_worker.signals.check_signal.connect(self.cons.refresh_info)
         self.timer_worker.signals.refresh_signal.connect(self.cons.refresh_view)
         self.timer_worker.signals.status_signal.connect(self.cons.refresh_status)
         self.thread_pool.start(self.timer_worker)
 
+    def set_push_active(self, active):
+        if self.timer_worker:
+            self.timer_worker.set_push_active(active)
+
     def stop(self):
         if self.timer_worker:
             self.timer_worker.signals.stop_signal.emit()
+
+
+class SubscriptionManager(BaseManager):
+    REFRESH_DELAY = 250
+
+    def __init__(self, cons):
+        super().__init__(cons)
+        self._refresh_pending = False
+        self.subscription_worker = SubscriptionWorker(self.model.subscribe)
+        self.subscription_worker.signals.event_signal.connect(self.on_event)
+        self.subscription_worker.signals.state_signal.connect(self.cons.timer_manager.set_push_active)
+        self.subscription_worker.start()
+
+    def watch(self, path):
+        self.subscription_worker.watch(path)
+
+    def reconnect(self):
+        self.subscription_worker.reconnect()
+
+    def on_event(self, event):
+        if self._refresh_pending:
+            return
+        self._refresh_pending = True
+        QtCore.QTimer.singleShot(self.REFRESH_DELAY, self._refresh_view)
+
+    def _refresh_view(self):
+        self._refresh_pending = False
+        self.cons.refresh_view()
+
+    def stop(self):
+        self.subscription_worker.stop()
@@ -1,12 +1,19 @@
 import os
 import json
+import time
+import base64
 import pickle
 import hashlib
+import datetime
+import threading
 import importlib.util
 from functools import wraps
+from .codec import msgpack_dumps, msgpack_loads
+from .session import SessionStore
+from .records import Page, Task, Project, Launcher, TaskTree, ChangeSet, sort_records, pack_record, unpack_record
 
 
-def loaderplugin():
+def loaderplugin(url=None):
     client = None
     if os.environ.get("LAUNCHER_CLIENT_PLUGINS"):
         for plugin_path in os.environ["LAUNCHER_CLIENT_PLUGINS"].split(os.pathsep):
@@ -25,7 +32,18 @@ def loaderplugin():
         from . import client
     if not hasattr(client, "APIClient"):
         raise ImportError("No APIClient found in launcher client module")
-    return client.APIClient()
+    return client.APIClient(url) if url else client.APIClient()
+
+
+def parse_expiry(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        pass
+    expiry = datetime.datetime.fromisoformat(str(value).strip().replace("Z", "+00:00"))
+    if expiry.tzinfo is None:
+        expiry = expiry.replace(tzinfo=datetime.timezone.utc)
+    return expiry.timestamp()
 
 
 def authenticate(func):
@@ -33,12 +51,13 @@ def authenticate(func):
     def wrapper(self, *args, **kwargs):
         if not self.authenticated:
             raise Exception("User not authenticated")
+        generation = self._auth_model.generation
         try:
             return func(self, *args, **kwargs)
         except Exception as e:
             if "Authentication failed" in str(e):
                 try:
-                    if self._auth_model.login(perform=True):
+                    if self._auth_model.reauthenticate(generation):
                         return func(self, *args, **kwargs)
                 except Exception:
                     pass
@@ -59,73 +78,408 @@ def onlineable(func):
     return wrapper
 
 
+def budgetable(func):
+    @wraps(func)
+    def wrapper(self, *args, budget=None, **kwargs):
+        client = self._auth_model._api_client
+        if budget is None or not hasattr(client, "deadline"):
+            return func(self, *args, **kwargs)
+        previous = client.deadline
+        deadline = time.monotonic() + budget
+        client.deadline = deadline if previous is None else min(previous, deadline)
+        try:
+            return func(self, *args, **kwargs)
+        finally:
+            client.deadline = previous
+
+    return wrapper
+
+
+def coalesce(func):
+    @wraps(func)
+    def wrapper(self, *args, **kwargs):
+        if not self._flight_model:
+            return func(self, *args, **kwargs)
+        key = (func.__name__, args, tuple(sorted(kwargs.items())))
+        deadline = getattr(self._auth_model._api_client, "deadline", None)
+        return self._flight_model.run(key, deadline, func, self, *args, **kwargs)
+
+    return wrapper
+
+
 def cacheable(func):
     @wraps(func)
     def wrapper(self, *args, **kwargs):
         if not self._cache_model:
             return func(self, *args, **kwargs)
-        cache_key = self._cache_model._make_cache_key(func.__name__, args, kwargs)
-        cache_path = os.path.join(self._cache_model.CACHE_DIR, f"{cache_key}.pkl")
+        cache_path = self._cache_model._cache_path(func.__name__, args, kwargs)
         if self.online:
-            result = func(self, *args, **kwargs)
-            with open(cache_path, "wb") as f:
-                pickle.dump(result, f)
-            return result
-        else:
-            if os.path.exists(cache_path):
-                with open(cache_path, "rb") as f:
-                    result = pickle.load(f)
-                    return result
+            try:
+                result = func(self, *args, **kwargs)
+            except (ConnectionError, TimeoutError):
+                if not os.path.exists(cache_path):
+                    raise
+            else:
+                self._cache_model.dump_changed(func.__name__, result, args, kwargs)
+                return result
+        return self._cache_model.load(func.__name__, args, kwargs)
 
     return wrapper
 
 
 class CacheModel(object):
+    CACHE_VERSION = 2
+    CACHE_FORMAT = os.environ.get("LAUNCHER_CACHE_FORMAT", "pickle")
     if os.environ.get("LAUNCHER_TEMP"):
         CACHE_DIR = os.environ["LAUNCHER_TEMP"]
     else:
         CACHE_DIR = os.path.join(os.path.dirname(__file__), "cache")
 
-    def __init__(self):
+    def __init__(self, namespace=None):
+        if namespace:
+            self.CACHE_DIR = os.path.join(type(self).CACHE_DIR, namespace)
         os.makedirs(self.CACHE_DIR, exist_ok=True)
+        self._dumped = dict()
 
     def _make_cache_key(self, func_name, args, kwargs):
         try:
             params_str = json.dumps({"args": args, "kwargs": kwargs})
         except Exception:
             params_str = str((args, kwargs))
-        key_raw = func_name + params_str
+        key_raw = f"{self.CACHE_VERSION}{func_name}{params_str}"
         key_hash = hashlib.md5(key_raw.encode("utf-8")).hexdigest()
         return key_hash
 
+    def _cache_path(self, func_name, args=(), kwargs=None):
+        cache_key = self._make_cache_key(func_name, args, kwargs or {})
+        extension = "msgpack" if self.CACHE_FORMAT == "msgpack" else "pkl"
+        return os.path.join(self.CACHE_DIR, f"{cache_key}.{extension}")
+
+    def load(self, func_name, args=(), kwargs=None):
+        cache_path = self._cache_path(func_name, args, kwargs)
+        if os.path.exists(cache_path):
+            with open(cache_path, "rb") as f:
+                if self.CACHE_FORMAT == "msgpack":
+                    return msgpack_loads(f.read(), unpack_record)
+                return pickle.load(f)
+
+    def dump(self, func_name, result, args=(), kwargs=None):
+        cache_path = self._cache_path(func_name, args, kwargs)
+        temp_path = f"{cache_path}.{threading.get_ident()}.tmp"
+        with open(temp_path, "wb") as f:
+            if self.CACHE_FORMAT == "msgpack":
+                f.write(msgpack_dumps(result, pack_record))
+            else:
+                pickle.dump(result, f)
+        os.replace(temp_path, cache_path)
+
+    def dump_changed(self, func_name, result, args=(), kwargs=None):
+        cache_path = self._cache_path(func_name, args, kwargs)
+        if self._dumped.get(cache_path) is result and os.path.exists(cache_path):
+            return False
+        self.dump(func_name, result, args, kwargs)
+        self._dumped[cache_path] = result
+        return True
+
+
+class FlightModel(object):
+    class Flight(object):
+        def __init__(self):
+            self.event = threading.Event()
+            self.result = None
+            self.error = None
 
-class AuthModel(object):
     def __init__(self):
-        self._api_client = loaderplugin()
+        self._lock = threading.Lock()
+        self._flights = dict()
+
+    def run(self, key, deadline, func, *args, **kwargs):
+        try:
+            hash(key)
+        except TypeError:
+            return func(*args, **kwargs)
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = self.Flight()
+        if not leader:
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            if not flight.event.wait(timeout):
+                raise TimeoutError("Deadline exceeded")
+            if flight.error:
+                raise flight.error
+            return flight.result
+        try:
+            flight.result = func(*args, **kwargs)
+            return flight.result
+        except Exception as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                self._flights.pop(key, None)
+            flight.event.set()
+
+
+class SyncModel(object):
+    FRESH_SECONDS = 5
+
+    def __init__(self, cache_model=None):
+        self._cache_model = cache_model
+        self._lock = threading.Lock()
+        self._states = dict()
+        self._items = dict()
+        self._fresh = dict()
+        self._unsupported = False
+
+    def _state(self, scope):
+        state = self._states.get(scope)
+        if state is None:
+            if self._cache_model:
+                state = self._cache_model.load("sync", (scope,))
+            state = state or {"cursor": None, "revision": 0, "entities": {}}
+            self._states[scope] = state
+        return state
+
+    def _fetch_changes(self, state, fetch_changes, decode):
+        changes = fetch_changes(state["cursor"])
+        if changes is None:
+            self._unsupported = True
+            return None
+        if changes.reset:
+            entities = {record.id: record for record in map(decode, changes.upserted)}
+            return changes.cursor, entities, None
+        entities = dict(state["entities"])
+        upserted, deleted = list(), list()
+        for record in map(decode, changes.upserted):
+            if entities.get(record.id) != record:
+                entities[record.id] = record
+                upserted.append(record)
+        for record_id in changes.deleted:
+            if entities.pop(record_id, None) is not None:
+                deleted.append(record_id)
+        return changes.cursor, entities, (upserted, deleted)
+
+    def _fetch(self, state, online, fetch_changes, fetch_full, decode):
+        if online and fetch_changes and not self._unsupported:
+            try:
+                fetched = self._fetch_changes(state, fetch_changes, decode)
+            except (ConnectionError, TimeoutError):
+                if not state["entities"]:
+                    raise
+                return None
+            if fetched is not None:
+                return fetched
+        if not online and state["entities"]:
+            return None
+        records = fetch_full()
+        if records is None:
+            return None
+        return None, {record.id: record for record in records}, None
+
+    def seed(self, scope, records):
+        entities = {record.id: record for record in records}
+        with self._lock:
+            state = self._state(scope)
+            if entities != state["entities"]:
+                state = {"cursor": state["cursor"], "revision": state["revision"] + 1, "entities": entities}
+                self._states[scope] = state
+                if self._cache_model:
+                    self._cache_model.dump("sync", state, (scope,))
+            self._fresh[scope] = time.monotonic() + self.FRESH_SECONDS
+
+    def sync(self, scope, cursor, online, fetch_changes, fetch_full, decode, build):
+        with self._lock:
+            state = self._state(scope)
+            fresh = self._fresh.pop(scope, 0) > time.monotonic()
+        fetched = None if fresh else self._fetch(state, online, fetch_changes, fetch_full, decode)
+        with self._lock:
+            state = self._state(scope)
+            previous = f"{scope}@{state['revision']}"
+            upserted, deleted = list(), list()
+            if fetched is not None:
+                server_cursor, entities, delta = fetched
+                if delta is None:
+                    old = state["entities"]
+                    deleted = [record_id for record_id in old if record_id not in entities]
+                    upserted = [record for record_id, record in entities.items() if old.get(record_id) != record]
+                else:
+                    upserted, deleted = delta
+                revision = state["revision"] + 1 if upserted or deleted else state["revision"]
+                if revision != state["revision"] or server_cursor != state["cursor"]:
+                    state = {"cursor": server_cursor, "revision": revision, "entities": entities}
+                    self._states[scope] = state
+                    if self._cache_model:
+                        self._cache_model.dump("sync", state, (scope,))
+            token = f"{scope}@{state['revision']}"
+            items = self._items.get(scope)
+            if items is None or items[0] != token:
+                items = self._items[scope] = (token, build(state["entities"].values()) if state["entities"] else None)
+        return ChangeSet(token, upserted, deleted, cursor != previous, items[1])
+
+
+class AuthModel(object):
+    REFRESH_MARGIN = 60
+    MIN_REFRESH = 5
+    EXPIRY_KEYS = ("expires_at", "expires_in")
+
+    def __init__(self, url=None, namespace=None):
+        self._api_client = loaderplugin(url)
         self._online = False
+        self._lock = threading.RLock()
+        self._generation = 0
+        self._expires_at = None
+        self._refresh_timer = None
+        self._session_store = SessionStore(getattr(self._api_client, "base_url", ""), namespace)
         self.logout()
 
+    @property
+    def generation(self):
+        return self._generation
+
+    @property
+    def token_valid(self):
+        if not self._authenticated:
+            return False
+        return self._expires_at is None or self._expires_at - time.time() > self.REFRESH_MARGIN
+
     def logout(self):
+        if getattr(self, "_username", None):
+            self._session_store.clear()
+        self._cancel_refresh()
         self._role = None
         self._username = None
         self._password = None
         self._response = None
+        self._expires_at = None
         self._authenticated = False
 
     def login(self, username=None, password=None, response=None, perform=True):
-        if username:
+        with self._lock:
+            if username:
+                self._username = username
+            if password:
+                self._password = password
+            if response:
+                self._set_response(response)
+            if self._online and self._username and self._password and perform:
+                self._set_response(self._api_client.login(self._username, self._password))
+            if self._response and "token" in self._response:
+                self._role = self._response.get("role", "member")
+                self._authenticated = True
+                return True
+
+    def connect(self):
+        with self._lock:
+            if not self.token_valid and self._username and self._password:
+                try:
+                    response = self._api_client.login(self._username, self._password)
+                except (ConnectionError, TimeoutError) as e:
+                    print(f"Failed to log in: {e}")
+                    return False
+                except Exception as e:
+                    print(f"Failed to log in: {e}")
+                    return False
+                self.login(response=response, perform=False)
+            self._online = True
+            return True
+
+    def restore(self, username, password):
+        handle_token = getattr(self._api_client, "_handle_token", None)
+        session = self._session_store.load(username)
+        if handle_token is None or not session or "token" not in (session.get("response") or {}):
+            return False
+        with self._lock:
             self._username = username
-        if password:
             self._password = password
-        if response:
-            self._response = response
-        if self._online and self._username and self._password and perform:
-            self.response = self._api_client.login(self._username, self._password)
-        if self._response and "token" in self._response:
+            handle_token(session["response"]["token"])
+            self._set_response(session["response"], persist=False)
             self._role = self._response.get("role", "member")
             self._authenticated = True
             return True
 
+    def reauthenticate(self, generation):
+        with self._lock:
+            if generation != self._generation:
+                return self._authenticated
+            return self.login(perform=True)
+
+    def refresh(self):
+        with self._lock:
+            self._refresh_timer = None
+            if not self._authenticated:
+                return
+            if not self._online:
+                self._schedule_refresh(self.MIN_REFRESH * 6)
+                return
+            response = None
+            refresh_token = getattr(self._api_client, "refresh_token", None)
+            try:
+                if refresh_token:
+                    response = refresh_token()
+            except Exception:
+                response = None
+            try:
+                if response and "token" in response:
+                    previous = {key: value for key, value in self._response.items() if key not in self.EXPIRY_KEYS}
+                    self._set_response(dict(previous, **response))
+                else:
+                    self.login(perform=True)
+            except Exception as e:
+                print(f"Failed to refresh token: {e}")
+                self._schedule_refresh(self.MIN_REFRESH * 6)
+
+    def _set_response(self, response, persist=True):
+        self._response = response
+        self._generation += 1
+        self._expires_at = self._token_expiry(response)
+        if self._expires_at is not None:
+            self._schedule_refresh(self._expires_at - time.time() - self.REFRESH_MARGIN)
+        if persist and self._username and response and "token" in response:
+            try:
+                self._session_store.save(self._username, response, self._expires_at)
+            except Exception as e:
+                print(f"Failed to save session: {e}")
+
+    def _token_expiry(self, response):
+        if not response:
+            return None
+        try:
+            if response.get("expires_at"):
+                return parse_expiry(response["expires_at"])
+            if response.get("expires_in"):
+                return time.time() + float(response["expires_in"])
+        except (TypeError, ValueError):
+            pass
+        try:
+            payload = response["token"].split(".")[1]
+            claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+            return float(claims["exp"])
+        except Exception:
+            return None
+
+    def _schedule_refresh(self, delay):
+        self._cancel_refresh()
+        self._refresh_timer = threading.Timer(max(delay, self.MIN_REFRESH), self.refresh)
+        self._refresh_timer.daemon = True
+        self._refresh_timer.start()
+
+    def _cancel_refresh(self):
+        timer, self._refresh_timer = self._refresh_timer, None
+        if timer:
+            timer.cancel()
+
+
+class EnvironmentModel(object):
+    def __init__(self, name, url=None):
+        self.name = name
+        self.auth_model = AuthModel(url, name)
+        self.cache_model = CacheModel(name)
+        self.auth_model._api_client.cache_model = self.cache_model
+        self.flight_model = FlightModel()
+        self.sync_model = SyncModel(self.cache_model)
+
 
 class MainModel(object):
     class UserRole:
@@ -139,12 +493,66 @@ class MainModel(object):
         2: "admin",
     }
 
+    ENVIRONMENTS = {
+        0: "default",
+        2: "test",
+    }
+
     def __init__(self):
-        self._auth_model = AuthModel()
-        self._cache_model = CacheModel()
+        self._environment = None
+        self._environments = dict()
+        self.switch_environment(0)
+
+    @property
+    def _auth_model(self):
+        return self._environment.auth_model
+
+    @property
+    def _cache_model(self):
+        return self._environment.cache_model
+
+    @property
+    def _flight_model(self):
+        return self._environment.flight_model
+
+    @property
+    def _sync_model(self):
+        return self._environment.sync_model
+
+    @property
+    def environment(self):
+        return self._environment.name
+
+    def switch_environment(self, index):
+        name = self.ENVIRONMENTS.get(int(index))
+        if name is None:
+            return False
+        url = None
+        if name != "default":
+            url_name = f"{os.environ.get('LAUNCHER_API_URL_NAME') or 'WISH_RESTAPI_URL'}_{name.upper()}"
+            url = os.environ.get(url_name)
+            if not url:
+                print(f"{url_name} is not set, using the default API for the {name} environment")
+                name = "default"
+        if self._environment is not None and self._environment.name == name:
+            return False
+        environment = self._environments.get(name)
+        if environment is None:
+            environment = self._environments[name] = EnvironmentModel(name, url)
+        previous, self._environment = self._environment, environment
+        if previous is not None and previous.auth_model._authenticated and not environment.auth_model._authenticated:
+            environment.auth_model.login(previous.auth_model._username, previous.auth_model._password, perform=False)
+        return True
+
+    def resume_session(self):
+        auth_model = self._auth_model
+        if auth_model._authenticated or not auth_model._username:
+            return auth_model._authenticated
+        return auth_model.restore(auth_model._username, auth_model._password)
 
     def logout(self):
-        return self._auth_model.logout()
+        for environment in self._environments.values():
+            environment.auth_model.logout()
 
     @property
     def user_role(self):
@@ -160,132 +568,348 @@ class MainModel(object):
 
     @online.setter
     def online(self, status):
-        self._auth_model._online = status
-        self._auth_model.login()
+        if not status:
+            self._auth_model._online = False
+        elif self.check_status():
+            self._auth_model.connect()
+
+    def restore_session(self, username, password):
+        return self._auth_model.restore(username, password)
+
+    def check_status(self):
+        return self._auth_model._api_client.probe()
 
+    def poll_interval(self):
+        return getattr(self._auth_model._api_client, "poll_interval", None)
+
+    @authenticate
+    def subscribe(self, path, since=None):
+        subscribe = getattr(self._auth_model._api_client, "subscribe", None)
+        if subscribe is None or not self.online:
+            return None
+        return subscribe(path, since)
+
+    @budgetable
     def login(self, username, password):
-        response = self.prelogin(username, password)
+        try:
+            response = self.prelogin(username, password)
+        except (ConnectionError, TimeoutError):
+            if self.restore_session(username, password):
+                return True
+            raise
         if response and "token" in response:
             return self._auth_model.login(username, password, response, perform=False)
         raise Exception("User not authenticated")
 
-    @cacheable
+    @budgetable
+    def resume_login(self, username, password):
+        if self.restore_session(username, password):
+            return True
+        return self.login(username, password)
+
+    @budgetable
+    @coalesce
     def prelogin(self, username, password):
         response = self._auth_model._api_client.login(username, password)
         if response and "token" in response:
             return response
         raise Exception("User not authenticated")
 
+    @budgetable
     @cacheable
+    @coalesce
     @authenticate
     def get_all_users(self):
         return self._auth_model._api_client.get_users()
 
+    @budgetable
+    @cacheable
+    @coalesce
+    @authenticate
+    def get_users_page(self, cursor=None):
+        client = self._auth_model._api_client
+        if not hasattr(client, "get_users_page"):
+            return Page(() if cursor else client.get_users())
+        return client.get_users_page(cursor)
+
+    @budgetable
     @onlineable
     @authenticate
     def add_user(self, username, password, email, role="member"):
         return self._auth_model._api_client.create_user(username, password, email, role)
 
+    @budgetable
     @onlineable
     @authenticate
     def delete_user(self, user_id):
         return self._auth_model._api_client.delete_user(user_id)
 
+    @budgetable
     @onlineable
     @authenticate
     def update_user(self, user_id, username, password, email, role):
         return self._auth_model._api_client.update_user(user_id, username, password, email, role)
 
+    @budgetable
     @cacheable
+    @coalesce
     @authenticate
     def get_all_projects(self):
         return self._auth_model._api_client.get_projects()
 
+    @budgetable
+    @coalesce
+    @authenticate
+    def sync_projects(self, cursor=None):
+        return self._sync_model.sync(
+            "projects",
+            cursor,
+            self.online,
+            fetch_changes=self._changes_fetcher("projects"),
+            fetch_full=self.get_all_projects,
+            decode=Project.from_dict,
+            build=sort_records,
+        )
+
+    def _changes_fetcher(self, scope):
+        get_changes = getattr(self._auth_model._api_client, "get_changes", None)
+        if get_changes is None:
+            return None
+        return lambda since: get_changes(scope, since)
+
+    @budgetable
     @cacheable
+    @coalesce
     @authenticate
     def get_project_members(self, project_id):
         return self._auth_model._api_client.get_members(project_id, None)
 
+    @budgetable
     @onlineable
     @authenticate
     def add_project(self, project_name):
         return self._auth_model._api_client.create_project(project_name)
 
+    @budgetable
     @onlineable
     @authenticate
     def update_project(self, project_id, project_name):
         return self._auth_model._api_client.update_project(project_id, project_name)
 
+    @budgetable
     @onlineable
     @authenticate
     def delete_project(self, project_id):
         return self._auth_model._api_client.delete_project(project_id)
 
+    @budgetable
     @onlineable
     @authenticate
     def assign_project(self, project_id, user_ids):
         return self._auth_model._api_client.update_project_members(project_id, user_ids)
 
+    @budgetable
+    @onlineable
+    @authenticate
+    def assign_project_delta(self, project_id, add_ids, remove_ids):
+        client = self._auth_model._api_client
+        result = client.patch_project_members(project_id, add_ids, remove_ids)
+        if result is None:
+            members = {member.id for member in client.get_members(project_id, None) or ()}
+            user_ids = sorted((members - set(remove_ids)) | set(add_ids))
+            return client.update_project_members(project_id, user_ids)
+        return result
+
+    @budgetable
     @cacheable
+    @coalesce
     @authenticate
     def get_all_task(self, project_id):
         return self._auth_model._api_client.get_tasks(project_id)
 
+    @budgetable
+    @coalesce
+    @authenticate
+    def sync_tasks(self, project_id, cursor=None):
+        return self._sync_model.sync(
+            f"tasks:{project_id}",
+            cursor,
+            self.online,
+            fetch_changes=self._changes_fetcher(f"tasks:{project_id}"),
+            fetch_full=lambda: self.get_all_task(project_id),
+            decode=Task.from_dict,
+            build=lambda tasks: TaskTree(project_id, tasks),
+        )
+
+    @budgetable
+    @cacheable
+    @coalesce
+    @authenticate
+    def get_context(self, project_id, task_id=None, path=None, with_tasks=True):
+        return self._auth_model._api_client.get_context(project_id, task_id, path, with_tasks)
+
+    @budgetable
+    @authenticate
+    def open_context(self, project_id, task_id=None, path=None, with_tasks=True):
+        project_id, task_id = int(project_id), int(task_id) if task_id else None
+        context = self.get_context(project_id, task_id, path, with_tasks)
+        if context is None:
+            return None
+        if context.tasks is not None:
+            self._sync_model.seed(f"tasks:{project_id}", context.tasks)
+        self._sync_model.seed(f"launchers:{context.path}", context.launchers.values())
+        if self._cache_model:
+            for resource_id, resource_data in context.resources.items():
+                self._cache_model.dump("get_resource", resource_data, (resource_id,))
+        return context
+
+    @budgetable
     @cacheable
+    @coalesce
     @authenticate
     def get_task_members(self, project_id, task_id):
         return self._auth_model._api_client.get_members(project_id, task_id)
 
+    @budgetable
+    @cacheable
+    @coalesce
+    @authenticate
+    def get_membership(self, project_id):
+        get_membership = getattr(self._auth_model._api_client, "get_membership", None)
+        return get_membership(project_id) if get_membership else None
+
+    def _update_membership(self, project_id, task_id, add_ids, remove_ids):
+        if not self._cache_model:
+            return
+        membership = self._cache_model.load("get_membership", (project_id,))
+        if membership is not None:
+            membership = membership.with_task_members(task_id, add_ids, remove_ids)
+            self._cache_model.dump("get_membership", membership, (project_id,))
+
+    @budgetable
     @onlineable
     @authenticate
     def add_task(self, title, project_id, parent_id):
         return self._auth_model._api_client.create_task(title, project_id, parent_id)
 
+    @budgetable
     @onlineable
     @authenticate
     def update_task(self, project_id, task_id, task_name):
         return self._auth_model._api_client.update_task(project_id, task_id, task_name)
 
+    @budgetable
     @onlineable
     @authenticate
     def delete_task(self, project_id, task_id):
         return self._auth_model._api_client.delete_task(project_id, task_id)
 
+    @budgetable
     @onlineable
     @authenticate
     def assign_task(self, project_id, task_id, user_ids):
         return self._auth_model._api_client.update_task_members(project_id, task_id, user_ids)
 
+    @budgetable
+    @onlineable
+    @authenticate
+    def assign_task_delta(self, project_id, task_id, add_ids, remove_ids):
+        client = self._auth_model._api_client
+        result = client.patch_task_members(project_id, task_id, add_ids, remove_ids)
+        if result is None:
+            members = {member.id for member in client.get_members(project_id, task_id) or ()}
+            user_ids = sorted((members - set(remove_ids)) | set(add_ids))
+            result = client.update_task_members(project_id, task_id, user_ids)
+        if result:
+            self._update_membership(project_id, task_id, add_ids, remove_ids)
+        return result
+
+    @budgetable
     @cacheable
+    @coalesce
     @authenticate
     def get_resource(self, resource_id):
         return self._auth_model._api_client.get_resource(resource_id)
 
+    @budgetable
+    @coalesce
+    @authenticate
+    def get_resources(self, resource_ids):
+        resources = dict()
+        if self.online:
+            try:
+                resources = self._auth_model._api_client.get_resources(resource_ids)
+            except (ConnectionError, TimeoutError):
+                pass
+            else:
+                for resource_id, resource_data in resources.items():
+                    if self._cache_model and resource_data:
+                        self._cache_model.dump("get_resource", resource_data, (resource_id,))
+        for resource_id in resource_ids:
+            if resource_id not in resources and self._cache_model:
+                resources[resource_id] = self._cache_model.load("get_resource", (resource_id,))
+        return resources
+
+    @budgetable
     @onlineable
     @authenticate
     def upload_resource(self, icon_path, resource_type="image"):
         return self._auth_model._api_client.upload_resource(icon_path, resource_type)
 
+    @budgetable
     @cacheable
+    @coalesce
     @authenticate
     def get_launchers(self, path):
         return self._auth_model._api_client.get_launchers(path)
 
+    @budgetable
+    @coalesce
+    @authenticate
+    def sync_launchers(self, path, cursor=None):
+        def fetch_launchers():
+            launchers = self.get_launchers(path)
+            return None if launchers is None else launchers.values()
+
+        return self._sync_model.sync(
+            f"launchers:{path}",
+            cursor,
+            self.online,
+            fetch_changes=self._changes_fetcher(f"launchers:{path}"),
+            fetch_full=fetch_launchers,
+            decode=lambda data: Launcher.from_dict(data.get("name"), data),
+            build=lambda launchers: {launcher.name: launcher for launcher in sort_records(launchers)},
+        )
+
+    @budgetable
     @onlineable
     @authenticate
     def create_launcher(self, name, path, vdata):
         return self._auth_model._api_client.create_launcher(name, path, vdata)
 
+    @budgetable
     @onlineable
     @authenticate
     def update_launcher(self, launcher_id, name, path, vdata):
         return self._auth_model._api_client.update_launcher(launcher_id, name, path, vdata)
 
+    @budgetable
+    @onlineable
+    @authenticate
+    def patch_launcher(self, launcher_id, name, path, operations, vdata):
+        client = self._auth_model._api_client
+        result = client.patch_launcher(launcher_id, path, operations, name)
+        if result is None:
+            return client.update_launcher(launcher_id, name, path, vdata)
+        return result
+
+    @budgetable
     @onlineable
     @authenticate
     def delete_launcher(self, launcher_id, path):
         return self._auth_model._api_client.delete_launcher(launcher_id, path)
 
+    @budgetable
     @onlineable
     @authenticate
     def toggle_launcher(self, launcher_id, path, action="disable"):
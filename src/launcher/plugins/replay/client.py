@@ -0,0 +1,18 @@
+import os
+from launcher import client
+from launcher.replay import FaultInjector, RecordingSession, ReplaySession
+
+
+class APIClient(client.APIClient):
+    def __init__(self, url=None):
+        super().__init__(url)
+        mode = os.environ.get("LAUNCHER_REPLAY_MODE", "replay").lower()
+        cassette = os.environ.get("LAUNCHER_CASSETTE") or os.path.join(
+            os.environ.get("LAUNCHER_TEMP", "."), "launcher-cassette.jsonl"
+        )
+        faults = FaultInjector.from_env()
+        if mode == "record":
+            self.session = RecordingSession(self.session, cassette, faults)
+        else:
+            speed = float(os.environ.get("LAUNCHER_REPLAY_SPEED", "1"))
+            self.session = ReplaySession(cassette, speed, faults)
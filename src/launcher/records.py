@@ -0,0 +1,353 @@
+import sys
+import collections
+from .codec import ExtType, msgpack_dumps, msgpack_loads
+
+LAST = sys.maxsize
+RECORD_EXT = 1
+TUPLE_EXT = 2
+
+
+def sort_key(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return LAST
+
+
+def intern(value):
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+class Record(object):
+    __slots__ = ()
+
+    def _values(self):
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __eq__(self, other):
+        return type(self) is type(other) and self._values() == other._values()
+
+    def __ne__(self, other):
+        return not self == other
+
+    __hash__ = None
+
+    def __repr__(self):
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+
+class Project(Record):
+    __slots__ = ("id", "name", "sort_key")
+
+    def __init__(self, id, name):
+        self.id = id
+        self.name = name
+        self.sort_key = sort_key(id)
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data.get("id"), data.get("name"))
+
+
+class Task(Record):
+    __slots__ = ("id", "title", "parent_id", "sort_key")
+
+    def __init__(self, id, title, parent_id=None):
+        self.id = id
+        self.title = title
+        self.parent_id = parent_id
+        self.sort_key = sort_key(id)
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data["id"], data["title"], data.get("parent_id"))
+
+
+class Version(Record):
+    __slots__ = ("cmd", "icon")
+
+    def __init__(self, cmd="", icon=""):
+        self.cmd = intern(cmd or "")
+        self.icon = intern(icon or "")
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data.get("cmd"), data.get("icon"))
+
+    def to_dict(self):
+        return {"cmd": self.cmd, "icon": self.icon}
+
+
+class Launcher(Record):
+    __slots__ = ("id", "name", "vdata", "disabled", "enabled", "sort_key")
+
+    def __init__(self, id, name, vdata, disabled=(), enabled=()):
+        self.id = id
+        self.name = intern(name)
+        self.vdata = vdata
+        self.disabled = tuple(intern(path) for path in disabled)
+        self.enabled = tuple(intern(path) for path in enabled)
+        self.sort_key = sort_key(id)
+
+    @classmethod
+    def from_dict(cls, name, data):
+        data = data or {}
+        relations = data.get("relations") or {}
+        vdata = dict()
+        for version, value in (data.get("vdata") or {}).items():
+            vdata[intern(version)] = Version.from_dict(value or {})
+        return cls(data.get("id"), name, vdata, relations.get("disabled", ()), relations.get("enabled", ()))
+
+    def to_vdata(self):
+        return {version: data.to_dict() for version, data in self.vdata.items()}
+
+    def version_operations(self, vdata):
+        operations = list()
+        for version in self.vdata:
+            if version not in vdata:
+                operations.append({"op": "remove", "version": version})
+        for version, data in vdata.items():
+            current = Version.from_dict(data)
+            if version not in self.vdata:
+                operations.append(dict(current.to_dict(), op="add", version=version))
+            elif self.vdata[version] != current:
+                operations.append(dict(current.to_dict(), op="modify", version=version))
+        return operations
+
+
+class TaskTree(object):
+    __slots__ = ("project_id", "index", "parents", "children", "depths", "paths", "signature")
+
+    def __init__(self, project_id, items=()):
+        self.project_id = project_id
+        tasks = dict()
+        for item in items:
+            task = item if isinstance(item, Task) else Task.from_dict(item)
+            tasks[task.id] = task
+        children = {None: []}
+        for task in tasks.values():
+            if not task.parent_id:
+                children[None].append(task)
+            elif task.parent_id in tasks:
+                children.setdefault(task.parent_id, []).append(task)
+        for siblings in children.values():
+            siblings.sort(key=lambda task: task.sort_key)
+
+        root_path = str(project_id)
+        self.index = dict()
+        self.parents = dict()
+        self.depths = dict()
+        self.paths = dict()
+        queue = collections.deque((task, None, root_path, 0) for task in children[None])
+        while queue:
+            task, parent_id, parent_path, depth = queue.popleft()
+            if task.id in self.index:
+                continue
+            path = f"{parent_path}/{task.id}"
+            self.index[task.id] = task
+            self.parents[task.id] = parent_id
+            self.depths[task.id] = depth
+            self.paths[task.id] = path
+            for child in children.get(task.id, ()):
+                queue.append((child, task.id, path, depth + 1))
+        self.children = {None: children[None]}
+        for task_id in self.index:
+            if task_id in children:
+                self.children[task_id] = children[task_id]
+        self.signature = tuple((task.id, task.title, task.parent_id) for task in self.index.values())
+
+    @property
+    def roots(self):
+        return self.children[None]
+
+    def __len__(self):
+        return len(self.index)
+
+    def __iter__(self):
+        return iter(self.index.values())
+
+    def __eq__(self, other):
+        if not isinstance(other, TaskTree):
+            return False
+        return self.project_id == other.project_id and self.signature == other.signature
+
+    def __ne__(self, other):
+        return not self == other
+
+    __hash__ = None
+
+    def __getstate__(self):
+        return self.project_id, tuple(self.index.values())
+
+    def __setstate__(self, state):
+        self.__init__(*state)
+
+    def get(self, task_id):
+        return self.index.get(task_id)
+
+    def path(self, task_id=None):
+        return self.paths.get(task_id, str(self.project_id))
+
+
+class User(Record):
+    __slots__ = ("id", "username", "email", "role", "full_name")
+
+    def __init__(self, id, username, email=None, role="member", full_name=None):
+        self.id = id
+        self.username = username
+        self.email = email
+        self.role = intern(role)
+        self.full_name = full_name
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(
+            data.get("id"),
+            data.get("username"),
+            data.get("email"),
+            data.get("role", "member"),
+            data.get("fullName"),
+        )
+
+    def replace(self, **changes):
+        return User(**dict(zip(self.__slots__, self._values()), **changes))
+
+
+class Membership(Record):
+    __slots__ = ("project_id", "users", "tasks", "by_user")
+
+    def __init__(self, project_id, users=(), tasks=None):
+        self.project_id = project_id
+        self.users = {user.id: user for user in users}
+        self.tasks = {task_id: tuple(sorted(user_ids)) for task_id, user_ids in (tasks or {}).items()}
+        self.by_user = dict()
+        for task_id, user_ids in self.tasks.items():
+            for user_id in user_ids:
+                self.by_user.setdefault(user_id, []).append(task_id)
+
+    @classmethod
+    def from_dict(cls, project_id, data):
+        tasks = {int(task_id): user_ids for task_id, user_ids in (data.get("tasks") or {}).items()}
+        return cls(project_id, decode_users(data.get("members") or ()), tasks)
+
+    def members(self, task_id=None):
+        if task_id is None:
+            return list(self.users.values())
+        return [self.users[user_id] for user_id in self.tasks.get(task_id, ()) if user_id in self.users]
+
+    def task_ids(self, user_id):
+        return self.by_user.get(user_id, [])
+
+    def with_task_members(self, task_id, add_ids, remove_ids):
+        tasks = dict(self.tasks)
+        tasks[task_id] = (set(tasks.get(task_id, ())) - set(remove_ids)) | set(add_ids)
+        return Membership(self.project_id, self.users.values(), tasks)
+
+
+class Page(Record):
+    __slots__ = ("items", "next_cursor")
+
+    def __init__(self, items=(), next_cursor=None):
+        self.items = list(items)
+        self.next_cursor = next_cursor
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __len__(self):
+        return len(self.items)
+
+
+class Context(Record):
+    __slots__ = ("project_id", "path", "tasks", "launchers", "resources")
+
+    def __init__(self, project_id, path, tasks=None, launchers=None, resources=None):
+        self.project_id = project_id
+        self.path = path
+        self.tasks = tasks
+        self.launchers = launchers or {}
+        self.resources = resources or {}
+
+    @property
+    def resource_ids(self):
+        return sorted(
+            {
+                int(version.icon.split("/")[-1])
+                for launcher in self.launchers.values()
+                for version in launcher.vdata.values()
+                if version.icon.startswith("/resources/") and version.icon.split("/")[-1].isdigit()
+            }
+        )
+
+
+class ChangeSet(Record):
+    __slots__ = ("cursor", "upserted", "deleted", "reset", "items")
+
+    def __init__(self, cursor=None, upserted=(), deleted=(), reset=False, items=None):
+        self.cursor = cursor
+        self.upserted = tuple(upserted)
+        self.deleted = tuple(deleted)
+        self.reset = reset
+        self.items = items
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data.get("cursor"), data.get("upserted") or (), data.get("deleted") or (), bool(data.get("reset")))
+
+    @property
+    def changed(self):
+        return bool(self.upserted or self.deleted)
+
+
+def sort_records(records):
+    return sorted(records, key=lambda record: record.sort_key)
+
+
+def decode_projects(items):
+    return sorted((Project.from_dict(item) for item in items), key=lambda project: project.sort_key)
+
+
+def decode_launchers(pairs):
+    launchers = [Launcher.from_dict(name, data) for name, data in pairs]
+    launchers.sort(key=lambda launcher: launcher.sort_key)
+    return {launcher.name: launcher for launcher in launchers}
+
+
+def decode_users(items):
+    return [User.from_dict(item) for item in items]
+
+
+def pack_record(value):
+    if isinstance(value, tuple):
+        return ExtType(TUPLE_EXT, msgpack_dumps(list(value), pack_record))
+    if isinstance(value, TaskTree):
+        state = value.__getstate__()
+    elif isinstance(value, Record):
+        state = value._values()
+    else:
+        raise TypeError(f"Cannot serialize {type(value).__name__} to MessagePack")
+    return ExtType(RECORD_EXT, msgpack_dumps([type(value).__name__, list(state)], pack_record))
+
+
+def unpack_record(code, data):
+    if code not in (RECORD_EXT, TUPLE_EXT):
+        return ExtType(code, data)
+    value = msgpack_loads(data, unpack_record)
+    if code == TUPLE_EXT:
+        return tuple(value)
+    name, state = value
+    cls = RECORD_TYPES[name]
+    record = cls.__new__(cls)
+    if cls is TaskTree:
+        record.__setstate__(state)
+    else:
+        for slot, item in zip(cls.__slots__, state):
+            setattr(record, slot, item)
+    return record
+
+
+RECORD_TYPES = {
+    cls.__name__: cls
+    for cls in (Project, Task, Version, Launcher, TaskTree, User, Membership, Page, Context, ChangeSet)
+}
@@ -0,0 +1,352 @@
+import os
+import json
+import time
+import base64
+import hashlib
+import random
+import requests
+import threading
+import collections
+import urllib.parse
+from requests.structures import CaseInsensitiveDict
+from .codec import is_msgpack, msgpack_dumps, msgpack_loads
+
+SCRUBBED = "<scrubbed>"
+SECRET_HEADERS = ("authorization", "cookie", "set-cookie", "proxy-authorization")
+ENCODING_HEADERS = ("content-encoding", "content-length", "transfer-encoding")
+SECRET_KEYS = ("token", "password", "secret", "refresh_token", "access_token", "api_key")
+
+
+def is_secret(key):
+    key = str(key).lower()
+    return any(secret in key for secret in SECRET_KEYS)
+
+
+def scrub_value(value):
+    if isinstance(value, dict):
+        return {key: SCRUBBED if is_secret(key) else scrub_value(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [scrub_value(item) for item in value]
+    return value
+
+
+def scrub_headers(headers):
+    scrubbed = dict()
+    for key, value in (headers or {}).items():
+        if key.lower() not in ENCODING_HEADERS:
+            scrubbed[key] = SCRUBBED if key.lower() in SECRET_HEADERS else value
+    return scrubbed
+
+
+def scrub_url(url):
+    parse = urllib.parse.urlsplit(url)
+    query = urllib.parse.parse_qsl(parse.query, keep_blank_values=True)
+    query = [(key, SCRUBBED if is_secret(key) else value) for key, value in query]
+    return urllib.parse.urlunsplit(("", "", parse.path, urllib.parse.urlencode(query), ""))
+
+
+def scrub_events(data):
+    lines = list()
+    for line in data.split(b"\n"):
+        if line.startswith(b"data:"):
+            payload = line[5:].strip()
+            scrubbed = scrub_body(payload, "application/json")
+            if scrubbed != payload:
+                line = b"data: " + scrubbed
+        lines.append(line)
+    return b"\n".join(lines)
+
+
+def scrub_body(body, content_type):
+    if not body:
+        return body
+    content_type = (content_type or "").lower()
+    try:
+        if is_msgpack(content_type):
+            return msgpack_dumps(scrub_value(msgpack_loads(body)))
+        if "json" in content_type:
+            return json.dumps(scrub_value(json.loads(body))).encode("utf-8")
+        if "event-stream" in content_type:
+            return scrub_events(body)
+        if "x-www-form-urlencoded" in content_type:
+            query = urllib.parse.parse_qsl(body.decode("utf-8"), keep_blank_values=True)
+            query = [(key, SCRUBBED if is_secret(key) else value) for key, value in query]
+            return urllib.parse.urlencode(query).encode("utf-8")
+    except ValueError:
+        pass
+    return body
+
+
+def request_url(url, params=None):
+    if params:
+        params = {key: value for key, value in params.items() if value is not None}
+        url = f"{url}{'&' if '?' in url else '?'}{urllib.parse.urlencode(params, doseq=True)}"
+    return scrub_url(url)
+
+
+def describe_file(value):
+    if isinstance(value, (tuple, list)):
+        filename, content = value[0], value[1]
+    else:
+        filename, content = os.path.basename(getattr(value, "name", "") or ""), value
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+    if not isinstance(content, bytes):
+        position = content.tell()
+        data = content.read()
+        content.seek(position)
+        content = data.encode("utf-8") if isinstance(data, str) else data
+    return {"filename": filename, "size": len(content), "sha256": hashlib.sha256(content).hexdigest()}
+
+
+def request_body(kwargs):
+    if kwargs.get("json") is not None:
+        return scrub_value(kwargs["json"])
+    body = dict()
+    data = kwargs.get("data")
+    if isinstance(data, dict):
+        body["form"] = scrub_value(data)
+    elif isinstance(data, (bytes, str)):
+        data = data.encode("utf-8") if isinstance(data, str) else data
+        content_type = CaseInsensitiveDict(kwargs.get("headers") or {}).get("Content-Type")
+        body["data"] = base64.b64encode(scrub_body(data, content_type)).decode("ascii")
+    elif data is not None:
+        body["data"] = describe_file(data)
+    if kwargs.get("files"):
+        body["files"] = {name: describe_file(value) for name, value in dict(kwargs["files"]).items()}
+    return body or None
+
+
+def make_response(status_code, headers, url, content=None, stream=None):
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers = CaseInsensitiveDict(headers)
+    response.url = url
+    if stream is None:
+        response._content = content
+    else:
+        response.raw = stream
+    return response
+
+
+class FaultInjector(object):
+    def __init__(self, faults=None, seed=None):
+        self.faults = faults or dict()
+        self.random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls):
+        faults = os.environ.get("LAUNCHER_REPLAY_FAULTS")
+        seed = os.environ.get("LAUNCHER_REPLAY_SEED")
+        return cls(json.loads(faults) if faults else None, seed)
+
+    def match(self, method, url):
+        path = urllib.parse.urlsplit(url).path
+        found, rank = self.faults.get("*"), (-1, False)
+        for pattern, fault in self.faults.items():
+            verb, _, prefix = pattern.rpartition(" ")
+            if verb and verb.upper() != method:
+                continue
+            if path.startswith(prefix) and (len(prefix), bool(verb)) > rank:
+                found, rank = fault, (len(prefix), bool(verb))
+        return found
+
+    def apply(self, method, url):
+        fault = self.match(method, url)
+        if not fault:
+            return None
+        with self._lock:
+            delay = fault.get("latency", 0) + self.random.uniform(0, fault.get("jitter", 0))
+            failed = self.random.random() < fault.get("error_rate", 0)
+        if delay > 0:
+            time.sleep(delay)
+        if not failed:
+            return None
+        status = fault.get("status", 503)
+        if not status:
+            raise ConnectionError(f"Injected connection error for {method} {url}")
+        body = json.dumps({"error": "Injected fault"}).encode("utf-8")
+        return make_response(status, {"Content-Type": "application/json"}, url, content=body)
+
+
+class Cassette(object):
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._started = time.monotonic()
+
+    def write(self, entry):
+        entry["offset"] = round(time.monotonic() - self._started, 6)
+        line = json.dumps(entry) + "\n"
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line)
+
+    def read(self):
+        entries = collections.defaultdict(collections.deque)
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    entry = json.loads(line)
+                    entries[(entry["method"], entry["url"])].append(entry)
+        return entries
+
+
+class RecordingStream(object):
+    def __init__(self, raw, entry, cassette, content_type=None):
+        self._raw = raw
+        self._entry = entry
+        self._cassette = cassette
+        self._content_type = content_type
+        self._events = "event-stream" in (content_type or "").lower()
+        self._started = time.monotonic()
+        self._chunks = list()
+        self._pending = b""
+        self._closed = False
+
+    def __getattr__(self, name):
+        return getattr(self._raw, name)
+
+    def _record(self, chunk):
+        if not chunk:
+            return
+        offset = round(time.monotonic() - self._started, 6)
+        if self._events:
+            head, separator, self._pending = (self._pending + chunk).rpartition(b"\n")
+            if not separator:
+                return
+            chunk = scrub_events(head + separator)
+        self._chunks.append([offset, chunk])
+
+    def _finish(self):
+        if self._closed:
+            return
+        self._closed = True
+        if self._pending:
+            offset = round(time.monotonic() - self._started, 6)
+            self._chunks.append([offset, scrub_events(self._pending)])
+        if not self._events and self._chunks:
+            body = b"".join(chunk for _, chunk in self._chunks)
+            scrubbed = scrub_body(body, self._content_type)
+            if scrubbed != body:
+                self._chunks = [[self._chunks[-1][0], scrubbed]]
+        self._entry["chunks"] = [[offset, base64.b64encode(chunk).decode("ascii")] for offset, chunk in self._chunks]
+        self._cassette.write(self._entry)
+
+    def stream(self, amt=65536, decode_content=None):
+        for chunk in self._raw.stream(amt, decode_content=decode_content):
+            self._record(chunk)
+            yield chunk
+        self._finish()
+
+    def read(self, *args, **kwargs):
+        chunk = self._raw.read(*args, **kwargs)
+        if chunk:
+            self._record(chunk)
+        else:
+            self._finish()
+        return chunk
+
+    def close(self):
+        self._raw.close()
+        self._finish()
+
+
+class ReplayStream(object):
+    def __init__(self, chunks, speed):
+        self._chunks = collections.deque(chunks)
+        self._speed = speed
+        self._started = time.monotonic()
+        self._closed = threading.Event()
+
+    def read(self, size=-1):
+        if not self._chunks or self._closed.is_set():
+            return b""
+        offset, chunk = self._chunks.popleft()
+        if self._speed:
+            self._closed.wait(max(0.0, self._started + offset / self._speed - time.monotonic()))
+        return b"" if self._closed.is_set() else base64.b64decode(chunk)
+
+    def close(self):
+        self._closed.set()
+
+
+class RecordingSession(object):
+    def __init__(self, session, path, faults=None):
+        self.session = session
+        self.cassette = Cassette(path)
+        self.faults = faults
+
+    @property
+    def headers(self):
+        return self.session.headers
+
+    def get(self, url, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def request(self, method, url, **kwargs):
+        method = method.upper()
+        if self.faults:
+            response = self.faults.apply(method, url)
+            if response is not None:
+                return response
+        started = time.monotonic()
+        response = self.session.request(method, url, **kwargs)
+        entry = {
+            "method": method,
+            "url": request_url(url, kwargs.get("params")),
+            "request": request_body(kwargs),
+            "status": response.status_code,
+            "headers": scrub_headers(response.headers),
+            "elapsed": round(time.monotonic() - started, 6),
+        }
+        if kwargs.get("stream"):
+            response.raw = RecordingStream(response.raw, entry, self.cassette, response.headers.get("Content-Type"))
+            return response
+        body = scrub_body(response.content, response.headers.get("Content-Type"))
+        entry["body"] = base64.b64encode(body).decode("ascii")
+        self.cassette.write(entry)
+        return response
+
+    def close(self):
+        self.session.close()
+
+
+class ReplaySession(object):
+    def __init__(self, path, speed=1.0, faults=None):
+        self.entries = Cassette(path).read()
+        self.speed = speed
+        self.faults = faults
+        self.headers = dict()
+        self._lock = threading.Lock()
+
+    def get(self, url, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def _next_entry(self, key):
+        with self._lock:
+            entries = self.entries.get(key)
+            if not entries:
+                return None
+            return entries.popleft() if len(entries) > 1 else entries[0]
+
+    def request(self, method, url, **kwargs):
+        method = method.upper()
+        if self.faults:
+            response = self.faults.apply(method, url)
+            if response is not None:
+                return response
+        entry = self._next_entry((method, request_url(url, kwargs.get("params"))))
+        if entry is None:
+            body = json.dumps({"error": "No recorded interaction"}).encode("utf-8")
+            return make_response(404, {"Content-Type": "application/json"}, url, content=body)
+        if self.speed:
+            time.sleep(entry.get("elapsed", 0) / self.speed)
+        headers = entry.get("headers", {})
+        if "chunks" in entry:
+            return make_response(entry["status"], headers, url, stream=ReplayStream(entry["chunks"], self.speed))
+        return make_response(entry["status"], headers, url, content=base64.b64decode(entry.get("body", "")))
+
+    def close(self):
+        pass
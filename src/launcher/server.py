@@ -0,0 +1,904 @@
+import re
+import sys
+import gzip
+import json
+import time
+import uuid
+import base64
+import random
+import hashlib
+import argparse
+import threading
+import collections
+import urllib.parse
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from .codec import MSGPACK_TYPE, msgpack_dumps, iter_multipart, multipart_boundary
+
+ICON_HEADER = b"\x89PNG\r\n\x1a\n"
+
+
+def lineage(path):
+    parts = str(path or "").split("/")
+    return ["/".join(parts[: index + 1]) for index in range(len(parts))]
+
+
+class Production(object):
+    LOG_SIZE = 50000
+    MAX_DEPTH = 4
+
+    def __init__(self, seed=None):
+        self.lock = threading.RLock()
+        self.changed = threading.Condition(self.lock)
+        self.random = random.Random(seed)
+        self.revision = 0
+        self.log = collections.deque(maxlen=self.LOG_SIZE)
+        self.users = dict()
+        self.projects = dict()
+        self.tasks = dict()
+        self.task_paths = dict()
+        self.project_members = dict()
+        self.task_members = dict()
+        self.launchers = dict()
+        self.launcher_paths = collections.defaultdict(set)
+        self.resources = dict()
+        self.resource_hashes = dict()
+        self.uploads = dict()
+        self.tokens = dict()
+        self._ids = collections.defaultdict(int)
+
+    def next_id(self, kind):
+        self._ids[kind] += 1
+        return self._ids[kind]
+
+    def record(self, kind, key, entity_id):
+        self.revision += 1
+        self.log.append((self.revision, kind, key, entity_id))
+        self.changed.notify_all()
+
+    def generate(
+        self,
+        projects=500,
+        tasks=100000,
+        launchers=5000,
+        versions=20,
+        users=200,
+        icons=200,
+        icon_size=4096,
+        cmd_size=0,
+    ):
+        with self.lock:
+            for index in range(users):
+                self.add_user(f"user{index:04d}", None, f"user{index:04d}@example.com", "member", log=False)
+            for index in range(icons):
+                size = max(0, icon_size - len(ICON_HEADER))
+                data = ICON_HEADER + self.random.getrandbits(size * 8).to_bytes(size, "little")
+                self.add_resource(data, "PNG")
+            user_ids = list(self.users)
+            for index in range(projects):
+                project = self.add_project(f"Project {index:04d}", log=False)
+                members = self.random.sample(user_ids, min(len(user_ids), 20))
+                self.project_members[project["id"]] = set(members)
+            project_ids = list(self.projects)
+            per_project = collections.defaultdict(list)
+            for index in range(tasks):
+                project_id = self.random.choice(project_ids)
+                siblings = per_project[project_id]
+                parent_id = None
+                if siblings and self.random.random() > 0.2:
+                    parent_id = self.random.choice(siblings)
+                    if self.task_paths[parent_id].count("/") >= self.MAX_DEPTH:
+                        parent_id = None
+                task = self.add_task(project_id, f"Task {index:06d}", parent_id, log=False)
+                siblings.append(task["id"])
+                members = list(self.project_members[project_id])
+                self.task_members[task["id"]] = set(self.random.sample(members, min(len(members), 5)))
+            paths = [str(project_id) for project_id in project_ids] + list(self.task_paths.values())
+            resource_ids = list(self.resources)
+            for index in range(launchers):
+                path = self.random.choice(paths) if self.random.random() < 0.3 else str(self.random.choice(project_ids))
+                vdata = dict()
+                for version in range(versions):
+                    icon = f"/resources/{self.random.choice(resource_ids)}" if resource_ids else ""
+                    cmd = f"app{index:05d} --version {version}.0" + " -x" * (cmd_size // 3)
+                    vdata[f"{version}.0"] = {"cmd": cmd, "icon": icon}
+                launcher = self.add_launcher(f"App {index:05d}", path, vdata, log=False)
+                if self.random.random() < 0.1:
+                    launcher["relations"]["disabled"].append(self.random.choice(paths))
+        return self
+
+    def add_user(self, username, password, email=None, role="member", full_name=None, log=True):
+        user_id = self.next_id("users")
+        self.users[user_id] = {
+            "id": user_id,
+            "username": username,
+            "email": email,
+            "role": role,
+            "fullName": full_name or username,
+            "password": password,
+        }
+        if log:
+            self.record("users", None, user_id)
+        return self.users[user_id]
+
+    def find_user(self, username):
+        for user in self.users.values():
+            if user["username"] == username:
+                return user
+        return None
+
+    def add_resource(self, data, resource_format="PNG"):
+        digest = hashlib.sha256(data).hexdigest()
+        resource_id = self.resource_hashes.get(digest)
+        if resource_id is None:
+            resource_id = self.next_id("resources")
+            self.resources[resource_id] = {"id": resource_id, "data": data, "format": resource_format}
+            self.resource_hashes[digest] = resource_id
+        return {"id": resource_id, "url": f"/resources/{resource_id}"}
+
+    def add_project(self, name, log=True):
+        project_id = self.next_id("projects")
+        self.projects[project_id] = {"id": project_id, "name": name}
+        self.project_members[project_id] = set()
+        if log:
+            self.record("projects", None, project_id)
+        return self.projects[project_id]
+
+    def add_task(self, project_id, title, parent_id=None, description="", priority=1, log=True):
+        if project_id not in self.projects:
+            raise KeyError(project_id)
+        if parent_id is not None and self.tasks.get(parent_id, {}).get("project_id") != project_id:
+            raise KeyError(parent_id)
+        task_id = self.next_id("tasks")
+        parent_path = self.task_paths[parent_id] if parent_id else str(project_id)
+        self.tasks[task_id] = {
+            "id": task_id,
+            "title": title,
+            "parent_id": parent_id,
+            "project_id": project_id,
+            "description": description,
+            "priority": priority,
+        }
+        self.task_paths[task_id] = f"{parent_path}/{task_id}"
+        self.task_members[task_id] = set()
+        if log:
+            self.record("tasks", project_id, task_id)
+        return self.tasks[task_id]
+
+    def remove_task(self, task_id):
+        task = self.tasks.pop(task_id)
+        self.task_paths.pop(task_id, None)
+        self.task_members.pop(task_id, None)
+        self.record("tasks", task["project_id"], task_id)
+        for child_id in [child["id"] for child in self.tasks.values() if child["parent_id"] == task_id]:
+            self.remove_task(child_id)
+
+    def add_launcher(self, name, path, vdata, log=True):
+        launcher_id = self.next_id("launchers")
+        self.launchers[launcher_id] = {
+            "id": launcher_id,
+            "name": name,
+            "path": str(path),
+            "vdata": dict(vdata or {}),
+            "relations": {"disabled": [], "enabled": []},
+        }
+        self.launcher_paths[str(path)].add(launcher_id)
+        if log:
+            self.record("launchers", str(path), launcher_id)
+        return self.launchers[launcher_id]
+
+    def visible_launchers(self, path):
+        launcher_ids = set()
+        for prefix in lineage(path):
+            launcher_ids.update(self.launcher_paths.get(prefix, ()))
+        return [self.launchers[launcher_id] for launcher_id in sorted(launcher_ids)]
+
+    def task_path(self, project_id, task_id=None):
+        return self.task_paths.get(task_id, str(project_id))
+
+    def scope_items(self, scope):
+        kind, _, key = scope.partition(":")
+        if kind == "projects":
+            return {project["id"]: project for project in self.projects.values()}
+        if kind == "tasks":
+            return {task["id"]: task_json(task) for task in self.tasks.values() if str(task["project_id"]) == key}
+        if kind == "launchers":
+            return {launcher["id"]: launcher_json(launcher) for launcher in self.visible_launchers(key)}
+        raise KeyError(scope)
+
+    def matches(self, scope, kind, key):
+        scope_kind, _, scope_key = scope.partition(":")
+        if scope_kind != kind:
+            return False
+        if kind == "tasks":
+            return str(key) == scope_key
+        if kind == "launchers":
+            return key in lineage(scope_key)
+        return True
+
+    def changes(self, scope, since=None):
+        items = self.scope_items(scope)
+        try:
+            since = int(since) if since else None
+        except ValueError:
+            since = None
+        horizon = self.log[0][0] - 1 if self.log else self.revision
+        if since is None or since < horizon or since > self.revision:
+            return {"cursor": str(self.revision), "upserted": list(items.values()), "deleted": [], "reset": True}
+        touched = list()
+        for revision, kind, key, entity_id in self.log:
+            if revision > since and self.matches(scope, kind, key) and entity_id not in touched:
+                touched.append(entity_id)
+        return {
+            "cursor": str(self.revision),
+            "upserted": [items[entity_id] for entity_id in touched if entity_id in items],
+            "deleted": [entity_id for entity_id in touched if entity_id not in items],
+            "reset": False,
+        }
+
+    def events(self, path, since):
+        project_id = lineage(path)[0] if path else None
+        found = list()
+        for revision, kind, key, entity_id in self.log:
+            if revision <= since:
+                continue
+            if kind == "tasks" and str(key) != project_id:
+                continue
+            if kind == "launchers" and key not in lineage(path):
+                continue
+            found.append({"id": revision, "scope": kind, "path": key, "entity_id": entity_id})
+        return found
+
+    def issue_token(self, user, ttl):
+        token = uuid.uuid4().hex
+        self.tokens[token] = (user["id"], time.time() + ttl)
+        return {"token": token, "role": user["role"], "user_id": user["id"], "expires_in": ttl}
+
+    def authorize(self, header):
+        if not header or not header.startswith("Bearer "):
+            return None
+        user_id, expires_at = self.tokens.get(header[7:], (None, 0))
+        if expires_at <= time.time():
+            return None
+        return self.users.get(user_id)
+
+
+def task_json(task):
+    return {key: task[key] for key in ("id", "title", "parent_id", "description", "priority")}
+
+
+def launcher_json(launcher, versions_key="vdata"):
+    return {
+        "id": launcher["id"],
+        "name": launcher["name"],
+        versions_key: launcher["vdata"],
+        "relations": launcher["relations"],
+    }
+
+
+def user_json(user):
+    return {key: value for key, value in user.items() if key != "password"}
+
+
+class HTTPError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    production = None
+    options = None
+    ROUTES = list()
+
+    def log_message(self, format, *args):
+        if self.options.verbose:
+            super().log_message(format, *args)
+
+    def _delay(self):
+        delay = self.options.latency + random.uniform(0, self.options.jitter)
+        if delay > 0:
+            time.sleep(delay)
+
+    def _dispatch(self, method):
+        parse = urllib.parse.urlsplit(self.path)
+        self.query = dict(urllib.parse.parse_qsl(parse.query, keep_blank_values=True))
+        length = int(self.headers.get("Content-Length") or 0)
+        self.body = self.rfile.read(length) if length else b""
+        self._delay()
+        try:
+            if method == "POST" and parse.path == self.options.graphs_path:
+                return self.graphs()
+            for route_method, pattern, name, public in self.ROUTES:
+                match = pattern.fullmatch(parse.path)
+                if match and route_method == method:
+                    with self.production.lock:
+                        self.user = self.production.authorize(self.headers.get("Authorization"))
+                    if not public and self.user is None:
+                        raise HTTPError(401, "Authentication failed")
+                    args = [int(arg) if arg.isdigit() else arg for arg in match.groups()]
+                    return getattr(self, name)(*args)
+            raise HTTPError(405 if any(p.fullmatch(parse.path) for _, p, _, _ in self.ROUTES) else 404, "Not found")
+        except HTTPError as e:
+            self.send_json({"error": str(e)}, e.status)
+        except KeyError as e:
+            self.send_json({"error": f"Not found: {e}"}, 404)
+        except (ValueError, TypeError) as e:
+            self.send_json({"error": str(e)}, 400)
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def do_PUT(self):
+        self._dispatch("PUT")
+
+    def do_PATCH(self):
+        self._dispatch("PATCH")
+
+    def do_DELETE(self):
+        self._dispatch("DELETE")
+
+    def json_body(self):
+        return json.loads(self.body or b"{}")
+
+    def send_body(self, body, status=200, content_type="application/json", headers=None):
+        if len(body) > 1024 and "gzip" in (self.headers.get("Accept-Encoding") or ""):
+            body = gzip.compress(body, 5)
+            headers = dict(headers or {}, **{"Content-Encoding": "gzip"})
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        if self.options.poll_interval:
+            self.send_header("X-Poll-Interval", str(self.options.poll_interval))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_json(self, value, status=200, etag=False):
+        content_type = "application/json"
+        if not self.options.json_only and MSGPACK_TYPE in (self.headers.get("Accept") or ""):
+            content_type, body = MSGPACK_TYPE, msgpack_dumps(value)
+        else:
+            body = json.dumps(value).encode("utf-8")
+        headers = dict()
+        if etag and status == 200:
+            tag = f'"{hashlib.md5(body).hexdigest()}"'
+            if self.headers.get("If-None-Match") == tag:
+                self.send_response(304)
+                self.send_header("ETag", tag)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            headers["ETag"] = tag
+        self.send_body(body, status, content_type, headers)
+
+    def send_page(self, items, etag=False):
+        limit = int(self.query.get("limit") or 0)
+        cursor = self.query.get("cursor")
+        if cursor:
+            items = [item for item in items if item["id"] > int(cursor)]
+        page = items[:limit]
+        next_cursor = str(page[-1]["id"]) if len(items) > limit and page else None
+        self.send_json({"items": page, "next": next_cursor}, etag=etag)
+
+    def require_admin(self):
+        if self.user["role"] != "admin":
+            raise HTTPError(403, "Permission denied")
+
+    def ping(self):
+        self.send_response(204)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def login(self):
+        data = self.json_body()
+        with self.production.lock:
+            user = self.production.find_user(data.get("username"))
+            if user is None:
+                user = self.production.add_user(data.get("username"), data.get("password"), role=self.options.role)
+            elif user["password"] is not None and user["password"] != data.get("password"):
+                raise HTTPError(401, "Authentication failed")
+            self.send_json(self.production.issue_token(user, self.options.token_ttl))
+
+    def refresh(self):
+        with self.production.lock:
+            self.send_json(self.production.issue_token(self.user, self.options.token_ttl))
+
+    def sync_user(self):
+        data = self.json_body()
+        with self.production.lock:
+            user = self.production.find_user(data.get("username"))
+            if user is None:
+                user = self.production.add_user(data["username"], data.get("password"), role=self.options.role)
+            user.update(email=data.get("email"), fullName=data.get("fullName"), password=data.get("password"))
+            self.send_json(user_json(user))
+
+    def get_users(self):
+        with self.production.lock:
+            users = [user_json(user) for user in self.production.users.values()]
+        if "limit" in self.query:
+            return self.send_page(users)
+        self.send_json(users, etag=True)
+
+    def create_user(self):
+        self.require_admin()
+        data = self.json_body()
+        with self.production.lock:
+            user = self.production.add_user(data["username"], data.get("password"), data.get("email"), data["role"])
+            self.send_json(user_json(user), 201)
+
+    def update_user(self, user_id):
+        self.require_admin()
+        data = self.json_body()
+        with self.production.lock:
+            user = self.production.users[user_id]
+            user.update({key: data[key] for key in ("username", "password", "email", "role") if key in data})
+            self.production.record("users", None, user_id)
+            self.send_json(user_json(user))
+
+    def delete_user(self, user_id):
+        self.require_admin()
+        with self.production.lock:
+            del self.production.users[user_id]
+            self.production.record("users", None, user_id)
+        self.send_json({"success": True})
+
+    def get_projects(self):
+        with self.production.lock:
+            projects = list(self.production.projects.values())
+        if "limit" in self.query:
+            return self.send_page(projects)
+        self.send_json(projects, etag=True)
+
+    def create_project(self):
+        self.require_admin()
+        with self.production.lock:
+            self.send_json(self.production.add_project(self.json_body()["name"]), 201)
+
+    def update_project(self, project_id):
+        self.require_admin()
+        with self.production.lock:
+            project = self.production.projects[project_id]
+            project["name"] = self.json_body()["name"]
+            self.production.record("projects", None, project_id)
+            self.send_json(project)
+
+    def delete_project(self, project_id):
+        self.require_admin()
+        with self.production.lock:
+            del self.production.projects[project_id]
+            for task in [task for task in self.production.tasks.values() if task["project_id"] == project_id]:
+                self.production.tasks.pop(task["id"])
+                self.production.task_paths.pop(task["id"], None)
+                self.production.task_members.pop(task["id"], None)
+            self.production.record("projects", None, project_id)
+        self.send_json({"success": True})
+
+    def get_tasks(self, project_id):
+        with self.production.lock:
+            if project_id not in self.production.projects:
+                raise KeyError(project_id)
+            tasks = [task_json(task) for task in self.production.tasks.values() if task["project_id"] == project_id]
+        self.send_json(tasks, etag=True)
+
+    def create_task(self, project_id):
+        self.require_admin()
+        data = self.json_body()
+        with self.production.lock:
+            task = self.production.add_task(
+                project_id, data["title"], data.get("parent_id"), data.get("description", ""), data.get("priority", 1)
+            )
+            self.send_json(task_json(task), 201)
+
+    def update_task(self, project_id, task_id):
+        self.require_admin()
+        with self.production.lock:
+            task = self.production.tasks[task_id]
+            task["title"] = self.json_body()["title"]
+            self.production.record("tasks", project_id, task_id)
+            self.send_json(task_json(task))
+
+    def delete_task(self, project_id, task_id):
+        self.require_admin()
+        with self.production.lock:
+            self.production.remove_task(task_id)
+        self.send_json({"success": True})
+
+    def _members(self, project_id, task_id=None):
+        if task_id is None:
+            return self.production.project_members[project_id]
+        if self.production.tasks[task_id]["project_id"] != project_id:
+            raise KeyError(task_id)
+        return self.production.task_members[task_id]
+
+    def _send_members(self, member_ids, etag=False):
+        users = self.production.users
+        self.send_json([user_json(users[user_id]) for user_id in sorted(member_ids) if user_id in users], etag=etag)
+
+    def get_members(self, project_id, task_id=None):
+        with self.production.lock:
+            self._send_members(self._members(project_id, task_id), etag=True)
+
+    def get_membership(self, project_id):
+        with self.production.lock:
+            members = self.production.project_members[project_id]
+            users = self.production.users
+            tasks = {
+                str(task["id"]): sorted(self.production.task_members.get(task["id"], ()))
+                for task in self.production.tasks.values()
+                if task["project_id"] == project_id
+            }
+            value = {
+                "members": [user_json(users[user_id]) for user_id in sorted(members) if user_id in users],
+                "tasks": tasks,
+            }
+        self.send_json(value, etag=True)
+
+    def patch_members(self, project_id, task_id=None):
+        self.require_admin()
+        data = self.json_body()
+        with self.production.lock:
+            members = self._members(project_id, task_id)
+            members.difference_update(data.get("remove") or ())
+            members.update(user_id for user_id in data.get("add") or () if user_id in self.production.users)
+            self.production.record("members", project_id, task_id)
+            self._send_members(members)
+
+    def put_members(self, project_id, task_id=None):
+        self.require_admin()
+        data = self.json_body()
+        with self.production.lock:
+            members = self._members(project_id, task_id)
+            members.clear()
+            members.update(user_id for user_id in data.get("user_ids") or () if user_id in self.production.users)
+            self.production.record("members", project_id, task_id)
+            self._send_members(members)
+
+    def get_task_members(self, project_id, task_id):
+        self.get_members(project_id, task_id)
+
+    def patch_task_members(self, project_id, task_id):
+        self.patch_members(project_id, task_id)
+
+    def put_task_members(self, project_id, task_id):
+        self.put_members(project_id, task_id)
+
+    def get_launchers(self):
+        with self.production.lock:
+            launchers = self.production.visible_launchers(self.query.get("path", ""))
+            if "limit" in self.query:
+                return self.send_page([dict(launcher_json(launcher), name=launcher["name"]) for launcher in launchers])
+            value = {launcher["name"]: launcher_json(launcher) for launcher in launchers}
+        self.send_json(value, etag=True)
+
+    def create_launcher(self):
+        data = self.json_body()
+        with self.production.lock:
+            launcher = self.production.add_launcher(data["name"], data["path"], data.get("vdata"))
+            self.send_json(launcher_json(launcher), 201)
+
+    def update_launcher(self, launcher_id):
+        data = self.json_body()
+        with self.production.lock:
+            launcher = self.production.launchers[launcher_id]
+            launcher["name"] = data.get("name", launcher["name"])
+            launcher["vdata"] = dict(data.get("vdata") or {})
+            self.production.record("launchers", launcher["path"], launcher_id)
+            self.send_json(launcher_json(launcher, "versions"))
+
+    def patch_launcher(self, launcher_id):
+        data = self.json_body()
+        with self.production.lock:
+            launcher = self.production.launchers[launcher_id]
+            if data.get("name"):
+                launcher["name"] = data["name"]
+            for operation in data.get("operations") or ():
+                version = operation["version"]
+                if operation["op"] == "remove":
+                    launcher["vdata"].pop(version, None)
+                elif operation["op"] in ("add", "modify"):
+                    launcher["vdata"][version] = {"cmd": operation.get("cmd", ""), "icon": operation.get("icon", "")}
+                else:
+                    raise ValueError(f"Unknown operation {operation['op']!r}")
+            self.production.record("launchers", launcher["path"], launcher_id)
+            self.send_json(launcher_json(launcher, "versions"))
+
+    def delete_launcher(self, launcher_id):
+        with self.production.lock:
+            launcher = self.production.launchers.pop(launcher_id)
+            self.production.launcher_paths[launcher["path"]].discard(launcher_id)
+            self.production.record("launchers", launcher["path"], launcher_id)
+        self.send_json({"success": True})
+
+    def toggle_launcher(self, launcher_id):
+        path, action = self.query.get("path", ""), self.query.get("action", "disable")
+        if action not in ("disable", "enable"):
+            raise ValueError(f"Unknown action {action!r}")
+        with self.production.lock:
+            launcher = self.production.launchers[launcher_id]
+            relations = launcher["relations"]
+            other = "enabled" if action == "disable" else "disabled"
+            if path in relations[other]:
+                relations[other].remove(path)
+            if path not in relations[f"{action}d"]:
+                relations[f"{action}d"].append(path)
+            self.production.record("launchers", launcher["path"], launcher_id)
+        self.send_json({"success": True})
+
+    def get_changes(self):
+        with self.production.lock:
+            self.send_json(self.production.changes(self.query["scope"], self.query.get("since")))
+
+    def get_events(self):
+        path = self.query.get("path", "")
+        last_id = self.headers.get("Last-Event-ID")
+        with self.production.lock:
+            since = int(last_id) if last_id and last_id.isdigit() else self.production.revision
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+
+        def write(text):
+            data = text.encode("utf-8")
+            self.wfile.write(b"%x\r\n%s\r\n" % (len(data), data))
+            self.wfile.flush()
+
+        while True:
+            with self.production.lock:
+                events = self.production.events(path, since)
+                if not events:
+                    self.production.changed.wait(self.options.ping_interval)
+                    events = self.production.events(path, since)
+            if not events:
+                write('event: ping\ndata: {}\n\n')
+                continue
+            for event in events:
+                since = event["id"]
+                write(f"id: {event['id']}\nevent: change\ndata: {json.dumps(event)}\n\n")
+
+    def get_resource(self, resource_id):
+        with self.production.lock:
+            resource = self.production.resources[resource_id]
+        tag = f'"{resource_id}"'
+        if self.headers.get("If-None-Match") == tag:
+            self.send_response(304)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        headers = {"X-Resource-Format": resource["format"], "ETag": tag}
+        self.send_body(resource["data"], content_type="application/octet-stream", headers=headers)
+
+    def get_resources(self):
+        ids = [int(value) for value in self.query.get("ids", "").split(",") if value.isdigit()]
+        boundary = uuid.uuid4().hex
+        parts = list()
+        with self.production.lock:
+            for resource_id in ids:
+                resource = self.production.resources.get(resource_id)
+                if resource is None:
+                    continue
+                head = (
+                    f"--{boundary}\r\nContent-Type: application/octet-stream\r\n"
+                    f"Content-ID: <{resource_id}>\r\nX-Resource-Format: {resource['format']}\r\n\r\n"
+                )
+                parts.append(head.encode("latin-1") + resource["data"] + b"\r\n")
+        body = b"".join(parts) + f"--{boundary}--\r\n".encode("latin-1")
+        self.send_body(body, content_type=f"multipart/mixed; boundary={boundary}")
+
+    def get_resource_hash(self, digest):
+        with self.production.lock:
+            resource_id = self.production.resource_hashes.get(digest)
+        if resource_id is None:
+            return self.send_json({"url": None})
+        self.send_json({"id": resource_id, "url": f"/resources/{resource_id}"})
+
+    def upload_resource(self):
+        boundary = multipart_boundary(self.headers.get("Content-Type"))
+        if not boundary:
+            raise ValueError("Expected multipart/form-data")
+        data, resource_format = None, "PNG"
+        for headers, body in iter_multipart([self.body], boundary):
+            disposition = headers.get("content-disposition", "")
+            if 'name="file"' in disposition:
+                data = body
+            elif 'name="type"' in disposition:
+                resource_format = body.decode("utf-8") or resource_format
+        if data is None:
+            raise ValueError("Missing file part")
+        with self.production.lock:
+            self.send_json(self.production.add_resource(data, resource_format), 201)
+
+    def start_upload(self):
+        data = self.json_body()
+        upload_id = uuid.uuid4().hex
+        with self.production.lock:
+            self.production.uploads[upload_id] = {
+                "sha256": data["sha256"],
+                "size": int(data["size"]),
+                "type": data.get("type", "PNG"),
+                "data": bytearray(),
+            }
+        self.send_json({"id": upload_id, "offset": 0}, 201)
+
+    def get_upload(self, upload_id):
+        with self.production.lock:
+            upload = self.production.uploads.get(str(upload_id))
+            if upload is None:
+                raise KeyError(upload_id)
+            self.send_json({"offset": len(upload["data"])})
+
+    def put_upload(self, upload_id):
+        match = re.fullmatch(r"bytes (\d+)-(\d+)/(\d+)", self.headers.get("Content-Range", ""))
+        if not match:
+            raise ValueError("Missing Content-Range")
+        start = int(match.group(1))
+        with self.production.lock:
+            upload = self.production.uploads.get(str(upload_id))
+            if upload is None:
+                raise KeyError(upload_id)
+            if start != len(upload["data"]):
+                raise HTTPError(409, f"Expected offset {len(upload['data'])}")
+            upload["data"] += self.body
+            if len(upload["data"]) < upload["size"]:
+                return self.send_json({"offset": len(upload["data"])})
+            data = bytes(upload.pop("data"))
+            del self.production.uploads[str(upload_id)]
+            if hashlib.sha256(data).hexdigest() != upload["sha256"]:
+                raise HTTPError(422, "Checksum mismatch")
+            self.send_json(self.production.add_resource(data, upload["type"]))
+
+    def graphs(self):
+        with self.production.lock:
+            self.user = self.production.authorize(self.headers.get("Authorization"))
+            if self.user is None:
+                raise HTTPError(401, "Authentication failed")
+            variables = self.json_body().get("variables") or {}
+            project_id = int(variables["projectId"])
+            task_id = variables.get("taskId")
+            path = variables.get("path") or self.production.task_path(project_id, task_id and int(task_id))
+            launchers = self.production.visible_launchers(path)
+            resource_ids = {
+                int(version["icon"].rsplit("/", 1)[-1])
+                for launcher in launchers
+                for version in launcher["vdata"].values()
+                if str(version.get("icon", "")).startswith("/resources/")
+            }
+            resources = [
+                {
+                    "id": resource_id,
+                    "format": self.production.resources[resource_id]["format"],
+                    "data": base64.b64encode(self.production.resources[resource_id]["data"]).decode("ascii"),
+                }
+                for resource_id in sorted(resource_ids)
+                if resource_id in self.production.resources
+            ]
+            data = {
+                "context": {
+                    "path": path,
+                    "launchers": [launcher_json(launcher) for launcher in launchers],
+                    "resources": resources,
+                }
+            }
+            if variables.get("withTasks"):
+                data["tasks"] = [
+                    task_json(task) for task in self.production.tasks.values() if task["project_id"] == project_id
+                ]
+        self.send_json({"data": data})
+
+
+def route(method, pattern, name, public=False):
+    Handler.ROUTES.append((method, re.compile(pattern), name, public))
+
+
+route("GET", r"/ping", "ping", public=True)
+route("POST", r"/auth/login", "login", public=True)
+route("POST", r"/auth/refresh", "refresh")
+route("POST", r"/users/sync", "sync_user", public=True)
+route("GET", r"/users", "get_users")
+route("POST", r"/users", "create_user")
+route("PUT", r"/users/(\d+)", "update_user")
+route("DELETE", r"/users/(\d+)", "delete_user")
+route("GET", r"/projects", "get_projects")
+route("POST", r"/projects", "create_project")
+route("PUT", r"/projects/(\d+)", "update_project")
+route("DELETE", r"/projects/(\d+)", "delete_project")
+route("GET", r"/projects/(\d+)/members", "get_members")
+route("PATCH", r"/projects/(\d+)/members", "patch_members")
+route("PUT", r"/projects/(\d+)/members/batch", "put_members")
+route("GET", r"/projects/(\d+)/members/matrix", "get_membership")
+route("GET", r"/projects/(\d+)/tasks", "get_tasks")
+route("POST", r"/projects/(\d+)/tasks", "create_task")
+route("PUT", r"/projects/(\d+)/tasks/(\d+)", "update_task")
+route("DELETE", r"/projects/(\d+)/tasks/(\d+)", "delete_task")
+route("GET", r"/projects/(\d+)/tasks/(\d+)/members", "get_task_members")
+route("PATCH", r"/projects/(\d+)/tasks/(\d+)/members", "patch_task_members")
+route("PUT", r"/projects/(\d+)/tasks/(\d+)/members/batch", "put_task_members")
+route("GET", r"/launchers", "get_launchers")
+route("POST", r"/launchers", "create_launcher")
+route("PUT", r"/launchers/(\d+)", "update_launcher")
+route("PATCH", r"/launchers/(\d+)", "patch_launcher")
+route("DELETE", r"/launchers/(\d+)", "delete_launcher")
+route("POST", r"/launchers/(\d+)/toggle", "toggle_launcher")
+route("GET", r"/changes", "get_changes")
+route("GET", r"/events", "get_events")
+route("GET", r"/resources/batch", "get_resources")
+route("GET", r"/resources/hash/([0-9a-f]{64})", "get_resource_hash")
+route("POST", r"/resources/upload", "upload_resource")
+route("POST", r"/resources/uploads", "start_upload")
+route("GET", r"/resources/uploads/(\w+)", "get_upload")
+route("PUT", r"/resources/uploads/(\w+)", "put_upload")
+route("GET", r"/resources/(\d+)", "get_resource")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m launcher.server", description="Local stand-in WISH REST server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--graphs-path", default="/graphql")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--projects", type=int, default=500)
+    parser.add_argument("--tasks", type=int, default=100000)
+    parser.add_argument("--launchers", type=int, default=5000)
+    parser.add_argument("--versions", type=int, default=20)
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--icons", type=int, default=200)
+    parser.add_argument("--icon-size", type=int, default=4096)
+    parser.add_argument("--cmd-size", type=int, default=0)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--poll-interval", type=float, default=None)
+    parser.add_argument("--ping-interval", type=float, default=15.0)
+    parser.add_argument("--token-ttl", type=int, default=3600)
+    parser.add_argument("--role", default="admin")
+    parser.add_argument("--json-only", action="store_true")
+    parser.add_argument("--verbose", action="store_true")
+    return parser.parse_args(argv)
+
+
+def make_server(options, production=None):
+    if production is None:
+        production = Production(options.seed).generate(
+            options.projects,
+            options.tasks,
+            options.launchers,
+            options.versions,
+            options.users,
+            options.icons,
+            options.icon_size,
+            options.cmd_size,
+        )
+    handler = type("Handler", (Handler,), {"production": production, "options": options})
+    server = ThreadingHTTPServer((options.host, options.port), handler)
+    server.daemon_threads = True
+    return server
+
+
+def main(argv=None):
+    options = parse_args(argv)
+    started = time.monotonic()
+    server = make_server(options)
+    production = server.RequestHandlerClass.production
+    print(
+        f"Generated {len(production.projects)} projects, {len(production.tasks)} tasks, "
+        f"{len(production.launchers)} launchers in {time.monotonic() - started:.1f}s",
+        flush=True,
+    )
+    print(f"Serving on http://{options.host}:{options.port}{options.graphs_path}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,102 @@
+import os
+import json
+import time
+import uuid
+import socket
+import getpass
+import base64
+import hashlib
+import threading
+from Crypto.Cipher import AES
+from Crypto.Random import get_random_bytes
+
+try:
+    import keyring
+except ImportError:
+    keyring = None
+
+
+class SessionStore(object):
+    MAGIC = b"LSS2"
+    KEYRING_SERVICE = "launcher-session"
+    SESSION_DIR = os.path.join(os.path.expanduser("~"), ".launcher")
+
+    def __init__(self, base_url, namespace=None):
+        key = f"{namespace}|{base_url}" if namespace else base_url or ""
+        self.name = f"session-{hashlib.md5(key.encode('utf-8')).hexdigest()[:12]}"
+        self.path = os.path.join(self.SESSION_DIR, f"{self.name}.bin")
+        self._secret = None
+        self._lock = threading.Lock()
+
+    def _machine_id(self):
+        for path in ("/etc/machine-id", "/var/lib/dbus/machine-id"):
+            try:
+                with open(path) as f:
+                    return f.read().strip()
+            except OSError:
+                continue
+        return str(uuid.getnode())
+
+    def _keyring_secret(self):
+        if keyring is None:
+            print("Keyring module not installed, session file is only obfuscated")
+            return None
+        try:
+            secret = keyring.get_password(self.KEYRING_SERVICE, self.name)
+            if not secret:
+                secret = base64.b64encode(get_random_bytes(32)).decode("ascii")
+                keyring.set_password(self.KEYRING_SERVICE, self.name, secret)
+            return base64.b64decode(secret)
+        except Exception as e:
+            print(f"Keyring unavailable, session file is only obfuscated: {e}")
+            return None
+
+    def _key(self, username, salt):
+        with self._lock:
+            if self._secret is None:
+                self._secret = self._keyring_secret() or b""
+        if self._secret:
+            material = self._secret + username.encode("utf-8")
+        else:
+            material = "|".join((username, getpass.getuser(), socket.gethostname(), self._machine_id())).encode("utf-8")
+        return hashlib.sha256(salt + material).digest()
+
+    def save(self, username, response, expires_at=None):
+        data = json.dumps({"username": username, "response": response, "expires_at": expires_at})
+        salt = get_random_bytes(16)
+        cipher = AES.new(self._key(username, salt), AES.MODE_GCM)
+        ciphertext, tag = cipher.encrypt_and_digest(data.encode("utf-8"))
+        os.makedirs(self.SESSION_DIR, mode=0o700, exist_ok=True)
+        temp_path = f"{self.path}.{os.getpid()}.tmp"
+        fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            f.write(self.MAGIC + salt + cipher.nonce + tag + ciphertext)
+        os.replace(temp_path, self.path)
+
+    def load(self, username):
+        try:
+            with open(self.path, "rb") as f:
+                blob = f.read()
+        except OSError:
+            return None
+        if not blob.startswith(self.MAGIC):
+            return None
+        blob = blob[len(self.MAGIC) :]
+        salt, nonce, tag, ciphertext = blob[:16], blob[16:32], blob[32:48], blob[48:]
+        try:
+            cipher = AES.new(self._key(username, salt), AES.MODE_GCM, nonce=nonce)
+            data = json.loads(cipher.decrypt_and_verify(ciphertext, tag))
+        except (ValueError, KeyError):
+            return None
+        if data.get("username") != username:
+            return None
+        expires_at = data.get("expires_at")
+        if expires_at is not None and expires_at <= time.time():
+            return None
+        return data
+
+    def clear(self):
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
@@ -450,9 +450,9 @@ class BaseDialog(QtWidgets.QDialog):
     def setupUserEditUI(self, user_info):
         self.setWindowTitle(self.tr("Edit User"))
         layout = QtWidgets.QFormLayout(self)
-        role = user_info.get("role")
-        email = user_info.get("email")
-        username = user_info.get("username")
+        role = user_info.role
+        email = user_info.email
+        username = user_info.username
         self.username_edit = QtWidgets.QLineEdit(username)
         self.username_edit.setPlaceholderText(self.tr("Enter new username"))
         layout.addRow(self.tr("Username:"), self.username_edit)
@@ -0,0 +1,72 @@
+import os
+import sys
+import threading
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+from launcher import session, server as standin  # noqa: E402
+from launcher.model import CacheModel, MainModel  # noqa: E402
+from launcher.client import APIClient  # noqa: E402
+
+
+@pytest.fixture
+def production():
+    return standin.Production(seed=1).generate(
+        projects=3, tasks=30, launchers=10, versions=2, users=5, icons=3, icon_size=64, cmd_size=0
+    )
+
+
+@pytest.fixture
+def serve(production):
+    servers = list()
+
+    def start(*argv):
+        options = standin.parse_args(["--port", "0", "--token-ttl", "600", *argv])
+        httpd = standin.make_server(options, production)
+        threading.Thread(target=httpd.serve_forever, args=(0.05,), daemon=True).start()
+        httpd.url = "http://{}:{}{}".format(*httpd.server_address[:2], options.graphs_path)
+        servers.append(httpd)
+        return httpd
+
+    yield start
+    for httpd in servers:
+        httpd.shutdown()
+        httpd.server_close()
+
+
+@pytest.fixture
+def server(serve):
+    return serve()
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(CacheModel, "CACHE_DIR", str(tmp_path / "cache"))
+    return tmp_path / "cache"
+
+
+@pytest.fixture
+def api_client(server, cache_dir):
+    client = APIClient(server.url)
+    client.cache_model = CacheModel("client")
+    assert client.probe()
+    client.login("tester", "secret")
+    return client
+
+
+@pytest.fixture
+def session_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(session, "keyring", None)
+    monkeypatch.setattr(session.SessionStore, "SESSION_DIR", str(tmp_path / "session"))
+    return tmp_path / "session"
+
+
+@pytest.fixture
+def main_model(server, cache_dir, session_dir, monkeypatch):
+    monkeypatch.setenv("WISH_RESTAPI_URL", server.url)
+    model = MainModel()
+    model.online = True
+    assert model.login("tester", "secret")
+    yield model
+    model.logout()
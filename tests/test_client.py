@@ -0,0 +1,226 @@
+import time
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from launcher.client import APIClient, CircuitBreaker, RateLimited, TokenBucket
+from launcher.model import CacheModel
+
+
+def test_conditional_get_revalidates_from_cache(api_client, server, monkeypatch):
+    first = api_client.get_projects()
+    seen = list()
+    handler = server.RequestHandlerClass
+    original = handler.send_response
+
+    def send_response(self, code, message=None):
+        seen.append(code)
+        original(self, code, message)
+
+    monkeypatch.setattr(handler, "send_response", send_response)
+    second = api_client.get_projects()
+    third = api_client.get_projects()
+    assert seen == [304, 304]
+    assert second == first and third == first
+    assert second is not third
+    second.append("mutated")
+    assert api_client.get_projects() == first
+
+
+def test_validators_survive_restart(api_client, server):
+    projects = api_client.get_projects()
+    client = APIClient(server.url)
+    client.cache_model = CacheModel("client")
+    client.probe()
+    client.session.headers.update(api_client.session.headers)
+    assert client._load_validator([f"{client.base_url}/projects", []])
+    assert client.get_projects() == projects
+
+
+def test_validators_are_bounded(api_client, monkeypatch):
+    monkeypatch.setattr(APIClient, "MAX_VALIDATORS", 2)
+    for project in api_client.get_projects():
+        api_client.get_tasks(project.id)
+    assert len(api_client._validators) == 2
+
+
+def test_each_thread_gets_its_own_session(api_client):
+    sessions = list()
+
+    def fetch():
+        api_client.get_projects()
+        sessions.append(api_client.session.session)
+
+    threads = [threading.Thread(target=fetch) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+    assert len(set(map(id, sessions))) == 3
+    assert all(session.headers["Authorization"].startswith("Bearer ") for session in sessions)
+
+
+def test_streamed_json_is_decoded(api_client, production):
+    tasks = api_client.get_tasks(1)
+    assert sorted(task.id for task in tasks) == sorted(
+        task_id for task_id, task in production.tasks.items() if task["project_id"] == 1
+    )
+
+
+def test_read_timeout_raises_timeout_error(api_client, serve):
+    slow = serve("--latency", "0.5")
+    with pytest.raises(TimeoutError):
+        api_client._request("GET", slow.url.replace("/graphql", "/ping"), timeout=0.1)
+
+
+def test_refused_connection_raises_connection_error():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    client = APIClient(f"http://127.0.0.1:{port}/graphql")
+    with pytest.raises(ConnectionError):
+        client.get_projects()
+
+
+def test_cross_origin_redirect_drops_credentials(api_client):
+    seen = dict()
+
+    class Target(BaseHTTPRequestHandler):
+        def do_GET(self):
+            seen.update(self.headers)
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", "2")
+            self.end_headers()
+            self.wfile.write(b"{}")
+
+        def log_message(self, format, *args):
+            pass
+
+    target = ThreadingHTTPServer(("127.0.0.1", 0), Target)
+    threading.Thread(target=target.serve_forever, daemon=True).start()
+
+    class Redirect(Target):
+        def do_GET(self):
+            self.send_response(302)
+            self.send_header("Location", f"http://localhost:{target.server_address[1]}/elsewhere")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+    origin = ThreadingHTTPServer(("127.0.0.1", 0), Redirect)
+    threading.Thread(target=origin.serve_forever, daemon=True).start()
+    try:
+        url = f"http://127.0.0.1:{origin.server_address[1]}/start"
+        response = api_client._request("GET", url, headers={"Cookie": "session=1"})
+        assert response.status_code == 200
+    finally:
+        origin.shutdown()
+        target.shutdown()
+    assert "Authorization" not in seen
+    assert "Cookie" not in seen
+
+
+def test_breaker_starts_closed_and_opens_after_failures(monkeypatch):
+    breaker = CircuitBreaker()
+    assert breaker.online and not breaker.probe_due
+    for _ in range(CircuitBreaker.FAILURE_THRESHOLD - 1):
+        breaker.record_failure()
+    assert breaker.online
+    breaker.record_failure()
+    assert not breaker.online
+    monkeypatch.setattr(breaker, "_next_probe", 0.0)
+    assert breaker.probe_due
+    breaker.record_success()
+    assert not breaker.online
+    breaker.record_success()
+    assert breaker.online
+
+
+def test_breaker_rejects_requests_while_open(api_client):
+    for _ in range(CircuitBreaker.FAILURE_THRESHOLD):
+        api_client.breaker.record_failure()
+    with pytest.raises(ConnectionError, match="offline"):
+        api_client.get_projects()
+    assert not api_client.probe()
+
+
+def test_token_bucket_limits_bursts():
+    bucket = TokenBucket(rate=10, capacity=2)
+    bucket.acquire()
+    bucket.acquire()
+    with pytest.raises(RateLimited) as info:
+        bucket.acquire()
+    assert 0 < info.value.retry_after <= 0.1
+    with pytest.raises(TimeoutError):
+        bucket.acquire(deadline=time.monotonic())
+    bucket.refund()
+    bucket.acquire()
+
+
+def test_retry_after_defers_the_bucket(api_client, server, monkeypatch):
+    def busy(self):
+        self.send_response(429)
+        self.send_header("Retry-After", "2")
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    monkeypatch.setattr(server.RequestHandlerClass, "get_projects", busy)
+    with pytest.raises(RateLimited) as info:
+        api_client.get_projects()
+    assert info.value.retry_after == 2
+    with pytest.raises(RateLimited):
+        api_client.limiter.acquire()
+    assert api_client.breaker.online
+
+
+def test_chunked_upload_resumes_after_restart(api_client, server, production, tmp_path, monkeypatch):
+    monkeypatch.setattr(APIClient, "UPLOAD_CHUNK_SIZE", 1024)
+    monkeypatch.setattr(APIClient, "UPLOAD_RETRIES", 0)
+    path = tmp_path / "icon.png"
+    path.write_bytes(bytes(range(256)) * 10)
+    request = api_client._request
+    ranges = list()
+
+    def flaky(method, url, **kwargs):
+        if method == "PUT":
+            ranges.append(kwargs["headers"]["Content-Range"])
+            if len(ranges) == 2:
+                raise ConnectionError("dropped")
+        return request(method, url, **kwargs)
+
+    monkeypatch.setattr(api_client, "_request", flaky)
+    with pytest.raises(ConnectionError):
+        api_client.upload_resource(str(path), "PNG")
+
+    client = APIClient(server.url)
+    client.cache_model = CacheModel("client")
+    client.session.headers.update(api_client.session.headers)
+    monkeypatch.setattr(client, "_request", flaky)
+    result = client.upload_resource(str(path), "PNG")
+    assert ranges[2] == "bytes 1024-2047/2560"
+    assert production.resources[result["id"]]["data"] == path.read_bytes()
+    assert client._load_upload(api_client._hash_file(str(path))) is None
+
+
+def test_poll_advice_outlives_responses_without_it(serve, cache_dir, monkeypatch):
+    advised = serve("--poll-interval", "7")
+    client = APIClient(advised.url)
+    client.probe()
+    client.login("tester", "secret")
+    assert client.poll_interval == 7
+    advised.RequestHandlerClass.options.poll_interval = None
+    client.get_projects()
+    assert client.poll_interval == 7
+    monkeypatch.setattr(client, "_poll_advice", (7, time.monotonic() - 1))
+    assert client.poll_interval is None
+
+
+def test_writes_and_auth_bypass_the_rate_limit(api_client):
+    api_client.limiter = TokenBucket(rate=0.01, capacity=1)
+    api_client.get_projects()
+    with pytest.raises(RateLimited):
+        api_client.get_projects()
+    api_client.refresh_token()
+    assert api_client.create_project("Unthrottled")["name"] == "Unthrottled"
@@ -0,0 +1,176 @@
+import json
+import random
+
+import pytest
+
+from launcher import codec
+from launcher.codec import ExtType, Unpacker, iter_array, iter_events, iter_object, iter_multipart
+
+SEEDS = range(50)
+
+
+def random_splits(data, rng):
+    chunks, pos = list(), 0
+    while pos < len(data):
+        size = rng.randint(1, 7)
+        chunks.append(data[pos : pos + size])
+        pos += size
+    return chunks
+
+
+def random_value(rng, depth=0):
+    kind = rng.randrange(8 if depth < 3 else 5)
+    if kind == 0:
+        return rng.randint(-(10**12), 10**12)
+    if kind == 1:
+        return rng.choice([1.5, -0.25, 2e10, 1.5e-7, 3.14159, -1e300, 0.0])
+    if kind == 2:
+        return rng.choice(["", "plain", "quote \" and \\ slash", "unicode é中\U0001f600", "line\nbreak"])
+    if kind == 3:
+        return rng.choice([True, False, None])
+    if kind == 4:
+        return rng.randint(0, 9)
+    if kind == 5:
+        return [random_value(rng, depth + 1) for _ in range(rng.randint(0, 4))]
+    return {f"k{index}": random_value(rng, depth + 1) for index in range(rng.randint(0, 4))}
+
+
+@pytest.mark.parametrize(
+    "chunks, expected",
+    [
+        ([b"[1.", b"5]"], [1.5]),
+        ([b"[2e", b"10]"], [2e10]),
+        ([b"[1", b"2, 3", b"]"], [12, 3]),
+        ([b"[-", b"1.5e", b"-", b"3]"], [-1.5e-3]),
+        ([b"[tr", b"ue, nu", b"ll]"], [True, None]),
+    ],
+)
+def test_array_numbers_across_chunks(chunks, expected):
+    assert list(iter_array(chunks)) == expected
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_array_random_splits(seed):
+    rng = random.Random(seed)
+    items = [random_value(rng) for _ in range(rng.randint(0, 20))]
+    data = json.dumps(items, indent=rng.choice([None, 1])).encode("utf-8")
+    assert list(iter_array(random_splits(data, rng))) == items
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_object_random_splits(seed):
+    rng = random.Random(seed)
+    items = {f"name {index}": random_value(rng) for index in range(rng.randint(0, 20))}
+    data = json.dumps(items).encode("utf-8")
+    assert dict(iter_object(random_splits(data, rng))) == items
+
+
+def test_object_accepts_empty_array():
+    assert list(iter_object([b" [", b"] "])) == []
+
+
+@pytest.mark.parametrize("data", [b"[1, 2", b"[1 2]", b'{"a" 1}', b"[1.5"])
+def test_truncated_or_malformed_json_raises(data):
+    with pytest.raises(ValueError):
+        parser = iter_object if data.startswith(b"{") else iter_array
+        list(parser([data]))
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_multipart_random_splits(seed):
+    rng = random.Random(seed)
+    boundary = "b0undary"
+    parts = [bytes(rng.getrandbits(8) for _ in range(rng.randint(0, 64))) for _ in range(rng.randint(1, 6))]
+    body = b""
+    for index, part in enumerate(parts):
+        body += f"--{boundary}\r\nX-Resource-Id: {index}\r\n\r\n".encode("latin-1") + part + b"\r\n"
+    body += f"--{boundary}--\r\n".encode("latin-1")
+    result = list(iter_multipart(random_splits(body, rng), boundary))
+    assert [headers["x-resource-id"] for headers, _ in result] == [str(index) for index in range(len(parts))]
+    assert [data for _, data in result] == parts
+
+
+def test_multipart_truncated_raises():
+    with pytest.raises(ValueError):
+        list(iter_multipart([b"--b\r\n\r\npartial"], "b"))
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_events_random_splits(seed):
+    rng = random.Random(seed)
+    stream = (
+        ": keep-alive\r\n\r\n"
+        "id: 1\nevent: changed\ndata: {\"scope\": \"projects\"}\n\n"
+        "data: first\ndata: second é\n\n"
+    ).encode("utf-8")
+    events = list(iter_events(random_splits(stream, rng)))
+    assert events == [
+        {"id": "1", "event": "changed", "data": '{"scope": "projects"}'},
+        {"id": "1", "event": "message", "data": "first\nsecond é"},
+    ]
+
+
+def pure_dumps(value, default=None):
+    out = bytearray()
+    codec._pack(value, out, default)
+    return bytes(out)
+
+
+def pure_loads(data, ext_hook=None):
+    unpacker = Unpacker(data, ext_hook)
+    value = unpacker.unpack()
+    assert unpacker.pos == len(unpacker.data)
+    return value
+
+
+MSGPACK_VALUES = [
+    None,
+    True,
+    0,
+    127,
+    128,
+    -32,
+    -33,
+    255,
+    65536,
+    2**32,
+    2**64 - 1,
+    -(2**63),
+    1.5,
+    "",
+    "x" * 31,
+    "x" * 32,
+    "y" * 70000,
+    b"",
+    b"\x00" * 300,
+    list(range(20)),
+    {str(index): index for index in range(20)},
+    ExtType(5, b"\x01"),
+    ExtType(3, b"\x00" * 16),
+    ExtType(1, b"\x00" * 3),
+]
+
+
+@pytest.mark.parametrize("value", MSGPACK_VALUES)
+def test_msgpack_pure_round_trip(value):
+    assert pure_loads(pure_dumps(value)) == value
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_msgpack_pure_round_trip_random(seed):
+    value = random_value(random.Random(seed))
+    assert pure_loads(pure_dumps(value)) == value
+
+
+@pytest.mark.parametrize("value", MSGPACK_VALUES)
+def test_msgpack_pure_matches_extension(value):
+    msgpack = pytest.importorskip("msgpack")
+    if isinstance(value, ExtType):
+        value = msgpack.ExtType(*value)
+    assert pure_dumps(value) == msgpack.packb(value, use_bin_type=True)
+
+
+@pytest.mark.parametrize("data", [b"\x92\x01", b"\xd9\x05abc", b"\xc1"])
+def test_msgpack_pure_rejects_bad_data(data):
+    with pytest.raises(ValueError):
+        pure_loads(data)
@@ -0,0 +1,99 @@
+import pytest
+from ldap3.core.exceptions import LDAPBindError, LDAPSocketOpenError
+
+from launcher import ldap
+
+
+class FakeEntry(object):
+    def __init__(self, name, mail):
+        self.displayName = type("Value", (), {"value": name})
+        self.userPrincipalName = type("Value", (), {"value": mail})
+
+
+class FakeConnection(object):
+    opened = list()
+    passwords = {"DOMAIN\\tester": "secret"}
+
+    def __init__(self, server, user=None, password=None, **kwargs):
+        self.user, self.password = user, password
+        self.closed = False
+        self.broken = False
+        self.searches = 0
+        self.entries = list()
+        self.opened.append(self)
+
+    def bind(self, read_server_info=True):
+        if self.passwords.get(self.user) != self.password:
+            raise LDAPBindError("invalid credentials")
+        return True
+
+    def rebind(self, user=None, password=None, **kwargs):
+        if self.broken:
+            raise LDAPSocketOpenError("socket closed")
+        self.user, self.password = user, password
+        return self.bind()
+
+    def search(self, **kwargs):
+        self.searches += 1
+        self.entries = [FakeEntry("Tester", "tester@example.com")]
+
+    def unbind(self):
+        self.closed = True
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    FakeConnection.opened = list()
+    monkeypatch.setattr(ldap, "Connection", FakeConnection)
+    return ldap.LDAPPool("ldap://example")
+
+
+def test_idle_connection_is_rebound(pool):
+    connection = pool.bind("DOMAIN\\tester", "secret")
+    pool.release(connection)
+    assert pool.bind("DOMAIN\\tester", "secret") is connection
+    assert len(FakeConnection.opened) == 1
+
+
+def test_wrong_password_discards_connection(pool):
+    assert pool.bind("DOMAIN\\tester", "wrong") is None
+    assert FakeConnection.opened[0].closed
+    assert not pool._idle
+
+
+def test_stale_connection_reconnects(pool):
+    connection = pool.bind("DOMAIN\\tester", "secret")
+    pool.release(connection)
+    connection.broken = True
+    fresh = pool.bind("DOMAIN\\tester", "secret")
+    assert fresh is not connection and not fresh.closed
+    assert connection.closed
+
+
+def test_pool_is_bounded(pool):
+    connections = [pool.bind("DOMAIN\\tester", "secret") for _ in range(pool.POOL_SIZE + 1)]
+    for connection in connections:
+        pool.release(connection)
+    assert len(pool._idle) == pool.POOL_SIZE
+    assert connections[-1].closed
+
+
+def test_profile_is_cached_until_ttl(pool, monkeypatch):
+    connection = pool.bind("DOMAIN\\tester", "secret")
+    assert pool.profile(connection, "tester") == ("Tester", "tester@example.com")
+    assert pool.profile(connection, "tester") == ("Tester", "tester@example.com")
+    assert connection.searches == 1
+    monkeypatch.setattr(pool, "PROFILE_TTL", -1)
+    pool._profiles.clear()
+    pool.profile(connection, "tester")
+    pool.profile(connection, "tester")
+    assert connection.searches == 3
+
+
+def test_authenticator_fills_profile(monkeypatch):
+    monkeypatch.setattr(ldap, "Connection", FakeConnection)
+    monkeypatch.setattr(ldap.LDAPPool, "_pools", dict())
+    authenticator = ldap.LDAPAuthenticator("ldap://example", "DOMAIN")
+    assert authenticator.authenticate("tester", "secret")
+    assert (authenticator.fullName, authenticator.mail) == ("Tester", "tester@example.com")
+    assert not ldap.LDAPAuthenticator("ldap://example", "DOMAIN").authenticate("tester", "wrong")
@@ -0,0 +1,221 @@
+import time
+import threading
+
+import pytest
+
+from launcher.model import AuthModel, CacheModel, FlightModel, MainModel, SyncModel
+from launcher.records import Project, sort_records
+
+
+def test_flight_followers_share_leader_result():
+    flights = FlightModel()
+    started, release = threading.Event(), threading.Event()
+    calls = list()
+
+    def fetch(value):
+        calls.append(value)
+        started.set()
+        release.wait(5)
+        return [value]
+
+    results = list()
+    leader = threading.Thread(target=lambda: results.append(flights.run("key", None, fetch, 1)))
+    leader.start()
+    started.wait(5)
+    follower = threading.Thread(target=lambda: results.append(flights.run("key", None, fetch, 2)))
+    follower.start()
+    release.set()
+    leader.join(5)
+    follower.join(5)
+    assert calls == [1]
+    assert results == [[1], [1]]
+    assert results[0] is results[1]
+
+
+def test_flight_follower_times_out_at_deadline():
+    flights = FlightModel()
+    started, release = threading.Event(), threading.Event()
+
+    def fetch():
+        started.set()
+        release.wait(5)
+
+    leader = threading.Thread(target=flights.run, args=("key", None, fetch))
+    leader.start()
+    started.wait(5)
+    with pytest.raises(TimeoutError):
+        flights.run("key", 0.0, fetch)
+    release.set()
+    leader.join(5)
+
+
+def test_coalesced_timeout_falls_back_to_cache(main_model, monkeypatch):
+    projects = main_model.get_all_projects()
+    client = main_model._auth_model._api_client
+    started, release = threading.Event(), threading.Event()
+    get_projects = client.get_projects
+
+    def slow_projects():
+        started.set()
+        release.wait(5)
+        return get_projects()
+
+    monkeypatch.setattr(client, "get_projects", slow_projects)
+    leader = threading.Thread(target=main_model.get_all_projects)
+    leader.start()
+    started.wait(5)
+    try:
+        assert main_model.get_all_projects(budget=0.1) == projects
+    finally:
+        release.set()
+        leader.join(5)
+
+
+def test_connect_stays_offline_when_login_is_rejected(main_model, server):
+    auth = AuthModel(server.url, "rejected")
+    auth.login("tester", "wrong", perform=False)
+    assert auth.connect() is False
+    assert not auth._online
+    auth.login("tester", "secret", perform=False)
+    assert auth.connect() is True
+    assert auth._online and auth._authenticated
+    auth.logout()
+
+
+def test_sync_returns_only_changed_projects(main_model, production):
+    first = main_model.sync_projects()
+    assert {project.id for project in first.items} == set(production.projects)
+    created = main_model.add_project("Synced")
+    second = main_model.sync_projects(first.cursor)
+    assert [project.id for project in second.upserted] == [created["id"]]
+    assert second.cursor != first.cursor
+    third = main_model.sync_projects(second.cursor)
+    assert not third.changed and third.cursor == second.cursor
+
+
+def test_sync_serves_cached_state_offline(main_model, production):
+    first = main_model.sync_projects()
+    main_model.online = False
+    offline = main_model.sync_projects(first.cursor)
+    assert offline.items == first.items and not offline.changed
+
+
+def test_sync_model_persists_state(cache_dir):
+    cache = CacheModel("sync")
+    sync = SyncModel(cache)
+    records = [Project(1, "One"), Project(2, "Two")]
+    sync.seed("projects", records)
+    restored = SyncModel(CacheModel("sync"))
+    changes = restored.sync("projects", None, False, None, lambda: None, Project.from_dict, sort_records)
+    assert changes.items == records
+
+
+def test_expired_token_is_reauthenticated(main_model, production):
+    with production.lock:
+        production.tokens.clear()
+    assert main_model.get_all_projects()
+    assert main_model.authenticated
+
+
+def test_refresh_replaces_the_token(main_model):
+    auth = main_model._auth_model
+    token, generation = auth._response["token"], auth.generation
+    auth.refresh()
+    assert auth._response["token"] != token
+    assert auth.generation == generation + 1
+    assert auth._api_client.session.headers["Authorization"] == f"Bearer {auth._response['token']}"
+
+
+def test_restore_reuses_saved_session(main_model, server):
+    token = main_model._auth_model._response["token"]
+    auth = AuthModel(server.url, main_model.environment)
+    assert auth.restore("tester", "secret")
+    assert auth._response["token"] == token
+    assert not AuthModel(server.url, main_model.environment).restore("someone", "secret")
+
+
+def test_open_context_normalises_ids(main_model, monkeypatch):
+    client = main_model._auth_model._api_client
+    calls = list()
+    get_context = client.get_context
+
+    def counted(*args):
+        calls.append(args)
+        return get_context(*args)
+
+    monkeypatch.setattr(client, "get_context", counted)
+    first = main_model.open_context("1", path="1", with_tasks=False)
+    second = main_model.open_context(1, "", path="1", with_tasks=False)
+    assert first.path == second.path == "1"
+    assert {call[:2] for call in calls} == {(1, None)}
+
+
+def test_refresh_drops_stale_expiry(main_model):
+    auth = main_model._auth_model
+    auth._set_response(dict(auth._response, expires_at=time.time() + 30), persist=False)
+    auth.refresh()
+    assert "expires_at" not in auth._response
+    assert auth._expires_at > time.time() + 500
+
+
+def test_login_token_is_not_cached_in_plaintext(main_model, cache_dir):
+    token = main_model._auth_model._response["token"].encode("utf-8")
+    for path in cache_dir.rglob("*"):
+        if path.is_file():
+            assert token not in path.read_bytes()
+
+
+def test_login_falls_back_to_saved_session_offline(main_model, server, monkeypatch):
+    model = MainModel()
+    client = model._auth_model._api_client
+
+    def unreachable(*args, **kwargs):
+        raise ConnectionError("unreachable")
+
+    monkeypatch.setattr(client, "login", unreachable)
+    assert model.login("tester", "secret")
+    assert model.authenticated
+    with pytest.raises(ConnectionError):
+        model.login("someone", "secret")
+
+
+def test_resume_login_prefers_saved_session(main_model, monkeypatch):
+    model = MainModel()
+    monkeypatch.setattr(model, "prelogin", lambda *args: pytest.fail("network login"))
+    assert model.resume_login("tester", "secret")
+    assert model._auth_model._response["token"] == main_model._auth_model._response["token"]
+
+
+def test_offline_mode_keeps_the_environment_cache(main_model):
+    projects = main_model.get_all_projects()
+    assert main_model.switch_environment(1) is False
+    assert main_model.environment == "default"
+    main_model.online = False
+    assert main_model.get_all_projects() == projects
+
+
+def test_unset_environment_url_falls_back_to_default(main_model, monkeypatch):
+    monkeypatch.delenv("WISH_RESTAPI_URL_TEST", raising=False)
+    assert main_model.switch_environment(2) is False
+    assert main_model.environment == "default"
+
+
+def test_environments_keep_separate_state(main_model, server, monkeypatch):
+    monkeypatch.setenv("WISH_RESTAPI_URL_TEST", server.url)
+    default_client = main_model._auth_model._api_client
+    assert main_model.switch_environment(2)
+    assert main_model.environment == "test"
+    assert main_model._auth_model._api_client is not default_client
+    assert main_model.resume_session() is False
+    main_model.online = True
+    assert main_model.authenticated
+    assert main_model.switch_environment(0)
+    assert main_model._auth_model._api_client is default_client
+
+
+def test_user_edits_do_not_touch_cached_pages(main_model):
+    user = next(iter(main_model.get_users_page()))
+    updated = user.replace(username="renamed", role="admin")
+    assert (updated.id, updated.username, updated.role) == (user.id, "renamed", "admin")
+    assert user.username != "renamed"
+    assert "renamed" not in {cached.username for cached in main_model.get_users_page()}
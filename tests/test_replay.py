@@ -0,0 +1,123 @@
+import base64
+import io
+import json
+import time
+
+import pytest
+
+from launcher.client import APIClient
+from launcher.codec import msgpack_loads
+from launcher.replay import FaultInjector, RecordingSession, ReplaySession, request_body, scrub_body
+
+
+@pytest.fixture
+def cassette(tmp_path):
+    return str(tmp_path / "cassette.jsonl")
+
+
+def entries(path):
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def recording_client(server, cassette, faults=None):
+    client = APIClient(server.url)
+    client.session = RecordingSession(client.session, cassette, faults)
+    client.login("tester", "secret")
+    return client
+
+
+def test_record_then_replay(server, cache_dir, cassette):
+    client = recording_client(server, cassette)
+    projects, tasks = client.get_projects(), client.get_tasks(1)
+    replay = APIClient(server.url)
+    replay.session = ReplaySession(cassette, speed=0)
+    assert replay.login("tester", "secret")["token"] == "<scrubbed>"
+    assert replay.get_projects() == projects
+    assert replay.get_tasks(1) == tasks
+
+
+def test_recording_scrubs_secrets(server, cache_dir, cassette):
+    client = recording_client(server, cassette)
+    token = client.session.headers["Authorization"].split()[1]
+    client.get_projects()
+    text = open(cassette, encoding="utf-8").read()
+    assert token not in text and "secret" not in text
+    login = entries(cassette)[0]
+    assert login["request"] == {"username": "tester", "password": "<scrubbed>"}
+    assert msgpack_loads(base64.b64decode(login["body"]))["token"] == "<scrubbed>"
+
+
+def test_streamed_events_are_scrubbed(server, production, cache_dir, cassette, monkeypatch):
+    events = production.events
+    monkeypatch.setattr(production, "events", lambda *args: [dict(event, token="abc") for event in events(*args)])
+    client = recording_client(server, cassette)
+    stream = client.subscribe("")
+    with production.lock:
+        production.add_project("Evented")
+    event = next(iter(stream))
+    stream.close()
+    assert event["data"]["token"] == "abc"
+    recorded = [entry for entry in entries(cassette) if "chunks" in entry][0]
+    body = b"".join(base64.b64decode(chunk) for _, chunk in recorded["chunks"])
+    assert b'"token": "<scrubbed>"' in body and b"abc" not in body
+
+
+def test_streamed_json_secrets_are_scrubbed():
+    body = json.dumps([{"id": 1, "api_key": "k"}]).encode("utf-8")
+    events = b'id: 1\ndata: {"token": "abc", "id": 1}\n\n'
+    assert b"k\"" not in scrub_body(body, "application/json")
+    assert scrub_body(events, "text/event-stream") == b'id: 1\ndata: {"token": "<scrubbed>", "id": 1}\n\n'
+
+
+def test_every_request_body_is_recorded():
+    assert request_body({"json": {"password": "x"}}) == {"password": "<scrubbed>"}
+    assert request_body({"data": {"type": "PNG", "secret": "x"}}) == {"form": {"type": "PNG", "secret": "<scrubbed>"}}
+    form = request_body({"data": "a=1&password=x", "headers": {"content-type": "application/x-www-form-urlencoded"}})
+    assert base64.b64decode(form["data"]) == b"a=1&password=%3Cscrubbed%3E"
+    assert base64.b64decode(request_body({"data": b"\x00\x01"})["data"]) == b"\x00\x01"
+    upload = io.BytesIO(b"icon")
+    upload.name = "/tmp/icon.png"
+    files = request_body({"files": {"file": upload}, "data": {"type": "PNG"}})
+    assert files["files"]["file"]["filename"] == "icon.png"
+    assert files["files"]["file"]["size"] == 4
+    assert upload.tell() == 0
+
+
+def test_fault_injector_picks_longest_prefix():
+    faults = FaultInjector({"*": {"latency": 1}, "/projects": {"latency": 2}, "POST /projects": {"latency": 3}})
+    assert faults.match("GET", "http://host/users")["latency"] == 1
+    assert faults.match("GET", "http://host/projects/1/tasks")["latency"] == 2
+    assert faults.match("POST", "http://host/projects")["latency"] == 3
+
+
+def test_fault_injector_returns_errors():
+    faults = FaultInjector({"/projects": {"error_rate": 1, "status": 502}, "/users": {"error_rate": 1, "status": 0}})
+    assert faults.apply("GET", "http://host/projects").status_code == 502
+    with pytest.raises(ConnectionError):
+        faults.apply("GET", "http://host/users")
+    assert faults.apply("GET", "http://host/ping") is None
+
+
+def test_fault_injector_is_seeded():
+    runs = list()
+    for _ in range(2):
+        faults = FaultInjector({"/": {"error_rate": 0.5}}, seed=3)
+        runs.append([faults.apply("GET", "http://host/") is not None for _ in range(20)])
+    assert runs[0] == runs[1]
+    assert any(runs[0]) and not all(runs[0])
+
+
+def test_fault_injector_adds_latency():
+    faults = FaultInjector({"/slow": {"latency": 0.05}})
+    started = time.monotonic()
+    assert faults.apply("GET", "http://host/slow") is None
+    assert time.monotonic() - started >= 0.05
+
+
+def test_injected_faults_reach_the_breaker(server, cache_dir, cassette):
+    client = recording_client(server, cassette, FaultInjector({"GET /projects": {"error_rate": 1, "status": 0}}))
+    for _ in range(client.breaker.FAILURE_THRESHOLD):
+        with pytest.raises(ConnectionError):
+            client.get_projects()
+    assert not client.breaker.online
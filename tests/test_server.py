@@ -0,0 +1,90 @@
+import gzip
+import json
+
+import requests
+
+from launcher.codec import MSGPACK_TYPE, msgpack_loads
+
+
+def base_url(server):
+    return server.url.rsplit("/", 1)[0]
+
+
+def login(server):
+    response = requests.post(f"{base_url(server)}/auth/login", json={"username": "tester", "password": "secret"})
+    assert response.status_code == 200
+    return {"Authorization": f"Bearer {response.json()['token']}"}
+
+
+def test_ping_is_public(server):
+    assert requests.get(f"{base_url(server)}/ping").status_code == 204
+
+
+def test_routes_require_a_token(server):
+    response = requests.get(f"{base_url(server)}/projects")
+    assert response.status_code == 401
+    assert response.json()["error"] == "Authentication failed"
+
+
+def test_unknown_method_and_path(server):
+    headers = login(server)
+    assert requests.delete(f"{base_url(server)}/ping", headers=headers).status_code == 405
+    assert requests.get(f"{base_url(server)}/nowhere", headers=headers).status_code == 404
+
+
+def test_etag_revalidation(server):
+    headers = login(server)
+    response = requests.get(f"{base_url(server)}/projects", headers=headers)
+    etag = response.headers["ETag"]
+    response = requests.get(f"{base_url(server)}/projects", headers=dict(headers, **{"If-None-Match": etag}))
+    assert response.status_code == 304
+    assert response.content == b""
+
+
+def test_large_bodies_are_gzipped(server, production):
+    headers = login(server)
+    with production.lock:
+        for index in range(50):
+            production.add_task(1, f"Padding {index:03d}", log=False)
+    response = requests.get(f"{base_url(server)}/projects/1/tasks", headers=headers, stream=True)
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert len(json.loads(gzip.decompress(response.raw.read()))) >= 50
+
+
+def test_msgpack_is_negotiated(server):
+    headers = dict(login(server), Accept=MSGPACK_TYPE)
+    response = requests.get(f"{base_url(server)}/users", headers=headers)
+    assert response.headers["Content-Type"] == MSGPACK_TYPE
+    assert {user["username"] for user in msgpack_loads(response.content)} >= {"tester"}
+
+
+def test_changes_are_incremental(server, production):
+    headers = login(server)
+    url = f"{base_url(server)}/changes"
+    full = requests.get(url, params={"scope": "projects"}, headers=headers).json()
+    assert full["reset"] and len(full["upserted"]) == len(production.projects)
+    created = requests.post(f"{base_url(server)}/projects", json={"name": "Fresh"}, headers=headers).json()
+    delta = requests.get(url, params={"scope": "projects", "since": full["cursor"]}, headers=headers).json()
+    assert not delta["reset"]
+    assert [project["id"] for project in delta["upserted"]] == [created["id"]]
+
+
+def test_events_stream_changes(server):
+    headers = login(server)
+    response = requests.get(f"{base_url(server)}/events", params={"path": ""}, headers=headers, stream=True)
+    assert response.headers["Content-Type"] == "text/event-stream"
+    requests.post(f"{base_url(server)}/projects", json={"name": "Evented"}, headers=headers)
+    lines = response.iter_lines()
+    assert next(lines).startswith(b"id: ")
+    assert next(lines) == b"event: change"
+    assert json.loads(next(lines)[len(b"data: ") :])["scope"] == "projects"
+    response.close()
+
+
+def test_graphs_returns_context(server, production):
+    headers = login(server)
+    variables = {"projectId": 1, "withTasks": True}
+    response = requests.post(server.url, json={"variables": variables}, headers=headers)
+    data = response.json()["data"]
+    assert data["context"]["path"] == "1"
+    assert len(data["tasks"]) == sum(task["project_id"] == 1 for task in production.tasks.values())
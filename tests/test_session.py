@@ -0,0 +1,46 @@
+import os
+import stat
+import time
+
+from launcher.session import SessionStore
+
+
+def test_round_trip(session_dir):
+    store = SessionStore("http://wish", "default")
+    store.save("tester", {"token": "abc"}, time.time() + 60)
+    assert store.load("tester")["response"] == {"token": "abc"}
+    assert stat.S_IMODE(os.stat(store.path).st_mode) == 0o600
+    with open(store.path, "rb") as f:
+        assert b"abc" not in f.read()
+
+
+def test_other_user_cannot_load(session_dir):
+    store = SessionStore("http://wish")
+    store.save("tester", {"token": "abc"})
+    assert store.load("intruder") is None
+
+
+def test_expired_session_is_ignored(session_dir):
+    store = SessionStore("http://wish")
+    store.save("tester", {"token": "abc"}, time.time() - 1)
+    assert store.load("tester") is None
+
+
+def test_tampered_file_is_ignored(session_dir):
+    store = SessionStore("http://wish")
+    store.save("tester", {"token": "abc"})
+    with open(store.path, "r+b") as f:
+        f.seek(-1, os.SEEK_END)
+        last = f.read(1)
+        f.seek(-1, os.SEEK_END)
+        f.write(bytes([last[0] ^ 1]))
+    assert store.load("tester") is None
+
+
+def test_namespaces_use_separate_files(session_dir):
+    default, test = SessionStore("http://wish", "default"), SessionStore("http://wish", "test")
+    default.save("tester", {"token": "abc"})
+    assert default.path != test.path
+    assert test.load("tester") is None
+    default.clear()
+    assert default.load("tester") is None